@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Export the application history to Parquet and report on it month by month.
+
+Usage:
+    python scripts/history_report.py [--db data/applications.csv] [--export]
+                                     [--from 2025-09] [--to 2026-01]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure project root is on sys.path so `src` is importable
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.application_tracker import ApplicationTracker
+from src.tracker_reports import success_rate_by_domain, fill_rate_trend, failure_reasons
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Month-partitioned application history reports.")
+    parser.add_argument("--db", default="data/applications.csv", help="Tracker database")
+    parser.add_argument("--parquet", default="data/applications_parquet", help="Parquet dataset directory")
+    parser.add_argument("--export", action="store_true", help="Export the tracker to Parquet first")
+    parser.add_argument("--from", dest="start_month", help="First month to report (YYYY-MM)")
+    parser.add_argument("--to", dest="end_month", help="Last month to report (YYYY-MM)")
+    args = parser.parse_args()
+
+    if args.export or not Path(args.parquet).exists():
+        tracker = ApplicationTracker(db_path=args.db)
+        if tracker.df.empty:
+            print("No applications tracked yet.")
+            return 0
+        tracker.export_parquet(args.parquet)
+        tracker.close()
+        print(f"Exported {args.db} to {args.parquet}\n")
+
+    months = {'start_month': args.start_month, 'end_month': args.end_month}
+    with pd.option_context('display.max_columns', None, 'display.width', 200,
+                           'display.max_colwidth', 120, 'display.float_format', '{:,.2f}'.format):
+        print("SUCCESS RATE BY DOMAIN")
+        print(success_rate_by_domain(args.parquet, **months))
+        print("\nFILL RATE BY MONTH")
+        print(fill_rate_trend(args.parquet, **months))
+        print("\nTOP FAILURE REASONS")
+        print(failure_reasons(args.parquet, **months).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF text extraction: serial, streaming and process-pool modes.
+
+Generates multi-page fixture documents (or uses the PDFs you pass) and
+reports the time to the first page and to the whole document for each mode.
+
+Usage:
+    python scripts/pdf_benchmark.py [--pages 8 32 96] [--workers 4] [--runs 3] [file.pdf ...]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project root is on sys.path so `src` is importable
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.resume_parser import iter_pdf_pages, iter_pdf_pages_parallel, pdf_page_count
+from scripts.pdf_fixtures import write_text_pdf, resume_pages
+
+
+def time_mode(pages_iter, runs: int):
+    """Median seconds to the first page and to the last page."""
+    first, total = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        pages = pages_iter()
+        next(pages, None)
+        first.append(time.perf_counter() - start)
+        for _ in pages:
+            pass
+        total.append(time.perf_counter() - start)
+    return statistics.median(first), statistics.median(total)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF page extraction modes.")
+    parser.add_argument("pdfs", nargs="*", help="PDFs to benchmark (default: generated fixtures)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[8, 32, 96],
+                        help="Page counts of the generated fixtures")
+    parser.add_argument("--workers", type=int, default=4, help="Processes for the parallel mode")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode (median is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdfs = args.pdfs or [
+            write_text_pdf(Path(tmp_dir) / f"fixture_{count}.pdf", resume_pages(count))
+            for count in args.pages
+        ]
+
+        print(f"{'document':<28}{'pages':>6}  {'mode':<12}{'first page':>12}{'all pages':>12}{'pages/s':>10}")
+        for pdf in pdfs:
+            page_count = pdf_page_count(pdf)
+            modes = {
+                'serial': lambda: iter(list(iter_pdf_pages(pdf))),
+                'streaming': lambda: iter_pdf_pages(pdf),
+                f'parallel x{args.workers}': lambda: iter_pdf_pages_parallel(pdf, args.workers),
+            }
+            for mode, pages_iter in modes.items():
+                first, total = time_mode(pages_iter, args.runs)
+                print(f"{Path(pdf).name:<28}{page_count:>6}  {mode:<12}"
+                      f"{first * 1000:>10.1f}ms{total * 1000:>10.1f}ms{page_count / total:>10.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
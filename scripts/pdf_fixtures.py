@@ -0,0 +1,60 @@
+"""Generate text PDFs for the PDF benchmark (also used as test fixtures)."""
+
+from pathlib import Path
+from typing import List
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_text_pdf(path, pages: List[List[str]]) -> str:
+    """
+    Write a minimal PDF with one page per entry of `pages`, each a list of lines.
+
+    Uses the built-in Helvetica font, so PyPDF2 can extract the text back.
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for lines in pages:
+        commands = ["BT", "/F1 11 Tf", "14 TL", "72 720 Td"]
+        commands += [f"({_escape(line)}) Tj T*" for line in lines]
+        commands.append("ET")
+        stream = "\n".join(commands).encode('latin-1')
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    Path(path).write_bytes(bytes(out))
+    return str(path)
+
+
+def resume_pages(count: int, lines_per_page: int = 40) -> List[List[str]]:
+    """Text for a `count`-page document that reads like a resume or transcript."""
+    headers = ["Education", "Experience", "Technical Skills", "Projects"]
+    pages = []
+    for page in range(count):
+        lines = [headers[page % len(headers)]]
+        lines += [f"Page {page + 1} item {i}: built and shipped feature {i} using Python and SQL"
+                  for i in range(lines_per_page - 1)]
+        pages.append(lines)
+    return pages
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Print p50/p95 performance metrics per ATS domain from the application tracker.
+
+Usage:
+    python scripts/perf_report.py [--db data/applications.csv] [--metrics fill_ms navigate_ms]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure project root is on sys.path so `src` is importable
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.application_tracker import ApplicationTracker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-domain performance report.")
+    parser.add_argument("--db", default="data/applications.csv", help="Tracker database")
+    parser.add_argument("--metrics", nargs="+", choices=ApplicationTracker.PERFORMANCE_COLUMNS,
+                        help="Metrics to report (default: all)")
+    parser.add_argument("--output", help="Optionally save the report as CSV")
+    args = parser.parse_args()
+
+    tracker = ApplicationTracker(db_path=args.db)
+    report = tracker.get_performance_report(args.metrics)
+    if report.empty:
+        print("No applications tracked yet.")
+        return 0
+
+    with pd.option_context('display.max_columns', None, 'display.width', 200,
+                           'display.float_format', '{:,.1f}'.format):
+        print(report)
+
+    if args.output:
+        report.to_csv(args.output)
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
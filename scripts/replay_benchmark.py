@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark over a recorded corpus of application forms.
+
+Each corpus entry is a directory written by `InternshipApplicationBot(record_dir=...)`
+containing `archive.har`, `dom.html` and `meta.json`. Pages are served from the
+HAR archive with all network access blocked, so runs are deterministic and work
+on air-gapped machines and in CI.
+
+Detection, classification, filling and agent time are reported separately,
+as FormFiller measures them (settle waits between rounds are not counted).
+
+Usage:
+    python scripts/replay_benchmark.py data/corpus [--profile data/user_profile.json] [--runs 3]
+        [--agent] [--watch]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is on sys.path so `src` is importable
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.browser_automation import BrowserAutomation
+from src.form_filler import FormFiller
+from src.profile_manager import ProfileManager
+
+
+def load_corpus(corpus_dir: Path):
+    """Return the metadata of every recorded application in the corpus."""
+    entries = []
+    for meta_path in sorted(corpus_dir.glob("*/meta.json")):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        meta['dir'] = meta_path.parent
+        entries.append(meta)
+    return entries
+
+
+async def bench_entry(entry, profile_manager, runs: int, agent=None, watch: bool = False):
+    """Replay one recorded application `runs` times and time each phase."""
+    timings = {'navigate': [], 'detect': [], 'classify': [], 'fill': [], 'agent': []}
+    fields = 0
+    filled = 0
+
+    browser = BrowserAutomation(headless=True, slow_mo=0,
+                                replay_har=str(entry['dir'] / entry['har']))
+    await browser.start()
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            await browser.navigate(entry['url'])
+            timings['navigate'].append((time.perf_counter() - start) * 1000)
+
+            filler = FormFiller(browser.page, profile_manager.profile, agent=agent,
+                                snapshot=profile_manager.snapshot())
+            results = await filler.auto_fill_form(interactive=False, watch=watch)
+            for phase, ms in results['timings'].items():
+                timings[phase].append(ms)
+
+            fields = results['total_fields']
+            filled = results['filled_count']
+    finally:
+        await browser.close()
+
+    return {
+        'application_id': entry.get('application_id'),
+        'company': entry.get('company'),
+        'fields': fields,
+        'filled': filled,
+        **{f"{phase}_ms": statistics.median(values) for phase, values in timings.items()}
+    }
+
+
+async def run_benchmark(corpus_dir: Path, profile_path: str, runs: int, output: str = None,
+                        use_agent: bool = False, watch: bool = False):
+    entries = load_corpus(corpus_dir)
+    if not entries:
+        print(f"❌ No recordings found in {corpus_dir}")
+        return 1
+
+    profile_manager = ProfileManager(profile_path)
+    agent = None
+    if use_agent:
+        try:
+            from src.agent import ApplicationAgent
+        except Exception as e:
+            print(f"❌ Agent module not available: {e}")
+            return 1
+        agent = ApplicationAgent(profile_manager)
+
+    results = []
+    for entry in entries:
+        print(f"▶ {entry.get('company')} ({entry.get('application_id')})")
+        try:
+            results.append(await bench_entry(entry, profile_manager, runs, agent=agent, watch=watch))
+        except Exception as e:
+            print(f"  ✗ Replay failed: {e}")
+            results.append({'application_id': entry.get('application_id'), 'error': str(e)})
+
+    print(f"\n{'=' * 98}")
+    print(f"{'Application':<36}{'Fields':>8}{'Filled':>8}{'Nav ms':>9}{'Detect ms':>10}"
+          f"{'Classify ms':>12}{'Fill ms':>9}{'Agent ms':>10}")
+    print(f"{'=' * 98}")
+    for r in results:
+        if 'error' in r:
+            print(f"{str(r['application_id'])[:35]:<36}  ERROR: {r['error'][:56]}")
+            continue
+        print(f"{str(r['application_id'])[:35]:<36}{r['fields']:>8}{r['filled']:>8}"
+              f"{r['navigate_ms']:>9.0f}{r['detect_ms']:>10.0f}{r['classify_ms']:>12.0f}"
+              f"{r['fill_ms']:>9.0f}{r['agent_ms']:>10.0f}")
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {output}")
+
+    return 0 if all('error' not in r for r in results) else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded application forms offline and time them.")
+    parser.add_argument("corpus", help="Directory of recordings (one sub-directory per application)")
+    parser.add_argument("--profile", default="data/user_profile.json", help="Profile used to fill forms")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per recording (median is reported)")
+    parser.add_argument("--output", help="Optional JSON file for the raw results")
+    parser.add_argument("--agent", action="store_true",
+                        help="Answer open-ended questions with the agent and time it")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep filling fields that appear after the first pass (as the bot does)")
+    args = parser.parse_args()
+
+    return asyncio.run(run_benchmark(Path(args.corpus), args.profile, args.runs, args.output,
+                                     use_agent=args.agent, watch=args.watch))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,16 +1,97 @@
-from playwright.async_api import Page
+from playwright.async_api import Page, ElementHandle
 from typing import Dict, Any, Optional
 import re
 import secrets
 import string
 
+from .button_ranker import click_best_button, rank_buttons
+from .page_classifier import DEEP_QUERY_JS, PageClassifier
+from .profile_snapshot import ProfileSnapshot
+
+# Classify every <input> of a signup form in the page (the same rules
+# create_account applied one attribute read at a time): the last email,
+# username and name matches win, password fields are numbered in order.
+# Returns an object of element handles; fields that were not found are absent.
+_SIGNUP_FIELDS_JS = '''() => {''' + DEEP_QUERY_JS + '''
+    const fields = {};
+    let passwords = 0;
+    for (const el of deepQueryAll(document, 'input')) {
+        const type = el.getAttribute('type');
+        const combined = ['name', 'id', 'placeholder']
+            .map(attr => (el.getAttribute(attr) || '').toLowerCase()).join(' ');
+        if (type === 'email' || combined.includes('email')) fields.email = el;
+        else if (combined.includes('username') || combined.includes('userid')) fields.username = el;
+        else if (type === 'password') fields['password_' + (++passwords)] = el;
+        else if (combined.includes('first') && combined.includes('name')) fields.first_name = el;
+        else if (combined.includes('last') && combined.includes('name')) fields.last_name = el;
+    }
+    return fields;
+}'''
+
+# First email, username and password input of a login form.
+_LOGIN_FIELDS_JS = '''() => {''' + DEEP_QUERY_JS + '''
+    const selectors = {
+        email: 'input[type="email"]',
+        username: 'input[name*="username"]',
+        password: 'input[type="password"]'
+    };
+    const fields = {};
+    for (const [key, selector] of Object.entries(selectors)) {
+        const [el] = deepQueryAll(document, selector);
+        if (el) fields[key] = el;
+    }
+    return fields;
+}'''
+
 
 class AccountCreator:
     """Handles automatic account creation for application portals."""
 
-    def __init__(self, page: Page, profile: Dict[str, Any]):
+    def __init__(self, page: Page, profile: Dict[str, Any], snapshot: Optional[ProfileSnapshot] = None,
+                 classifier: Optional[PageClassifier] = None):
+        """
+        Args:
+            page: Page to create accounts or log in on
+            profile: Mutable profile; new credentials are stored in it
+            snapshot: Compiled profile to read personal info from
+                (defaults to compiling `profile`)
+            classifier: Page classifier to share with the bot
+                (see BrowserAutomation.classifier)
+        """
         self.page = page
         self.profile = profile
+        self.snapshot = snapshot or ProfileSnapshot.build(profile)
+        self.classifier = classifier or PageClassifier(page)
+
+    async def _classify_fields(self, script: str) -> Dict[str, ElementHandle]:
+        """
+        Run a field-classifying script in the page.
+
+        Returns:
+            Field name -> element handle, for the fields the script found
+        """
+        result = await self.page.evaluate_handle(script)
+        try:
+            properties = await result.get_properties()
+        finally:
+            await result.dispose()
+        fields = {}
+        for key, handle in properties.items():
+            element = handle.as_element()
+            if element is not None:
+                fields[key] = element
+            else:
+                await handle.dispose()
+        return fields
+
+    @staticmethod
+    async def _release(fields: Dict[str, ElementHandle]):
+        """Dispose the element handles of classified fields once they are filled."""
+        for element in fields.values():
+            try:
+                await element.dispose()
+            except Exception:
+                pass  # the page navigated or closed; the handles are gone already
 
     async def detect_account_creation_page(self) -> bool:
         """
@@ -20,47 +101,7 @@ class AccountCreator:
             True if on signup page, False otherwise
         """
         try:
-            # Get page content
-            page_text = await self.page.inner_text('body')
-            page_text_lower = page_text.lower()
-
-            # Get URL
-            url = self.page.url.lower()
-
-            # Check for signup indicators
-            signup_keywords = [
-                'create account',
-                'sign up',
-                'register',
-                'new user',
-                'create profile',
-                'get started',
-                'join us',
-                'registration'
-            ]
-
-            url_indicators = ['signup', 'register', 'create-account', 'join']
-
-            # Check URL
-            for indicator in url_indicators:
-                if indicator in url:
-                    return True
-
-            # Check page content
-            for keyword in signup_keywords:
-                if keyword in page_text_lower:
-                    # Additional confirmation - look for password fields
-                    password_fields = await self.page.query_selector_all('input[type="password"]')
-                    if len(password_fields) >= 2:  # Likely has "password" and "confirm password"
-                        return True
-                    if len(password_fields) >= 1:
-                        # Check for username/email field
-                        has_email = await self.page.query_selector('input[type="email"]')
-                        has_username = await self.page.query_selector('input[name*="username"]')
-                        if has_email or has_username:
-                            return True
-
-            return False
+            return (await self.classifier.classify())['is_signup']
         except Exception as e:
             print(f"Error detecting account creation page: {e}")
             return False
@@ -73,28 +114,7 @@ class AccountCreator:
             True if on login page, False otherwise
         """
         try:
-            page_text = await self.page.inner_text('body')
-            page_text_lower = page_text.lower()
-            url = self.page.url.lower()
-
-            # Check for login indicators
-            login_keywords = ['log in', 'login', 'sign in', 'signin']
-            url_indicators = ['login', 'signin', 'auth']
-
-            # Check URL
-            for indicator in url_indicators:
-                if indicator in url:
-                    return True
-
-            # Check page content
-            for keyword in login_keywords:
-                if keyword in page_text_lower:
-                    # Confirm with password field
-                    password_fields = await self.page.query_selector_all('input[type="password"]')
-                    if len(password_fields) >= 1:
-                        return True
-
-            return False
+            return (await self.classifier.classify())['is_login']
         except Exception as e:
             print(f"Error detecting login page: {e}")
             return False
@@ -106,8 +126,8 @@ class AccountCreator:
         Returns:
             Generated username
         """
-        first_name = self.profile.get('personal_info', {}).get('first_name', 'user')
-        last_name = self.profile.get('personal_info', {}).get('last_name', '')
+        first_name = self.snapshot.field_values['first_name'] or 'user'
+        last_name = self.snapshot.field_values['last_name'] or ''
 
         # Create base username
         base = f"{first_name.lower()}{last_name.lower()}"
@@ -154,47 +174,21 @@ class AccountCreator:
         Returns:
             Dictionary with username, password, and success status
         """
+        fields: Dict[str, ElementHandle] = {}
         try:
             print("\n🔐 Detecting account creation form...")
 
-            # Get all input fields
-            inputs = await self.page.query_selector_all('input')
-
-            # Find relevant fields
-            email_field = None
-            username_field = None
-            password_fields = []
-            first_name_field = None
-            last_name_field = None
-
-            for input_elem in inputs:
-                input_type = await input_elem.get_attribute('type')
-                input_name = (await input_elem.get_attribute('name') or '').lower()
-                input_id = (await input_elem.get_attribute('id') or '').lower()
-                placeholder = (await input_elem.get_attribute('placeholder') or '').lower()
-
-                combined = f"{input_name} {input_id} {placeholder}"
-
-                # Detect email field
-                if input_type == 'email' or 'email' in combined:
-                    email_field = input_elem
-
-                # Detect username field
-                elif 'username' in combined or 'userid' in combined:
-                    username_field = input_elem
-
-                # Detect password fields
-                elif input_type == 'password':
-                    password_fields.append(input_elem)
-
-                # Detect name fields
-                elif 'first' in combined and 'name' in combined:
-                    first_name_field = input_elem
-                elif 'last' in combined and 'name' in combined:
-                    last_name_field = input_elem
+            # Classify all input fields in one round trip
+            fields = await self._classify_fields(_SIGNUP_FIELDS_JS)
+            email_field = fields.get('email')
+            username_field = fields.get('username')
+            password_fields = [fields[f'password_{i}']
+                               for i in range(1, len(fields) + 1) if f'password_{i}' in fields]
+            first_name_field = fields.get('first_name')
+            last_name_field = fields.get('last_name')
 
             # Generate credentials
-            email = self.profile.get('personal_info', {}).get('email', '')
+            email = self.snapshot.field_values['email'] or ''
             username = self.generate_username()
             password = self.generate_password()
 
@@ -226,14 +220,14 @@ class AccountCreator:
 
             # Fill name fields
             if first_name_field:
-                first_name = self.profile.get('personal_info', {}).get('first_name', '')
+                first_name = self.snapshot.field_values['first_name']
                 if first_name:
                     await first_name_field.fill(first_name)
                     filled_fields.append('first_name')
                     print(f"  ✓ Filled first name field")
 
             if last_name_field:
-                last_name = self.profile.get('personal_info', {}).get('last_name', '')
+                last_name = self.snapshot.field_values['last_name']
                 if last_name:
                     await last_name_field.fill(last_name)
                     filled_fields.append('last_name')
@@ -268,29 +262,39 @@ class AccountCreator:
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            await self._release(fields)
 
     async def find_create_account_button(self) -> Optional[Any]:
-        """Find and click the 'Create Account' button."""
-        create_account_selectors = [
-            'button:has-text("Create Account")',
-            'button:has-text("Sign Up")',
-            'button:has-text("Register")',
-            'button:has-text("Submit")',
-            'input[type="submit"]',
-            'button[type="submit"]',
-            'a:has-text("Create Account")',
-            '[role="button"]:has-text("Sign Up")'
-        ]
-
-        for selector in create_account_selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    return element
-            except:
-                continue
+        """
+        Find the best-ranked 'Create Account' button (see button_ranker.rank_buttons).
 
-        return None
+        To click it, use click_create_account_button, which falls back to the
+        next candidates if the click fails.
+        """
+        try:
+            ranked = await rank_buttons(self.page, 'create_account', limit=1)
+        except Exception as e:
+            print(f"Error finding create account button: {e}")
+            return None
+        return ranked[0]['element'] if ranked else None
+
+    async def click_create_account_button(self, timeout: int = 5000) -> Optional[Dict[str, Any]]:
+        """
+        Click the best-ranked 'Create Account' button, falling back along the
+        ranking when a click fails (see button_ranker.click_best_button).
+
+        Returns:
+            The clicked candidate, or None if no button could be clicked
+        """
+        try:
+            clicked = await click_best_button(self.page, 'create_account', timeout=timeout)
+        except Exception as e:
+            print(f"Error clicking create account button: {e}")
+            return None
+        if clicked:
+            print(f"  ✓ Clicked '{clicked['text'] or clicked['tag']}' (score {clicked['score']})")
+        return clicked
 
     async def login_with_credentials(self, domain: str) -> Dict[str, Any]:
         """
@@ -302,6 +306,7 @@ class AccountCreator:
         Returns:
             Dictionary with login status
         """
+        fields: Dict[str, ElementHandle] = {}
         try:
             credentials = self.profile.get('credentials', {}).get(domain)
 
@@ -314,9 +319,10 @@ class AccountCreator:
             print(f"\n🔐 Logging in with stored credentials...")
 
             # Find login fields
-            email_field = await self.page.query_selector('input[type="email"]')
-            username_field = await self.page.query_selector('input[name*="username"]')
-            password_field = await self.page.query_selector('input[type="password"]')
+            fields = await self._classify_fields(_LOGIN_FIELDS_JS)
+            email_field = fields.get('email')
+            username_field = fields.get('username')
+            password_field = fields.get('password')
 
             # Fill email or username
             if email_field:
@@ -343,3 +349,5 @@ class AccountCreator:
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            await self._release(fields)
@@ -6,14 +6,20 @@ from .llm_client import LLMClient
 class ApplicationAgent:
     """Agent that uses a local TensorFlow model to answer application questions."""
 
-    def __init__(self, profile: Dict[str, Any]):
+    def __init__(self, profile: Any):
+        """
+        Args:
+            profile: Profile dict, ProfileSnapshot, or a ProfileManager (its
+                latest snapshot is used for every question)
+        """
         self.profile = profile
         self.llm = LLMClient(provider="tensorflow")
 
     async def answer_question(self, question: str) -> Dict[str, Any]:
         """Return a dict with an `answer` key using the local model."""
-        
-        resp = await self.llm.generate(profile=self.profile, question=question)
+        profile = self.profile.snapshot() if hasattr(self.profile, 'snapshot') else self.profile
+
+        resp = await self.llm.generate(profile=profile, question=question)
 
         # Normalize response into a consistent dict
         result: Dict[str, Any] = {
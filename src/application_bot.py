@@ -1,9 +1,13 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from pathlib import Path
 from .browser_automation import BrowserAutomation
+from .button_ranker import click_best_button
 from .form_filler import FormFiller
 from .application_tracker import ApplicationTracker
 from .profile_manager import ProfileManager
 import asyncio
+import json
+import time
 
 # Optional agent import is only used when opt-in
 try:
@@ -12,11 +16,23 @@ except Exception:
     ApplicationAgent = None
 
 
+def skipped_result(application_id: Optional[str]) -> Dict[str, Any]:
+    """Result entry for a job skipped because the posting was already applied to."""
+    return {
+        'success': False,
+        'skipped': True,
+        'application_id': application_id,
+        'error': 'Already applied to this posting'
+    }
+
+
 class InternshipApplicationBot:
     """Main bot orchestrator for automated internship applications."""
 
     def __init__(self, profile_manager: ProfileManager, headless: bool = False,
-                 use_agent: bool = False):
+                 use_agent: bool = False, record_dir: Optional[str] = None,
+                 recycle_after: int = 50, max_rss_mb: Optional[float] = 2048,
+                 tracker: Optional[ApplicationTracker] = None, interactive: bool = True):
         """
         
         Initialize the application bot.
@@ -24,17 +40,36 @@ class InternshipApplicationBot:
         Args:
             profile_manager: User profile manager with all personal info
             headless: Run browser in headless mode
+            record_dir: If set, record each application (HAR + final DOM) into
+                a replay corpus under this directory
+            recycle_after: Relaunch the browser after this many applications (0 disables)
+            max_rss_mb: Relaunch the browser once its memory exceeds this (None disables)
+            tracker: Tracker to record applications in (shared between bots in one process)
+            interactive: Ask on the terminal for yes/no questions while filling
         """
         self.profile_manager = profile_manager
         self.browser = BrowserAutomation(headless=headless, slow_mo=100)
-        self.tracker = ApplicationTracker()
+        self.record_dir = Path(record_dir) if record_dir else None
+        self.recycle_after = recycle_after
+        self.max_rss_mb = max_rss_mb
+        self.applications_since_launch = 0
+        # Our own tracker buffers writes so the event loop never waits on disk
+        self._owns_tracker = tracker is None
+        self.tracker = tracker or ApplicationTracker(write_behind=True)
+        self.interactive = interactive
         self.current_application_id = None
         # Create agent if requested
         self.agent = None
         if use_agent:
             if ApplicationAgent is None:
                 raise RuntimeError("Agent module not available. Make sure src/agent.py is present and imports succeed.")
-            self.agent = ApplicationAgent(self.profile_manager.profile)
+            self.agent = ApplicationAgent(self.profile_manager)
+
+    def use_profile(self, profile_manager: ProfileManager):
+        """Apply as another candidate from now on (keeps the browser running)."""
+        self.profile_manager = profile_manager
+        if self.agent is not None:
+            self.agent.profile = profile_manager
 
     async def start(self):
         """Start the bot and browser."""
@@ -42,7 +77,32 @@ class InternshipApplicationBot:
 
     async def close(self):
         """Close the bot and browser."""
-        await self.browser.close()
+        try:
+            await self.browser.close()
+        finally:
+            if self._owns_tracker:
+                self.tracker.close()
+
+    def _browser_rss_mb(self) -> Optional[float]:
+        rss = self.browser.get_rss_bytes()
+        return round(rss / (1024 * 1024), 1) if rss is not None else None
+
+    async def _ensure_browser(self):
+        """Relaunch the browser if it crashed or is due for recycling."""
+        reason = None
+        if not self.browser.is_healthy():
+            reason = "browser crashed or disconnected"
+        elif self.recycle_after and self.applications_since_launch >= self.recycle_after:
+            reason = f"{self.applications_since_launch} applications since launch"
+        elif self.max_rss_mb:
+            rss_mb = self._browser_rss_mb()
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                reason = f"memory at {rss_mb} MB"
+
+        if reason:
+            print(f"♻ Relaunching browser ({reason})...")
+            await self.browser.restart()
+            self.applications_since_launch = 0
 
     async def apply_to_job(self, company: str, position: str, url: str,
                           submit: bool = False) -> Dict[str, Any]:
@@ -71,56 +131,25 @@ class InternshipApplicationBot:
             status='in_progress'
         )
 
+        recording_dir = self.record_dir / self.current_application_id if self.record_dir else None
+
         try:
-            # Navigate to application page
-            print("Navigating to application page...")
-            await self.browser.navigate(url)
-            await self.browser.wait(2000)  # Wait for page to load
-
-            # Take screenshot of initial page
-            screenshot_path = f"data/screenshots/{self.current_application_id}_initial.png"
-            await self.browser.screenshot(screenshot_path)
-            print(f"Screenshot saved: {screenshot_path}")
-
-            # Auto-fill form
-            print("\nDetecting and filling form fields...")
-            form_filler = FormFiller(self.browser.page, self.profile_manager.profile, agent=self.agent)
-            fill_results = await form_filler.auto_fill_form()
-
-            print(f"\nForm filling results:")
-            print(f"  Total fields: {fill_results['total_fields']}")
-            print(f"  Filled: {fill_results['filled_count']}")
-            print(f"  Unfilled: {fill_results['unfilled_count']}")
-
-            if fill_results['filled_fields']:
-                print(f"\n  Filled fields: {', '.join(fill_results['filled_fields'][:10])}")
-
-            if fill_results['unfilled_fields']:
-                print(f"\n  Unfilled fields:")
-                for field in fill_results['unfilled_fields'][:5]:
-                    required = " (REQUIRED)" if field.get('required') else ""
-                    print(f"    - {field['purpose']}{required}")
-
-            # Take screenshot after filling
-            screenshot_path = f"data/screenshots/{self.current_application_id}_filled.png"
-            await self.browser.screenshot(screenshot_path)
-            print(f"\nScreenshot saved: {screenshot_path}")
-
-            # Update tracker with fill results
-            self.tracker.update_application(
-                self.current_application_id,
-                filled_fields=fill_results['filled_count'],
-                unfilled_fields=fill_results['unfilled_count']
-            )
+            await self._ensure_browser()
+            self.applications_since_launch += 1
+
+            if recording_dir:
+                await self.browser.start_recording(str(recording_dir / "archive.har"))
 
-            # Submit if requested
-            if submit:
-                await self._submit_application()
-                self.tracker.mark_submitted(self.current_application_id)
-                print("\n✓ Application submitted successfully!")
-            else:
-                print("\n⚠ Preview mode - application NOT submitted")
-                print("Set submit=True to actually submit the application")
+            try:
+                fill_results = await self._process_application(url, submit)
+            except Exception:
+                if self.browser.is_healthy():
+                    raise
+                # The page or browser died under us - relaunch and retry this job once
+                print("\n⚠ Browser crashed - relaunching and retrying once...")
+                await self.browser.restart()
+                self.applications_since_launch = 1
+                fill_results = await self._process_application(url, submit)
 
             return {
                 'success': True,
@@ -141,7 +170,8 @@ class InternshipApplicationBot:
                 pass
 
             # Mark as failed in tracker
-            self.tracker.mark_failed(self.current_application_id, error_msg)
+            self.tracker.mark_failed(self.current_application_id, error_msg,
+                                     browser_rss_mb=self._browser_rss_mb())
 
             return {
                 'success': False,
@@ -149,34 +179,122 @@ class InternshipApplicationBot:
                 'error': error_msg
             }
 
-    async def _submit_application(self):
-        """Find and click the submit button."""
-        # Common submit button selectors
-        submit_selectors = [
-            'button[type="submit"]',
-            'input[type="submit"]',
-            'button:has-text("Submit")',
-            'button:has-text("Apply")',
-            'button:has-text("Send")',
-            'a:has-text("Submit")',
-            '[role="button"]:has-text("Submit")'
-        ]
-
-        for selector in submit_selectors:
-            try:
-                element = await self.browser.page.query_selector(selector)
-                if element:
-                    print(f"Found submit button: {selector}")
-                    await element.click()
-                    await self.browser.wait(3000)  # Wait for submission
-                    return
-            except:
-                continue
+        finally:
+            if recording_dir:
+                await self._finish_recording(recording_dir, company, position, url)
+
+    async def _finish_recording(self, recording_dir: Path, company: str,
+                                position: str, url: str):
+        """Flush the HAR archive and save the final DOM plus metadata for replay."""
+        try:
+            await self.browser.stop_recording(str(recording_dir / "dom.html"))
+            with open(recording_dir / "meta.json", 'w') as f:
+                json.dump({
+                    'application_id': self.current_application_id,
+                    'company': company,
+                    'position': position,
+                    'url': url,
+                    'har': "archive.har",
+                    'dom': "dom.html"
+                }, f, indent=2)
+            print(f"Recording saved: {recording_dir}")
+        except Exception as e:
+            print(f"Warning: Could not save recording: {e}")
+
+    async def _process_application(self, url: str, submit: bool) -> Dict[str, Any]:
+        """Navigate, fill and optionally submit the current application."""
+        timings: Dict[str, float] = {}
+
+        # Navigate to application page
+        print("Navigating to application page...")
+        start = time.perf_counter()
+        await self.browser.navigate(url)
+        timings['navigate_ms'] = (time.perf_counter() - start) * 1000
+        await self.browser.wait(2000)  # Wait for page to load
+
+        # Nothing to fill on a closed posting or a bot check
+        page_info = await self.browser.classifier.classify()
+        print(f"Page type: {page_info['type']}")
+        if page_info['type'] == 'closed':
+            raise Exception("Job posting is closed")
+        if page_info['type'] == 'blocked':
+            raise Exception("Blocked by a CAPTCHA or bot check")
+        if page_info['type'] in ('login', 'signup'):
+            print(f"⚠ This is a {page_info['type']} page - an account may be needed before applying")
+
+        # Take screenshot of initial page
+        screenshot_path = f"data/screenshots/{self.current_application_id}_initial.png"
+        start = time.perf_counter()
+        await self.browser.screenshot(screenshot_path)
+        timings['screenshot_ms'] = (time.perf_counter() - start) * 1000
+        print(f"Screenshot saved: {screenshot_path}")
+
+        # Auto-fill form
+        print("\nDetecting and filling form fields...")
+        form_filler = FormFiller(self.browser.page, self.profile_manager.profile, agent=self.agent,
+                                 snapshot=self.profile_manager.snapshot())
+        fill_results = await form_filler.auto_fill_form(interactive=self.interactive)
+        fill_results['page_type'] = page_info['type']
+        for phase, ms in fill_results['timings'].items():
+            timings[f'{phase}_ms'] = ms
+
+        print(f"\nForm filling results:")
+        print(f"  Total fields: {fill_results['total_fields']}")
+        print(f"  Filled: {fill_results['filled_count']}")
+        print(f"  Unfilled: {fill_results['unfilled_count']}")
+
+        if fill_results['filled_fields']:
+            print(f"\n  Filled fields: {', '.join(fill_results['filled_fields'][:10])}")
+
+        if fill_results['unfilled_fields']:
+            print(f"\n  Unfilled fields:")
+            for field in fill_results['unfilled_fields'][:5]:
+                required = " (REQUIRED)" if field.get('required') else ""
+                print(f"    - {field['purpose']}{required}")
+
+        # Take screenshot after filling
+        screenshot_path = f"data/screenshots/{self.current_application_id}_filled.png"
+        start = time.perf_counter()
+        await self.browser.screenshot(screenshot_path)
+        timings['screenshot_ms'] += (time.perf_counter() - start) * 1000
+        print(f"\nScreenshot saved: {screenshot_path}")
+
+        # Update tracker with fill results and performance metrics
+        page_metrics = await self.browser.get_page_metrics()
+        self.tracker.update_application(
+            self.current_application_id,
+            filled_fields=fill_results['filled_count'],
+            unfilled_fields=fill_results['unfilled_count'],
+            browser_rss_mb=self._browser_rss_mb(),
+            **timings,
+            **page_metrics
+        )
 
-        raise Exception("Could not find submit button")
+        # Submit if requested
+        if submit:
+            start = time.perf_counter()
+            await self._submit_application()
+            submit_ms = (time.perf_counter() - start) * 1000
+            self.tracker.mark_submitted(self.current_application_id, submit_ms=submit_ms)
+            print("\n✓ Application submitted successfully!")
+        else:
+            self.tracker.mark_previewed(self.current_application_id)
+            print("\n⚠ Preview mode - application NOT submitted")
+            print("Set submit=True to actually submit the application")
+
+        return fill_results
+
+    async def _submit_application(self):
+        """Click the best-ranked submit button, falling back to the next ones if a click fails."""
+        clicked = await click_best_button(self.browser.page, 'submit')
+        if clicked is None:
+            raise Exception("Could not find submit button")
+        print(f"Clicked submit button: '{clicked['text'] or clicked['tag']}' (score {clicked['score']})")
+        await self.browser.wait(3000)  # Wait for submission
 
     async def apply_to_multiple_jobs(self, job_list: List[Dict[str, str]],
-                                     submit: bool = False, delay: int = 5000):
+                                     submit: bool = False, delay: int = 5000,
+                                     skip_duplicates: bool = True):
         """
         Apply to multiple jobs in sequence.
 
@@ -184,12 +302,25 @@ class InternshipApplicationBot:
             job_list: List of dicts with 'company', 'position', 'url' keys
             submit: Whether to actually submit applications
             delay: Delay between applications in milliseconds
+            skip_duplicates: Skip postings already submitted or in progress
+                (matched by canonical URL, see canonical_job_url); previewed
+                postings are not skipped
         """
         results = []
 
         for i, job in enumerate(job_list):
             print(f"\n\nProcessing job {i+1}/{len(job_list)}...")
 
+            existing_id = None
+            if skip_duplicates:
+                # Another bot process may have applied to this posting in the meantime
+                self.tracker.refresh()
+                existing_id = self.tracker.find_existing_application(job['url'])
+            if existing_id:
+                print(f"⏭ Skipping {job['position']} at {job['company']} - already applied ({existing_id})")
+                results.append(skipped_result(existing_id))
+                continue
+
             result = await self.apply_to_job(
                 company=job['company'],
                 position=job['position'],
@@ -208,9 +339,11 @@ class InternshipApplicationBot:
         print("BATCH APPLICATION SUMMARY")
         print(f"{'='*60}")
         successful = sum(1 for r in results if r['success'])
+        skipped = sum(1 for r in results if r.get('skipped'))
         print(f"Total jobs: {len(job_list)}")
         print(f"Successful: {successful}")
-        print(f"Failed: {len(job_list) - successful}")
+        print(f"Skipped (already applied): {skipped}")
+        print(f"Failed: {len(job_list) - successful - skipped}")
         print(f"{'='*60}\n")
 
         return results
@@ -1,44 +1,510 @@
 import pandas as pd
+import atexit
+import bisect
+import os
+import signal
+import sys
+import threading
+import time
+import weakref
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, Optional, List, Tuple, Set
+from collections import Counter
+from contextlib import contextmanager
+from urllib.parse import urlparse, parse_qsl, urlencode
+from .tracker_backends import Mutation, create_backend, read_csv_rows, clean_value
+from .trigram_index import TrigramIndex
+
+# Hosted ATS platforms give every employer its own subdomain; group them by platform
+ATS_DOMAINS = [
+    'greenhouse.io',
+    'lever.co',
+    'myworkdayjobs.com',
+    'ashbyhq.com',
+    'smartrecruiters.com',
+    'icims.com',
+    'jobvite.com',
+    'taleo.net',
+]
+
+
+def ats_domain(url: str) -> str:
+    """Reduce a job URL to the domain used for per-portal reporting."""
+    host = urlparse(str(url)).netloc.lower().split(':')[0]
+    for domain in ATS_DOMAINS:
+        if host == domain or host.endswith('.' + domain):
+            return domain
+    return host[4:] if host.startswith('www.') else host
+
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', '_hsenc', '_hsmi',
+    'ref', 'referrer', 'source', 'src', 'trk', 'trackingid', 'refid',
+    'gh_src', 'lever-source', 'lever-origin', 'lever-via', 'iis', 'iisn',
+    'jobboard', 'codes', 'ccuid',
+}
+
+_LEVER_JOB = re.compile(r'^/([^/]+)/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})', re.I)
+_GREENHOUSE_JOB = re.compile(r'/jobs/(\d+)')
+# .../job/<location>/<title>_<req id> or .../details/<title>_<req id>
+_WORKDAY_JOB = re.compile(r'/(?:job/[^/]+|details)/[^/]*_([A-Za-z0-9-]+)(?:/|$)')
+
+
+def canonical_job_url(url: str) -> str:
+    """
+    Reduce a job posting URL to a key that is equal for the same posting.
+
+    Greenhouse, Lever and Workday postings map to their ATS job id
+    (e.g. `greenhouse:4012345`, `lever:<uuid>`, `workday:<tenant>:<req id>`),
+    so board, embed and apply-page URLs of one job all agree. Other URLs are
+    normalized: lower-case host without www., no scheme, port, fragment,
+    trailing slash or tracking parameters, and sorted query parameters.
+    """
+    parsed = urlparse(str(url).strip())
+    host = parsed.netloc.lower().split('@')[-1].split(':')[0]
+    host = host[4:] if host.startswith('www.') else host
+    path = re.sub(r'/+', '/', parsed.path or '/')
+    params = {k.lower(): v for k, v in parse_qsl(parsed.query, keep_blank_values=True)}
+
+    # Greenhouse job ids are global, whether on the board, the embed or a company site
+    if params.get('gh_jid', '').isdigit():
+        return f"greenhouse:{params['gh_jid']}"
+    if host == 'greenhouse.io' or host.endswith('.greenhouse.io'):
+        match = _GREENHOUSE_JOB.search(path)
+        if match:
+            return f"greenhouse:{match.group(1)}"
+        if params.get('token', '').isdigit():
+            return f"greenhouse:{params['token']}"
+
+    if host == 'lever.co' or host.endswith('.lever.co'):
+        match = _LEVER_JOB.match(path)
+        if match:
+            return f"lever:{match.group(2).lower()}"
+
+    if host.endswith('.myworkdayjobs.com') or host.endswith('.myworkdaysite.com'):
+        match = _WORKDAY_JOB.search(path)
+        if match:
+            if host.endswith('.myworkdayjobs.com'):
+                tenant = host.split('.')[0]
+            else:
+                # myworkdaysite.com/recruiting/<tenant>/<site>/job/...
+                parts = path.strip('/').split('/')
+                tenant = parts[1] if len(parts) > 1 and parts[0] == 'recruiting' else host
+            return f"workday:{tenant}:{match.group(1).upper()}"
+
+    query = urlencode(sorted(
+        (k, v) for k, v in params.items()
+        if k not in TRACKING_PARAMS and not k.startswith('utm_')
+    ))
+    path = path.rstrip('/') or '/'
+    return f"{host}{path}" + (f"?{query}" if query else '')
+
+
+_CROCKFORD = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+_ulid_lock = threading.Lock()
+_last_ulid = (0, 0)
+
+
+def new_ulid() -> str:
+    """
+    A ULID: 48-bit millisecond timestamp plus 80 random bits, Crockford base32.
+
+    IDs sort by creation time, and IDs made in the same millisecond by this
+    process increase monotonically. Random bits keep IDs from different
+    processes apart.
+    """
+    global _last_ulid
+    with _ulid_lock:
+        millis = int(time.time() * 1000)
+        last_millis, last_random = _last_ulid
+        if millis <= last_millis:
+            millis, random_part = last_millis, last_random + 1
+        else:
+            random_part = int.from_bytes(os.urandom(10), 'big')
+        _last_ulid = (millis, random_part)
+    value = (millis << 80) | (random_part & ((1 << 80) - 1))
+    return ''.join(_CROCKFORD[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+
+def new_application_id(company: str) -> str:
+    """Collision-free application ID like `Acme_Corp_01J9ZQ4W8R...` (also safe in file names)."""
+    prefix = re.sub(r'[^A-Za-z0-9]+', '_', str(company)).strip('_') or 'application'
+    return f"{prefix}_{new_ulid()}"
+
+
+# Postings in these states are not applied to again by the batch runners.
+# A preview run ends as 'previewed', which does not block a later submit.
+DEDUP_STATUSES = ('submitted', 'in_progress')
+
+# An 'in_progress' row only blocks the posting while it is this fresh (seconds);
+# older ones were left behind by a run that crashed before marking them failed
+IN_PROGRESS_WINDOW = 30 * 60
+
+
+def _updated_within(row: Dict[str, Any], seconds: float) -> bool:
+    """Whether a row's last_updated is at most `seconds` old."""
+    try:
+        updated = datetime.fromisoformat(str(row.get('last_updated')))
+    except ValueError:
+        return False
+    return (datetime.now() - updated).total_seconds() <= seconds
+
+
+# Write-behind trackers with unflushed changes are flushed on exit and SIGTERM
+_write_behind_trackers = weakref.WeakSet()
+_exit_hooks_installed = False
+_previous_sigterm = None
+
+# Seconds SIGTERM waits for each tracker's final flush before exiting anyway
+SIGTERM_FLUSH_TIMEOUT = 5.0
+
+
+def _bump(counter: Counter, key: Any, delta: int):
+    """Adjust a running count, dropping keys that reach zero."""
+    if key is None or (isinstance(key, float) and key != key):
+        return
+    counter[key] += delta
+    if counter[key] <= 0:
+        del counter[key]
+
+
+def _flush_write_behind_trackers():
+    for tracker in list(_write_behind_trackers):
+        try:
+            tracker.flush()
+        except Exception as e:
+            print(f"Warning: Could not flush application tracker {tracker.db_path}: {e}")
+
+
+def _on_sigterm(signum, frame):
+    # The handler runs on the main thread, which may be interrupted while it
+    # holds a tracker's locks (inside flush(), refresh() or close()). Flushing
+    # here could then wait on itself forever, so each tracker's own flush
+    # thread does the final flush and we only wait for it a bounded time.
+    for tracker in list(_write_behind_trackers):
+        if not tracker._stop_flush_thread(timeout=SIGTERM_FLUSH_TIMEOUT):
+            print(f"Warning: Gave up flushing application tracker {tracker.db_path} on SIGTERM")
+    if callable(_previous_sigterm):
+        _previous_sigterm(signum, frame)
+    else:
+        sys.exit(128 + signum)
+
+
+def _install_exit_hooks():
+    global _exit_hooks_installed, _previous_sigterm
+    if _exit_hooks_installed:
+        return
+    _exit_hooks_installed = True
+    atexit.register(_flush_write_behind_trackers)
+    # Signal handlers can only be installed from the main thread
+    if threading.current_thread() is threading.main_thread():
+        previous = signal.getsignal(signal.SIGTERM)
+        if previous is not signal.SIG_IGN:
+            _previous_sigterm = previous
+            signal.signal(signal.SIGTERM, _on_sigterm)
 
 
 class ApplicationTracker:
     """Track internship applications and their status."""
 
-    def __init__(self, db_path: str = "data/applications.csv"):
+    # Per-application phase timings and page load metrics
+    PERFORMANCE_COLUMNS = [
+        'navigate_ms',
+        'detect_ms',
+        'classify_ms',
+        'fill_ms',
+        'agent_ms',
+        'screenshot_ms',
+        'submit_ms',
+        'dom_nodes',
+        'js_heap_bytes',
+        'layout_count',
+        'bytes_transferred'
+    ]
+
+    COLUMNS = [
+        'application_id',
+        'company',
+        'position',
+        'url',
+        'status',
+        'submitted_date',
+        'last_updated',
+        'notes',
+        'resume_used',
+        'cover_letter_used',
+        'filled_fields',
+        'unfilled_fields',
+        'errors',
+        'browser_rss_mb'
+    ] + PERFORMANCE_COLUMNS
+
+    def __init__(self, db_path: str = "data/applications.csv", backend: Optional[str] = None,
+                 write_behind: bool = False, flush_interval: float = 2.0, flush_every: int = 50):
+        """
+        Initialize the tracker.
+
+        Args:
+            db_path: Database file
+            backend: Storage engine, 'csv', 'sqlite' or 'eventlog' (inferred
+                from the suffix of `db_path` if None: .db/.sqlite/.sqlite3 use
+                SQLite, .jsonl the append-only event log)
+            write_behind: Buffer changes in memory and persist them from a
+                background thread instead of writing on every call
+            flush_interval: Seconds between background flushes (write-behind only)
+            flush_every: Flush as soon as this many changes are pending (write-behind only)
+        """
         self.db_path = Path(db_path)
         # Ensure both data/ and data/screenshots/ exist
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         Path(self.db_path.parent / "screenshots").mkdir(parents=True, exist_ok=True)
-        self.df = self._load_database()
+        self.backend = create_backend(self.db_path, self.COLUMNS, backend)
+        # application_id -> row, in insertion order
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._df_cache: Optional[pd.DataFrame] = None
+        # Running rollups, updated on every write instead of recomputed per query
+        self._status_counts: Counter = Counter()
+        self._company_counts: Counter = Counter()
+        self._position_counts: Counter = Counter()
+        self._day_counts: Counter = Counter()
+        # Insertion position of every application, used to keep results in table order
+        self._positions: Dict[str, int] = {}
+        # (submitted_date, position, application_id), kept sorted for recent-N queries
+        self._recent: List[Tuple[str, int, str]] = []
+        self._recent_keys: Dict[str, Tuple[str, int, str]] = {}
+        # Canonical posting key -> application ids, for skipping already-applied jobs
+        self._url_index: Dict[str, Set[str]] = {}
+        # Substring/fuzzy search over company and position
+        self._company_index = TrigramIndex()
+        self._position_index = TrigramIndex()
+        self._load_database()
+
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_every = flush_every
+        self._pending: List[Mutation] = []
+        self._lock = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closing = False
+        self._flush_thread = None
+        if write_behind:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="tracker-write-behind", daemon=True
+            )
+            self._flush_thread.start()
+            _write_behind_trackers.add(self)
+            _install_exit_hooks()
 
-    def _load_database(self) -> pd.DataFrame:
-        """Load application database from CSV."""
-        if self.db_path.exists():
-            return pd.read_csv(self.db_path)
+    def _load_database(self):
+        """Load all applications from the storage backend."""
+        for row in self.backend.load():
+            self._put_row(row)
+        self._df_cache = None
+
+    def _index_row(self, row: Dict[str, Any], delta: int):
+        """Add (delta=1) or remove (delta=-1) a row from the running counters."""
+        _bump(self._status_counts, row.get('status'), delta)
+        _bump(self._company_counts, row.get('company'), delta)
+        _bump(self._position_counts, row.get('position'), delta)
+        submitted = row.get('submitted_date')
+        _bump(self._day_counts, submitted[:10] if isinstance(submitted, str) else None, delta)
+
+    def _add_recent(self, row: Dict[str, Any]):
+        submitted = row.get('submitted_date')
+        application_id = row['application_id']
+        key = (submitted if isinstance(submitted, str) else '', self._positions[application_id], application_id)
+        bisect.insort(self._recent, key)
+        self._recent_keys[application_id] = key
+
+    def _remove_recent(self, application_id: str):
+        key = self._recent_keys.pop(application_id, None)
+        if key is not None:
+            i = bisect.bisect_left(self._recent, key)
+            if i < len(self._recent) and self._recent[i] == key:
+                del self._recent[i]
+
+    def _index_url(self, application_id: str, url: Any):
+        if isinstance(url, str) and url:
+            self._url_index.setdefault(canonical_job_url(url), set()).add(application_id)
+
+    def _unindex_url(self, application_id: str, url: Any):
+        if isinstance(url, str) and url:
+            key = canonical_job_url(url)
+            ids = self._url_index.get(key)
+            if ids is not None:
+                ids.discard(application_id)
+                if not ids:
+                    del self._url_index[key]
+
+    def _put_row(self, row: Dict[str, Any]):
+        """Insert or replace a row in memory, keeping the indexes in step."""
+        application_id = row['application_id']
+        old = self._rows.get(application_id)
+        if old is not None:
+            self._index_row(old, -1)
+            self._remove_recent(application_id)
+            self._unindex_url(application_id, old.get('url'))
+        else:
+            self._positions[application_id] = len(self._positions)
+        self._rows[application_id] = row
+        self._index_row(row, 1)
+        self._add_recent(row)
+        self._company_index.add(application_id, row.get('company'))
+        self._position_index.add(application_id, row.get('position'))
+        self._index_url(application_id, row.get('url'))
+
+    def _change_row(self, row: Dict[str, Any], changes: Dict[str, Any]):
+        """Apply changes to a row in memory, keeping the indexes in step."""
+        self._index_row(row, -1)
+        if 'url' in changes:
+            self._unindex_url(row['application_id'], row.get('url'))
+        row.update(changes)
+        self._index_row(row, 1)
+        if 'submitted_date' in changes:
+            self._remove_recent(row['application_id'])
+            self._add_recent(row)
+        if 'url' in changes:
+            self._index_url(row['application_id'], row.get('url'))
+        if 'company' in changes:
+            self._company_index.add(row['application_id'], row.get('company'))
+        if 'position' in changes:
+            self._position_index.add(row['application_id'], row.get('position'))
+
+    def _rows_frame(self, application_ids) -> pd.DataFrame:
+        """Build a DataFrame of the given applications in table order."""
+        ordered = sorted(application_ids, key=self._positions.__getitem__)
+        return pd.DataFrame([self._rows[i] for i in ordered], columns=self.COLUMNS)
+
+    @contextmanager
+    def _writing(self):
+        """
+        Hold the locks needed to change rows. Write-through trackers persist
+        while holding them, so they also take the backend's cross-process lock,
+        always before the in-memory lock.
+        """
+        if self.write_behind:
+            with self._lock:
+                yield
         else:
-            # Create new DataFrame with schema
-            return pd.DataFrame(columns=[
-                'application_id',
-                'company',
-                'position',
-                'url',
-                'status',
-                'submitted_date',
-                'last_updated',
-                'notes',
-                'resume_used',
-                'cover_letter_used',
-                'filled_fields',
-                'unfilled_fields',
-                'errors'
-            ])
-
-    def _save_database(self):
-        """Save application database to CSV."""
-        self.df.to_csv(self.db_path, index=False)
+            with self.backend.lock(), self._lock:
+                yield
+
+    def _merge_external(self, mutations: List[Mutation], local_ids: Set[str]):
+        """Apply changes persisted by other processes, except to rows we have unsaved changes for."""
+        for op, application_id, values in mutations:
+            if application_id in local_ids:
+                continue
+            row = self._rows.get(application_id)
+            if op == 'insert':
+                self._put_row({column: values.get(column) for column in self.COLUMNS})
+            elif row is not None:
+                self._change_row(row, {k: v for k, v in values.items() if k in self.COLUMNS})
+        if mutations:
+            self._df_cache = None
+
+    def _write_batch(self, batch: List[Mutation]):
+        """Persist a batch. The caller holds the backend lock."""
+        external = self.backend.read_external() if self.backend.MERGE_BEFORE_WRITE else []
+        with self._lock:
+            local_ids = {m[1] for m in batch} | {m[1] for m in self._pending}
+            self._merge_external(external, local_ids)
+            # Backends that read the whole table get a consistent copy of it
+            if self.backend.needs_table(len(batch)):
+                table = {key: dict(row) for key, row in self._rows.items()}
+            else:
+                table = self._rows
+        self.backend.write(batch, table)
+
+    def _save_database(self, mutations: List[Mutation]):
+        """Persist a batch of mutations, or queue it in write-behind mode."""
+        self._df_cache = None
+        if not self.write_behind:
+            # _writing() already holds the backend lock
+            self._write_batch(mutations)
+            return
+        with self._lock:
+            self._pending.extend(mutations)
+            if len(self._pending) >= self.flush_every:
+                self._lock.notify()
+
+    def refresh(self) -> int:
+        """
+        Load applications other processes have written since this tracker last
+        read or wrote the database.
+
+        Returns:
+            Number of changes picked up
+        """
+        with self.backend.lock():
+            external = self.backend.read_external()
+            with self._lock:
+                self._merge_external(external, {m[1] for m in self._pending})
+        return len(external)
+
+    def _flush_loop(self):
+        """Background thread: flush on an interval or once enough changes are pending."""
+        while True:
+            with self._lock:
+                self._lock.wait_for(
+                    lambda: self._closing or len(self._pending) >= self.flush_every,
+                    timeout=self.flush_interval
+                )
+                closing = self._closing
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Warning: Background tracker flush failed (will retry): {e}")
+            if closing:
+                return
+
+    def _stop_flush_thread(self, timeout: Optional[float] = None) -> bool:
+        """
+        Have the flush thread write what is pending and exit.
+
+        Returns:
+            True if it finished within `timeout` seconds (or there was none)
+        """
+        thread = self._flush_thread
+        if thread is None:
+            return True
+        with self._lock:
+            self._closing = True
+            self._lock.notify()
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def flush(self):
+        """Write all pending changes to the storage backend."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if not batch:
+                    return
+            try:
+                with self.backend.lock():
+                    self._write_batch(batch)
+            except Exception:
+                with self._lock:
+                    self._pending = batch + self._pending
+                raise
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """All applications as a DataFrame (rebuilt only after changes)."""
+        if self._df_cache is None:
+            self._df_cache = pd.DataFrame(list(self._rows.values()), columns=self.COLUMNS)
+        return self._df_cache
+
+    def close(self):
+        """Flush pending changes and release the storage backend."""
+        self._stop_flush_thread()
+        self._flush_thread = None
+        self.flush()
+        _write_behind_trackers.discard(self)
+        self.backend.close()
 
     def add_application(self, company: str, position: str, url: str,
                        status: str = "pending", **kwargs) -> str:
@@ -48,7 +514,7 @@ class ApplicationTracker:
         Returns:
             application_id
         """
-        application_id = f"{company.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        application_id = new_application_id(company)
 
         new_row = {
             'application_id': application_id,
@@ -63,42 +529,127 @@ class ApplicationTracker:
             'cover_letter_used': kwargs.get('cover_letter_used', ''),
             'filled_fields': kwargs.get('filled_fields', 0),
             'unfilled_fields': kwargs.get('unfilled_fields', 0),
-            'errors': kwargs.get('errors', '')
+            'errors': kwargs.get('errors', ''),
+            'browser_rss_mb': kwargs.get('browser_rss_mb')
         }
+        for column in self.PERFORMANCE_COLUMNS:
+            new_row[column] = kwargs.get(column)
 
-        self.df = pd.concat([self.df, pd.DataFrame([new_row])], ignore_index=True)
-        self._save_database()
+        with self._writing():
+            self._put_row(new_row)
+            self._save_database([('insert', application_id, dict(new_row))])
 
         return application_id
 
+    def import_application(self, record: Dict[str, Any]):
+        """
+        Insert or replace a complete application record, keeping its ID.
+
+        Used to merge applications tracked by another process (e.g. a batch worker).
+        """
+        application_id = record['application_id']
+        row = {column: record.get(column) for column in self.COLUMNS}
+
+        with self._writing():
+            self._put_row(row)
+            self._save_database([('insert', application_id, dict(row))])
+
+    def import_csv(self, csv_path: str) -> int:
+        """
+        Import every application from a tracker CSV (e.g. to migrate to SQLite).
+
+        Returns:
+            Number of imported applications
+        """
+        rows = read_csv_rows(Path(csv_path), self.COLUMNS)
+        mutations = []
+        with self._writing():
+            for record in rows:
+                row = {column: clean_value(record.get(column)) for column in self.COLUMNS}
+                self._put_row(row)
+                mutations.append(('insert', row['application_id'], dict(row)))
+            self._save_database(mutations)
+        return len(rows)
+
     def update_application(self, application_id: str, **kwargs):
         """Update an existing application."""
-        if application_id not in self.df['application_id'].values:
+        row = self._rows.get(application_id)
+        if row is None:
             raise ValueError(f"Application ID {application_id} not found")
 
-        idx = self.df[self.df['application_id'] == application_id].index[0]
-
-        for key, value in kwargs.items():
-            if key in self.df.columns:
-                self.df.at[idx, key] = value
+        changes = {key: value for key, value in kwargs.items() if key in self.COLUMNS}
+        changes['last_updated'] = datetime.now().isoformat()
+        with self._writing():
+            self._change_row(row, changes)
+            self._save_database([('update', application_id, changes)])
 
-        self.df.at[idx, 'last_updated'] = datetime.now().isoformat()
-        self._save_database()
+    def mark_submitted(self, application_id: str, **kwargs):
+        """Mark an application as submitted (extra columns can be updated at the same time)."""
+        self.update_application(application_id, status='submitted', **kwargs)
 
-    def mark_submitted(self, application_id: str):
-        """Mark an application as submitted."""
-        self.update_application(application_id, status='submitted')
+    def mark_previewed(self, application_id: str, **kwargs):
+        """Mark an application as filled but not submitted (a preview run)."""
+        self.update_application(application_id, status='previewed', **kwargs)
 
-    def mark_failed(self, application_id: str, error: str):
-        """Mark an application as failed."""
-        self.update_application(application_id, status='failed', errors=error)
+    def mark_failed(self, application_id: str, error: str, **kwargs):
+        """Mark an application as failed (extra columns can be updated at the same time)."""
+        self.update_application(application_id, status='failed', errors=error, **kwargs)
 
     def get_application(self, application_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific application by ID."""
-        result = self.df[self.df['application_id'] == application_id]
-        if result.empty:
-            return None
-        return result.iloc[0].to_dict()
+        row = self._rows.get(application_id)
+        return dict(row) if row is not None else None
+
+    def get_applications_by_url(self, url: str) -> List[Dict[str, Any]]:
+        """Get all applications for the same posting as `url` (see canonical_job_url)."""
+        ids = self._url_index.get(canonical_job_url(url), ())
+        return [dict(self._rows[i]) for i in sorted(ids, key=self._positions.__getitem__)]
+
+    def find_existing_application(self, url: str,
+                                  statuses: Tuple[str, ...] = DEDUP_STATUSES,
+                                  in_progress_window: float = IN_PROGRESS_WINDOW) -> Optional[str]:
+        """
+        Find an application for the same posting whose status is in `statuses`.
+
+        Args:
+            url: Job posting URL (see canonical_job_url)
+            statuses: Statuses that count as already applied
+            in_progress_window: An 'in_progress' application only counts if it
+                was updated within this many seconds (a stale one is from a
+                crashed run)
+
+        Returns:
+            The matching application_id, or None if the posting is new
+        """
+        for application_id in self._url_index.get(canonical_job_url(url), ()):
+            row = self._rows[application_id]
+            status = row.get('status')
+            if status not in statuses:
+                continue
+            if status == 'in_progress' and not _updated_within(row, in_progress_window):
+                continue
+            return application_id
+        return None
+
+    def get_status_history(self, application_id: str) -> List[Dict[str, Any]]:
+        """
+        Get every recorded event (created, in_progress, filled, submitted, failed, ...)
+        for an application, oldest first. Requires the event log backend.
+        """
+        if not hasattr(self.backend, 'history'):
+            raise ValueError("Status history requires the event log backend (a .jsonl database)")
+        return self.backend.history(application_id)
+
+    def compact(self):
+        """Compact the event log into a snapshot (no-op for other backends)."""
+        if hasattr(self.backend, 'compact'):
+            self.flush()
+            with self._flush_lock, self.backend.lock():
+                external = self.backend.read_external()
+                with self._lock:
+                    self._merge_external(external, {m[1] for m in self._pending})
+                    table = {key: dict(row) for key, row in self._rows.items()}
+                self.backend.compact(table)
 
     def get_applications_by_status(self, status: str) -> pd.DataFrame:
         """Get all applications with a specific status."""
@@ -106,15 +657,17 @@ class ApplicationTracker:
 
     def get_applications_by_company(self, company: str) -> pd.DataFrame:
         """Get all applications for a specific company."""
-        return self.df[self.df['company'].str.contains(company, case=False, na=False)]
+        return self._rows_frame(self._company_index.search(company))
 
     def get_recent_applications(self, limit: int = 10) -> pd.DataFrame:
-        """Get most recent applications."""
-        return self.df.sort_values('submitted_date', ascending=False).head(limit)
+        """Get most recent applications (O(limit) from the submitted_date index)."""
+        keys = self._recent[-limit:][::-1] if limit > 0 else []
+        rows = [self._rows[application_id] for _, _, application_id in keys]
+        return pd.DataFrame(rows, columns=self.COLUMNS)
 
     def get_statistics(self) -> Dict[str, Any]:
-        """Get application statistics."""
-        total = len(self.df)
+        """Get application statistics (O(1) from running counters)."""
+        total = len(self._rows)
         if total == 0:
             return {
                 'total_applications': 0,
@@ -124,7 +677,7 @@ class ApplicationTracker:
                 'success_rate': 0.0
             }
 
-        status_counts = self.df['status'].value_counts().to_dict()
+        status_counts = self._status_counts
 
         return {
             'total_applications': total,
@@ -132,19 +685,74 @@ class ApplicationTracker:
             'pending': status_counts.get('pending', 0),
             'failed': status_counts.get('failed', 0),
             'success_rate': (status_counts.get('submitted', 0) / total) * 100 if total > 0 else 0.0,
-            'companies_applied': self.df['company'].nunique(),
-            'positions_applied': self.df['position'].nunique()
+            'companies_applied': len(self._company_counts),
+            'positions_applied': len(self._position_counts)
         }
 
+    def get_daily_counts(self) -> Dict[str, int]:
+        """Get the number of applications per day (YYYY-MM-DD), oldest first."""
+        return dict(sorted(self._day_counts.items()))
+
+    def get_performance_report(self, metrics: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Summarize performance metrics per ATS domain.
+
+        Args:
+            metrics: Columns to summarize (defaults to all performance columns)
+
+        Returns:
+            DataFrame indexed by domain with an `applications` count and
+            `<metric>_p50` / `<metric>_p95` columns
+        """
+        metrics = metrics or self.PERFORMANCE_COLUMNS
+        if self.df.empty:
+            return pd.DataFrame(columns=['applications'])
+
+        data = self.df[metrics].apply(pd.to_numeric, errors='coerce')
+        data['domain'] = self.df['url'].map(ats_domain)
+        grouped = data.groupby('domain')
+
+        report = pd.DataFrame({'applications': grouped.size()})
+        for metric in metrics:
+            report[f'{metric}_p50'] = grouped[metric].quantile(0.50)
+            report[f'{metric}_p95'] = grouped[metric].quantile(0.95)
+        return report.sort_values('applications', ascending=False)
+
     def export_report(self, output_path: str = "data/application_report.csv"):
-        """Export full application report."""
+        """Export full application report (also the CSV export for any backend)."""
         self.df.to_csv(output_path, index=False)
         return output_path
 
+    def export_parquet(self, output_dir: str = "data/applications_parquet") -> str:
+        """
+        Export applications as a Parquet dataset partitioned by month, for the
+        out-of-core reports in `src.tracker_reports`. Requires pyarrow.
+
+        Returns:
+            output_dir
+        """
+        from .tracker_reports import export_parquet
+        return export_parquet(self.df, output_dir)
+
     def search_applications(self, query: str) -> pd.DataFrame:
-        """Search applications by company or position."""
-        mask = (
-            self.df['company'].str.contains(query, case=False, na=False) |
-            self.df['position'].str.contains(query, case=False, na=False)
-        )
-        return self.df[mask]
+        """Search applications by company or position (case-insensitive substring)."""
+        matches = self._company_index.search(query) | self._position_index.search(query)
+        return self._rows_frame(matches)
+
+    def fuzzy_search_applications(self, query: str, threshold: float = 0.4,
+                                  limit: int = 20) -> pd.DataFrame:
+        """
+        Search company and position allowing typos, ranked by trigram similarity.
+
+        Returns:
+            Matching applications, best match first, with a `score` column
+        """
+        scores: Dict[str, float] = {}
+        for index in (self._company_index, self._position_index):
+            for application_id, score in index.fuzzy_search(query, threshold, limit=len(index)):
+                scores[application_id] = max(score, scores.get(application_id, 0.0))
+
+        best = sorted(scores, key=lambda i: (-scores[i], self._positions[i]))[:limit]
+        result = pd.DataFrame([self._rows[i] for i in best], columns=self.COLUMNS)
+        result['score'] = [scores[i] for i in best]
+        return result
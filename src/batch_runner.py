@@ -0,0 +1,325 @@
+"""
+Multi-process batch runner.
+
+Shards a job list across worker processes. Each worker runs its own event loop
+with `concurrency` bots (one browser each) and uses
+`InternshipApplicationBot.apply_to_job` as the unit of work. The parent process
+collects results and merges every tracked application into a single
+`ApplicationTracker`.
+
+For a cohort, pass a `ProfileStore` and give every job a `candidate_id`: each
+job is then applied with that candidate's profile and recorded in that
+candidate's own tracker.
+
+Usage:
+    python -m src.batch_runner jobs.json --workers 4 --concurrency 2 [--submit]
+    python -m src.batch_runner cohort_jobs.csv --profiles data/candidates
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import queue as queue_module
+import signal
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import pandas as pd
+
+from .application_bot import InternshipApplicationBot, skipped_result
+from .application_tracker import ApplicationTracker, canonical_job_url
+from .profile_manager import ProfileManager
+from .profile_store import ProfileStore
+
+
+def shard_jobs(job_list: List[Dict[str, Any]], workers: int) -> List[List[Dict[str, Any]]]:
+    """Split jobs round-robin into at most `workers` non-empty shards."""
+    shards = [job_list[i::workers] for i in range(workers)]
+    return [shard for shard in shards if shard]
+
+
+def shard_jobs_by_candidate(job_list: List[Dict[str, Any]], workers: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split jobs into at most `workers` non-empty shards, keeping every job of a
+    candidate in one shard, so only one worker loads each candidate's profile.
+
+    Candidates are dealt whole, largest first, to the shard with the fewest
+    jobs; a candidate's jobs stay in job_list order.
+    """
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for job in job_list:
+        groups.setdefault(job['candidate_id'], []).append(job)
+    shards: List[List[Dict[str, Any]]] = [[] for _ in range(min(workers, len(groups)))]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(shards, key=len).extend(group)
+    return [shard for shard in shards if shard]
+
+
+async def _run_worker(worker_id: int, jobs: List[Dict[str, Any]], options: Dict[str, Any],
+                      results: mp.Queue, stop_event) -> None:
+    """Apply to a shard of jobs with `concurrency` bots sharing one event loop."""
+    if options['profile_root']:
+        # Candidate profiles are loaded as their jobs come up
+        profiles = ProfileStore(options['profile_root'], capacity=options['profile_capacity'])
+        profile_manager = None
+    else:
+        profiles = None
+        profile_manager = ProfileManager(options['profile_path'])
+    pending: asyncio.Queue = asyncio.Queue()
+    for job in jobs:
+        pending.put_nowait(job)
+
+    with tempfile.TemporaryDirectory(prefix=f"worker_{worker_id}_") as tmp_dir:
+        # The worker's own tracker is scratch space; the parent keeps the real one
+        tracker = ApplicationTracker(db_path=str(Path(tmp_dir) / "applications.csv"),
+                                     write_behind=True)
+
+        async def run_slot():
+            bot = InternshipApplicationBot(
+                profile_manager or profiles.get(jobs[0]['candidate_id']),
+                headless=options['headless'],
+                use_agent=options['use_agent'],
+                tracker=tracker,
+                interactive=False
+            )
+            await bot.start()
+            try:
+                while not stop_event.is_set():
+                    try:
+                        job = pending.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    if profiles is not None:
+                        bot.use_profile(profiles.get(job['candidate_id']))
+                    result = await bot.apply_to_job(
+                        company=job['company'],
+                        position=job['position'],
+                        url=job['url'],
+                        submit=options['submit']
+                    )
+                    record = tracker.get_application(result['application_id'])
+                    results.put(('result', worker_id, job['_index'], result, record))
+
+                    if options['delay'] and not pending.empty():
+                        await asyncio.sleep(options['delay'] / 1000)
+            finally:
+                await bot.close()
+
+        outcomes = await asyncio.gather(*(run_slot() for _ in range(options['concurrency'])),
+                                        return_exceptions=True)
+        tracker.close()
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                print(f"[worker {worker_id}] ✗ Browser slot failed: {outcome}")
+
+
+def _worker_main(worker_id: int, jobs: List[Dict[str, Any]], options: Dict[str, Any],
+                 results: mp.Queue, stop_event) -> None:
+    """Process entry point for a worker."""
+    # Detach from the terminal's process group so Ctrl-C only reaches the parent,
+    # which then asks workers to stop after their in-flight applications.
+    if hasattr(os, 'setsid'):
+        os.setsid()
+    else:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        asyncio.run(_run_worker(worker_id, jobs, options, results, stop_event))
+    except Exception as e:
+        print(f"[worker {worker_id}] ✗ Worker failed: {e}")
+    finally:
+        results.put(('done', worker_id, None, None, None))
+
+
+def run_sharded(job_list: List[Dict[str, str]], workers: int = 2, concurrency: int = 1,
+                submit: bool = False, headless: bool = True, use_agent: bool = False,
+                profile_path: str = "data/user_profile.json",
+                tracker: Optional[ApplicationTracker] = None,
+                delay: int = 0, skip_duplicates: bool = True,
+                profile_store: Optional[ProfileStore] = None) -> List[Optional[Dict[str, Any]]]:
+    """
+    Apply to a list of jobs across several worker processes.
+
+    Args:
+        job_list: List of dicts with 'company', 'position', 'url' keys
+        workers: Number of worker processes
+        concurrency: Bots (browsers) per worker process
+        submit: Whether to actually submit applications
+        headless: Run browsers in headless mode
+        use_agent: Enable the AI agent in every bot
+        profile_path: Profile used by all workers
+        tracker: Tracker the results are merged into (defaults to a write-behind
+            tracker on data/applications.csv)
+        delay: Delay between applications of the same bot in milliseconds
+        skip_duplicates: Skip postings already submitted or in progress, and
+            repeats of a posting within `job_list` (matched by canonical URL)
+        profile_store: Candidate profiles; every job must then have a
+            'candidate_id', and its result goes to that candidate's tracker
+            instead of `tracker` (duplicates are checked per candidate)
+
+    Returns:
+        Results in the order of `job_list` (None for jobs skipped by a shutdown)
+    """
+    owns_tracker = tracker is None and profile_store is None
+    if owns_tracker:
+        tracker = ApplicationTracker(write_behind=True)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(job_list)
+
+    def tracker_for(job: Dict[str, Any]) -> ApplicationTracker:
+        return profile_store.tracker(job['candidate_id']) if profile_store else tracker
+
+    # Drop already-applied postings before any worker or browser is started
+    if profile_store:
+        missing = {job.get('candidate_id') for job in job_list} - set(profile_store.candidate_ids())
+        if missing:
+            raise ValueError(f"Jobs reference unknown candidates: {', '.join(sorted(map(str, missing)))}")
+    if skip_duplicates and not profile_store:
+        tracker.refresh()
+    pending_jobs = []
+    seen = set()
+    for index, job in enumerate(job_list):
+        if skip_duplicates:
+            key = (job.get('candidate_id'), canonical_job_url(job['url']))
+            existing_id = tracker_for(job).find_existing_application(job['url'])
+            if existing_id or key in seen:
+                results[index] = skipped_result(existing_id)
+                continue
+            seen.add(key)
+        # Remember each job's position so results come back in job_list order
+        pending_jobs.append({**job, '_index': index})
+    skipped = len(job_list) - len(pending_jobs)
+    if skipped:
+        print(f"⏭ Skipping {skipped} already-applied or repeated posting(s)")
+
+    if profile_store:
+        # Each worker only loads the profiles of its own candidates
+        shards = shard_jobs_by_candidate(pending_jobs, max(1, workers))
+    else:
+        shards = shard_jobs(pending_jobs, max(1, workers))
+    options = {
+        'profile_path': profile_path,
+        'profile_root': str(profile_store.root) if profile_store else None,
+        'profile_capacity': profile_store.capacity if profile_store else 0,
+        'headless': headless,
+        'use_agent': use_agent,
+        'submit': submit,
+        'concurrency': max(1, concurrency),
+        'delay': delay
+    }
+
+    # Spawn rather than fork: each worker needs a clean event loop and Playwright driver
+    ctx = mp.get_context('spawn')
+    results_queue = ctx.Queue()
+    stop_event = ctx.Event()
+    processes = [
+        ctx.Process(target=_worker_main, args=(i, shard, options, results_queue, stop_event),
+                    name=f"batch-worker-{i}")
+        for i, shard in enumerate(shards)
+    ]
+
+    print(f"🚀 Starting {len(processes)} worker(s) x {options['concurrency']} browser(s) "
+          f"for {len(pending_jobs)} jobs...")
+    for process in processes:
+        process.start()
+
+    running = len(processes)
+    completed = 0
+    interrupted = False
+
+    while running:
+        try:
+            kind, worker_id, index, result, record = results_queue.get(timeout=1)
+        except queue_module.Empty:
+            if not any(p.is_alive() for p in processes):
+                break
+            continue
+        except KeyboardInterrupt:
+            if interrupted:
+                print("\n⚠ Forcing shutdown of workers...")
+                for process in processes:
+                    process.terminate()
+                break
+            interrupted = True
+            stop_event.set()
+            print("\n⚠ Stopping after in-flight applications (Ctrl-C again to force)...")
+            continue
+
+        if kind == 'done':
+            running -= 1
+            continue
+
+        completed += 1
+        results[index] = result
+        job = job_list[index]
+        if record:
+            tracker_for(job).import_application(record)
+        symbol = "✓" if result['success'] else "✗"
+        print(f"[{completed}/{len(pending_jobs)}] {symbol} {job['position']} at {job['company']} "
+              f"(worker {worker_id})")
+
+    for process in processes:
+        process.join(timeout=30)
+    if owns_tracker:
+        tracker.close()
+
+    print(f"\n{'='*60}")
+    print("SHARDED BATCH SUMMARY")
+    print(f"{'='*60}")
+    successful = sum(1 for r in results if r and r['success'])
+    print(f"Total jobs: {len(job_list)}")
+    print(f"Skipped (already applied): {skipped}")
+    print(f"Processed: {completed}")
+    print(f"Successful: {successful}")
+    print(f"Failed: {completed - successful}")
+    print(f"{'='*60}\n")
+
+    return results
+
+
+def load_job_list(path: str) -> List[Dict[str, str]]:
+    """Load jobs from a JSON list or a CSV with company, position and url columns."""
+    if path.endswith('.csv'):
+        return pd.read_csv(path, dtype={'candidate_id': str}).to_dict('records')
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply to a job list across several worker processes.")
+    parser.add_argument("jobs", help="JSON or CSV file with company, position and url for each job")
+    parser.add_argument("--workers", type=int, default=2, help="Number of worker processes")
+    parser.add_argument("--concurrency", type=int, default=1, help="Browsers per worker")
+    parser.add_argument("--submit", action="store_true", help="Actually submit applications")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows")
+    parser.add_argument("--agent", action="store_true", help="Use the local AI agent")
+    parser.add_argument("--profile", default="data/user_profile.json", help="Profile to apply with")
+    parser.add_argument("--delay", type=int, default=0, help="Delay between applications per bot (ms)")
+    parser.add_argument("--no-dedup", action="store_true", help="Apply even to postings already applied to")
+    parser.add_argument("--profiles", help="Candidate profile store; jobs then need a candidate_id")
+    args = parser.parse_args()
+
+    profile_store = ProfileStore(args.profiles) if args.profiles else None
+    results = run_sharded(
+        load_job_list(args.jobs),
+        workers=args.workers,
+        concurrency=args.concurrency,
+        submit=args.submit,
+        headless=not args.headed,
+        use_agent=args.agent,
+        profile_path=args.profile,
+        delay=args.delay,
+        skip_duplicates=not args.no_dedup,
+        profile_store=profile_store
+    )
+    if profile_store:
+        profile_store.close()
+    return 0 if all(r and (r['success'] or r.get('skipped')) for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
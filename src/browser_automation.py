@@ -1,52 +1,243 @@
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from typing import Optional, Dict, Any, List
+from pathlib import Path
 import asyncio
+import weakref
+
+from .page_classifier import PageClassifier
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Launches are serialized per event loop, so each instance can tell its own
+# browser processes from those of other bots started alongside it
+_launch_locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = weakref.WeakKeyDictionary()
+
+
+def _launch_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    if loop not in _launch_locks:
+        _launch_locks[loop] = asyncio.Lock()
+    return _launch_locks[loop]
+
+
+def _child_pids() -> set:
+    """PIDs of the direct children of this process (empty without psutil)."""
+    if psutil is None:
+        return set()
+    return {child.pid for child in psutil.Process().children()}
 
 
 class BrowserAutomation:
     """Core browser automation using Playwright."""
 
-    def __init__(self, headless: bool = False, slow_mo: int = 100):
+    def __init__(self, headless: bool = False, slow_mo: int = 100,
+                 record_har: Optional[str] = None, replay_har: Optional[str] = None):
         """
         Initialize browser automation.
 
         Args:
             headless: Run browser in headless mode
             slow_mo: Slow down operations by specified milliseconds (useful for debugging)
+            record_har: Record every response of the session into this HAR file
+            replay_har: Serve every request from this HAR file, with no network access
         """
         self.headless = headless
         self.slow_mo = slow_mo
+        self.record_har = record_har
+        self.replay_har = replay_har
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # Classifies the current page once per navigation (shared with AccountCreator)
+        self.classifier: Optional[PageClassifier] = None
         self.playwright = None
+        self.browser_disconnected = False
+        self.page_crashed = False
+        # Root processes of the browser this instance launched (see get_rss_bytes)
+        self._process_pids: set = set()
+        # CDP session on the page, for performance metrics and response sizes
+        self._cdp = None
+        # Bytes received over the network since the last navigate()
+        self.bytes_received = 0
 
     async def start(self):
         """Start the browser."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            slow_mo=self.slow_mo
-        )
-        self.context = await self.browser.new_context(
-            viewport={'width': 1440, 'height': 900},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+        async with _launch_lock():
+            before = _child_pids()
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                slow_mo=self.slow_mo
+            )
+            # The Playwright driver started for this instance; Chromium runs under it
+            self._process_pids = _child_pids() - before
+        self.browser_disconnected = False
+        self.browser.on('disconnected', self._on_disconnected)
+        await self._open_context()
+
+    def _on_disconnected(self, browser: Browser):
+        self.browser_disconnected = True
+
+    def _on_crash(self, page: Page):
+        self.page_crashed = True
+
+    def _on_loading_finished(self, event: Dict[str, Any]):
+        self.bytes_received += int(event.get('encodedDataLength') or 0)
+
+    async def _open_context(self):
+        """Open a fresh context and page, honouring the record/replay settings."""
+        context_options = {
+            'viewport': {'width': 1440, 'height': 900},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+        if self.record_har or self.replay_har:
+            # Service workers can answer requests outside of routing/recording
+            context_options['service_workers'] = 'block'
+        if self.record_har:
+            Path(self.record_har).parent.mkdir(parents=True, exist_ok=True)
+            context_options['record_har_path'] = self.record_har
+            context_options['record_har_content'] = 'embed'
+
+        self.context = await self.browser.new_context(**context_options)
+
+        if self.replay_har:
+            # Anything missing from the archive is aborted instead of hitting the network
+            await self.context.route_from_har(self.replay_har, not_found='abort')
+
         self.page = await self.context.new_page()
+        self.classifier = PageClassifier(self.page)
+        self.page_crashed = False
+        self.page.on('crash', self._on_crash)
 
-    async def close(self):
-        """Close the browser."""
+        self.bytes_received = 0
+        try:
+            # Network events give the size of every response, cross-origin
+            # ones included (Resource Timing reports 0 for those); Chromium only
+            self._cdp = await self.context.new_cdp_session(self.page)
+            self._cdp.on('Network.loadingFinished', self._on_loading_finished)
+            await self._cdp.send('Network.enable')
+            await self._cdp.send('Performance.enable')
+        except Exception as e:
+            print(f"Warning: Could not open a CDP session, page metrics are limited: {e}")
+            self._cdp = None
+            # Resource Timing keeps only 250 entries by default
+            await self.context.add_init_script('performance.setResourceTimingBufferSize(10000)')
+
+    async def _close_context(self):
+        """Close the current page and context (this flushes a HAR being recorded)."""
+        self._cdp = None  # detached with the page
         if self.page:
             await self.page.close()
+            self.page = None
         if self.context:
             await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+            self.context = None
+
+    def is_healthy(self) -> bool:
+        """Return False if the browser disconnected or the page crashed or was closed."""
+        if not self.browser or self.browser_disconnected or not self.browser.is_connected():
+            return False
+        return bool(self.page) and not self.page_crashed and not self.page.is_closed()
+
+    async def restart(self):
+        """Tear down whatever is left of the browser and launch a fresh one."""
+        try:
+            await self.close()
+        except Exception as e:
+            # A crashed browser usually fails to close cleanly
+            print(f"Warning: Error while closing browser for restart: {e}")
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.playwright = None
+        await self.start()
+
+    def get_rss_bytes(self) -> Optional[int]:
+        """
+        Get the resident memory of this instance's browser, summed over its
+        processes (the Playwright driver, Chromium and its renderers). Other
+        browsers in the same Python process are not counted.
+
+        Returns:
+            RSS in bytes, or None if psutil is not installed or the browser
+            was not started
+        """
+        if psutil is None or not self._process_pids:
+            return None
+        total = 0
+        for pid in self._process_pids:
+            try:
+                root = psutil.Process(pid)
+                processes = [root] + root.children(recursive=True)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            for process in processes:
+                try:
+                    total += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        return total
+
+    async def start_recording(self, har_path: str):
+        """Switch to a fresh context that records all traffic into `har_path`."""
+        await self._close_context()
+        self.record_har = har_path
+        self.replay_har = None
+        await self._open_context()
+
+    async def stop_recording(self, dom_path: Optional[str] = None) -> Optional[str]:
+        """
+        Finish the current recording and go back to a plain live context.
+
+        Args:
+            dom_path: Optionally save the final DOM of the page here first
+
+        Returns:
+            Path of the written HAR file, or None if nothing was being recorded
+        """
+        har_path = self.record_har
+        if dom_path:
+            await self.save_dom_snapshot(dom_path)
+        await self._close_context()
+        self.record_har = None
+        await self._open_context()
+        return har_path
+
+    async def start_replay(self, har_path: str):
+        """Switch to a fresh context that serves every request from `har_path`."""
+        await self._close_context()
+        self.record_har = None
+        self.replay_har = har_path
+        await self._open_context()
+
+    async def save_dom_snapshot(self, path: str):
+        """Save the current serialized DOM of the page."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        content = await self.page.content()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    async def close(self):
+        """Close the browser."""
+        try:
+            await self._close_context()
+        finally:
+            self.page = None
+            self.context = None
+            try:
+                if self.browser and self.browser.is_connected():
+                    await self.browser.close()
+            finally:
+                self._process_pids = set()
+                if self.playwright:
+                    await self.playwright.stop()
 
     async def navigate(self, url: str, wait_until: str = "domcontentloaded", timeout: int = 60000):
         """Navigate to a URL."""
+        self.bytes_received = 0
         await self.page.goto(url, wait_until=wait_until, timeout=timeout)
 
     async def screenshot(self, path: str):
@@ -81,6 +272,46 @@ class BrowserAutomation:
         """Execute JavaScript on the page."""
         return await self.page.evaluate(script)
 
+    async def get_page_metrics(self) -> Dict[str, Any]:
+        """
+        Collect page load metrics for the current page.
+
+        DOM node count, JS heap and layout count come from the CDP
+        `Performance.getMetrics` call. Bytes transferred are the encoded
+        sizes (headers and body) of every response since the last
+        navigate(), from CDP `Network.loadingFinished` events. Without a CDP
+        session (non-Chromium browsers) they fall back to summing Resource
+        Timing `transferSize`, which is 0 for cross-origin resources served
+        without Timing-Allow-Origin and so undercounts CDN-hosted assets.
+
+        Returns:
+            Dictionary with dom_nodes, js_heap_bytes, layout_count and
+            bytes_transferred (metrics that could not be read are omitted)
+        """
+        metrics: Dict[str, Any] = {}
+        if self._cdp is not None:
+            try:
+                result = await self._cdp.send('Performance.getMetrics')
+                values = {m['name']: m['value'] for m in result.get('metrics', [])}
+                metrics['dom_nodes'] = int(values.get('Nodes', 0))
+                metrics['js_heap_bytes'] = int(values.get('JSHeapUsedSize', 0))
+                metrics['layout_count'] = int(values.get('LayoutCount', 0))
+            except Exception as e:
+                print(f"Warning: Could not read CDP performance metrics: {e}")
+            metrics['bytes_transferred'] = self.bytes_received
+            return metrics
+
+        try:
+            metrics['bytes_transferred'] = int(await self.page.evaluate('''() => {
+                const entries = performance.getEntriesByType('navigation')
+                    .concat(performance.getEntriesByType('resource'));
+                return entries.reduce((total, e) => total + (e.transferSize || 0), 0);
+            }'''))
+        except Exception as e:
+            print(f"Warning: Could not read transfer size: {e}")
+
+        return metrics
+
     async def get_current_url(self) -> str:
         """Get the current URL."""
         return self.page.url
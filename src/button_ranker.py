@@ -0,0 +1,134 @@
+from playwright.async_api import Page
+from typing import Dict, Any, List, Optional
+
+from .page_classifier import DEEP_QUERY_JS
+
+# Scoring rules per kind of button. A candidate must contain one of the
+# `phrases` (the best one counts, an exact label match gets a bonus) or be a
+# submit-type control; it loses points for each `penalties` phrase it contains.
+BUTTON_INTENTS = {
+    'submit': {
+        'phrases': {'submit application': 10, 'send application': 9, 'submit': 8,
+                    'apply now': 7, 'apply': 6, 'send': 4, 'finish': 4, 'complete': 3},
+        'penalties': {'cancel': 8, 'remove': 8, 'sign in': 8, 'log in': 8, 'back': 6,
+                      'previous': 6, 'upload': 6, 'add another': 6, 'search': 6,
+                      'linkedin': 6, 'indeed': 6, 'autofill': 6, 'save': 4},
+        'submit_type': 4,
+    },
+    'create_account': {
+        'phrases': {'create account': 10, 'create an account': 10, 'sign up': 8,
+                    'register': 8, 'get started': 5, 'join': 4, 'submit': 3, 'continue': 2},
+        'penalties': {'sign in': 8, 'log in': 8, 'forgot': 8, 'cancel': 8, 'google': 5,
+                      'linkedin': 5, 'apple': 5, 'facebook': 5},
+        'submit_type': 3,
+    },
+}
+
+# Score every visible, enabled button, submit input, link and role=button in
+# one pass. Controls inside the main form (the one with the most fillable
+# fields) and after its last field rank higher, links lower, which keeps nav
+# and banner CTAs ("Apply" in the header) behind the form's own button.
+# Returns {'0': element, '1': element, ..., 'ranking': [info, ...]}, best first.
+_RANK_JS = '''({phrases, penalties, submitType, limit}) => {''' + DEEP_QUERY_JS + '''
+    const fillable = el => el.matches(
+        'input:not([type="hidden"]):not([type="submit"]):not([type="button"])' +
+        ':not([type="reset"]):not([type="image"]), textarea, select');
+    let mainForm = null, mostFields = 0;
+    for (const form of deepQueryAll(document, 'form')) {
+        const count = Array.from(form.elements).filter(fillable).length;
+        if (count > mostFields) { mostFields = count; mainForm = form; }
+    }
+    const fields = deepQueryAll(document, 'input, textarea, select').filter(fillable);
+    const lastField = fields[fields.length - 1];
+
+    const ranking = [];
+    const selector = 'button, input[type="submit"], input[type="button"], input[type="image"], a, [role="button"]';
+    for (const el of deepQueryAll(document, selector)) {
+        const rect = el.getBoundingClientRect();
+        const style = getComputedStyle(el);
+        if (!rect.width || !rect.height || style.visibility === 'hidden' || el.disabled) continue;
+
+        const text = (el.innerText || el.value || el.getAttribute('aria-label') || el.title || '')
+            .trim().toLowerCase().replace(/\\s+/g, ' ');
+        const type = (el.getAttribute('type') || '').toLowerCase();
+        const isSubmit = type === 'submit' || type === 'image';
+        let phraseScore = 0;
+        for (const [phrase, weight] of Object.entries(phrases)) {
+            if (text.includes(phrase)) phraseScore = Math.max(phraseScore, weight + (text === phrase ? 2 : 0));
+        }
+        if (!phraseScore && !isSubmit) continue;
+
+        let score = phraseScore + (isSubmit ? submitType : 0);
+        for (const [phrase, weight] of Object.entries(penalties)) {
+            if (text.includes(phrase)) score -= weight;
+        }
+        const form = el.form || el.closest('form');
+        const inMainForm = Boolean(mainForm) && form === mainForm;
+        if (inMainForm) score += 3;
+        else if (form) score += 1;
+        if (lastField && (lastField.compareDocumentPosition(el) & Node.DOCUMENT_POSITION_FOLLOWING)) score += 2;
+        if (el.tagName === 'A') score -= 2;
+        if (text.length > 40) score -= 2;  // a sentence, not a button label
+        if (score <= 0) continue;
+
+        ranking.push({el, score, text: text.slice(0, 80), tag: el.tagName.toLowerCase(), type,
+                      in_main_form: inMainForm});
+    }
+    ranking.sort((a, b) => b.score - a.score);  // stable: ties keep document order
+
+    const result = {ranking: []};
+    ranking.slice(0, limit).forEach(({el, ...info}, index) => {
+        result[index] = el;
+        result.ranking.push(info);
+    });
+    return result;
+}'''
+
+
+async def rank_buttons(page: Page, intent: str = 'submit', limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Find the buttons that most likely perform an action, best first.
+
+    Args:
+        page: Page to search
+        intent: Key of BUTTON_INTENTS ('submit' or 'create_account')
+        limit: Most candidates to return
+
+    Returns:
+        List of dicts with the element handle plus score, text, tag, type and in_main_form
+    """
+    if intent not in BUTTON_INTENTS:
+        raise ValueError(f"Unknown button intent '{intent}' (use one of: {', '.join(BUTTON_INTENTS)})")
+    rules = BUTTON_INTENTS[intent]
+    result = await page.evaluate_handle(_RANK_JS, {
+        'phrases': rules['phrases'],
+        'penalties': rules['penalties'],
+        'submitType': rules['submit_type'],
+        'limit': limit
+    })
+    try:
+        properties = await result.get_properties()
+        ranking = await properties['ranking'].json_value()
+        await properties['ranking'].dispose()
+    finally:
+        await result.dispose()
+    return [{**info, 'element': properties[str(index)].as_element()}
+            for index, info in enumerate(ranking)]
+
+
+async def click_best_button(page: Page, intent: str = 'submit',
+                            timeout: int = 5000) -> Optional[Dict[str, Any]]:
+    """
+    Click the best-ranked button for an intent, falling back along the
+    ranking when a click fails (detached, covered or not clickable in time).
+
+    Returns:
+        The clicked candidate (see rank_buttons), or None if nothing could be clicked
+    """
+    for candidate in await rank_buttons(page, intent):
+        try:
+            await candidate['element'].click(timeout=timeout)
+            return candidate
+        except Exception as e:
+            print(f"  Could not click '{candidate['text'] or candidate['tag']}': {e}")
+    return None
@@ -1,6 +1,66 @@
 from playwright.async_api import Page, ElementHandle
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import re
+import time
+
+from .page_classifier import DEEP_QUERY_JS
+from .profile_snapshot import ProfileSnapshot
+
+
+# Everything FormDetector needs about a field, in one round trip: attributes,
+# the associated label (a label[for] in the same document or shadow root, else
+# an enclosing label), whether it is a custom widget and visibility (as
+# Playwright's is_visible judges it).
+_FIELD_INFO_JS = '''el => {
+    let label = null;
+    if (el.id) {
+        for (const root of [el.getRootNode(), document]) {
+            label = Array.from(root.querySelectorAll('label[for]')).find(l => l.htmlFor === el.id);
+            if (label) break;
+        }
+    }
+    const labelText = label ? label.innerText : ((el.closest('label') || {}).innerText || '').trim();
+    const rect = el.getBoundingClientRect();
+    // Widgets that only react to real typing (comboboxes, autocompletes, date pickers)
+    const custom = Boolean(el.readOnly || el.list || el.getAttribute('role') === 'combobox' ||
+        el.hasAttribute('aria-autocomplete') ||
+        el.closest('[role="combobox"], [class*="select__"], [class*="autocomplete"], [class*="datepicker"], [class*="date-picker"]'));
+    return {
+        tag: el.tagName.toLowerCase(),
+        type: el.type || 'text',
+        name: el.name || '',
+        id: el.id || '',
+        placeholder: el.placeholder || '',
+        label: labelText,
+        required: el.required,
+        custom,
+        visible: rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden'
+    };
+}'''
+
+
+# Set the values of plain text fields directly, the way a user's typing would
+# end up: through the native value setter (which controlled React inputs
+# track), then input, change and blur events for the frameworks to pick up.
+# Returns, per field, whether it now holds the value (input masks or length
+# limits can rewrite it).
+_BULK_FILL_JS = '''entries => entries.map(([el, value]) => {
+    try {
+        if (!el.isConnected || el.disabled || el.readOnly) return false;
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.dispatchEvent(new FocusEvent('blur'));
+        el.dispatchEvent(new FocusEvent('focusout', {bubbles: true}));
+        return el.value === value;
+    } catch (e) {
+        return false;
+    }
+})'''
+
+# Input types whose value is plain text that can be set directly
+_PLAIN_TEXT_TYPES = {'text', 'email', 'tel', 'url', 'number', 'search', 'password', 'textarea'}
 
 
 class FormDetector:
@@ -8,17 +68,32 @@ class FormDetector:
 
     def __init__(self, page: Page):
         self.page = page
+        # Time spent inferring field purposes (included in detection time)
+        self.classify_seconds = 0.0
 
     async def detect_all_inputs(self) -> List[Dict[str, Any]]:
         """Detect all input fields on the page."""
-        inputs = []
+        self.classify_seconds = 0.0
 
         # Get all input elements
         input_elements = await self.page.query_selector_all('input, textarea, select')
+        return await self.detect_inputs(dict(enumerate(input_elements)))
+
+    async def detect_inputs(self, elements: Dict[Any, ElementHandle]) -> List[Dict[str, Any]]:
+        """
+        Detect the given input fields (e.g. the ones a FieldWatcher reported).
 
-        for element in input_elements:
+        Args:
+            elements: Key -> element; each field's key is kept as field['key']
+
+        Returns:
+            Field dicts, in the order of `elements`
+        """
+        inputs = []
+        for key, element in elements.items():
             field_info = await self._analyze_input_field(element)
             if field_info:
+                field_info['key'] = key
                 inputs.append(field_info)
 
         return inputs
@@ -26,18 +101,21 @@ class FormDetector:
     async def _analyze_input_field(self, element: ElementHandle) -> Optional[Dict[str, Any]]:
         """Analyze a single input field to determine its purpose."""
         try:
-            tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-            input_type = await element.evaluate('el => el.type || "text"')
-            name = await element.evaluate('el => el.name || ""')
-            id_attr = await element.evaluate('el => el.id || ""')
-            placeholder = await element.evaluate('el => el.placeholder || ""')
-            label_text = await self._get_associated_label(element)
-            required = await element.evaluate('el => el.required')
+            info = await element.evaluate(_FIELD_INFO_JS)
+            tag_name = info['tag']
+            input_type = info['type']
+            name = info['name']
+            id_attr = info['id']
+            placeholder = info['placeholder']
+            label_text = info['label']
+            required = info['required']
 
             # Determine field purpose based on attributes
+            classify_start = time.perf_counter()
             field_purpose = self._infer_field_purpose(
                 name, id_attr, placeholder, label_text, input_type
             )
+            self.classify_seconds += time.perf_counter() - classify_start
 
             # Log detected field info for debugging
             print(f"  [DEBUG] Detected field: tag='{tag_name}', type='{input_type}', name='{name}', id='{id_attr}', "
@@ -52,31 +130,17 @@ class FormDetector:
                 'label': label_text,
                 'required': required,
                 'purpose': field_purpose,
+                'visible': info['visible'],
+                'custom_widget': info['custom'],
+                # Fills act on this element directly; the selector is a fallback
+                # for when the page re-rendered it
+                'element': element,
                 'selector': (f'[id="{id_attr}"]' if id_attr and (id_attr[0].isdigit() or ':' in id_attr or '.' in id_attr) else f'#{id_attr}') if id_attr else f'[name="{name}"]' if name else None
             }
         except Exception as e:
             print(f"Error analyzing input field: {e}")
             return None
 
-    async def _get_associated_label(self, element: ElementHandle) -> str:
-        """Get the label associated with an input field."""
-        try:
-            # Try to find label by 'for' attribute
-            id_attr = await element.evaluate('el => el.id')
-            if id_attr:
-                label = await self.page.query_selector(f'label[for="{id_attr}"]')
-                if label:
-                    return await label.inner_text()
-
-            # Try to find parent label
-            label = await element.evaluate('''el => {
-                const label = el.closest('label');
-                return label ? label.innerText : '';
-            }''')
-            return label.strip()
-        except:
-            return ""
-
     def _infer_field_purpose(self, name: str, id_attr: str, placeholder: str,
                             label: str, input_type: str) -> str:
         """Infer the purpose of a field based on its attributes."""
@@ -176,6 +240,112 @@ class FormDetector:
         return 'unknown'
 
 
+# Page side of FieldWatcher. Fields get a numeric key the first time they are
+# seen; a signature of their attributes and visibility tells when they changed.
+# The MutationObserver only collects the subtrees that were touched; they are
+# scanned when changes are taken. Returns {meta: {reset, removed: [key, ...]},
+# f<key>: element, ...} for the fields that are new, changed or newly visible.
+_FIELD_WATCH_JS = '''() => {''' + DEEP_QUERY_JS + '''
+    const FIELDS = 'input, textarea, select';
+    const visible = el => Boolean(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const signature = el => [el.getAttribute('type'), el.getAttribute('name'), el.id,
+                             el.getAttribute('placeholder'), el.disabled, visible(el)].join('|');
+    let watcher = window.__autofillWatcher;
+    const reset = !watcher;
+    if (reset) {
+        watcher = window.__autofillWatcher = {nextKey: 1, known: new Map(), touched: new Set()};
+        watcher.observer = new MutationObserver(mutations => {
+            for (const m of mutations) {
+                if (m.type === 'attributes') watcher.touched.add(m.target);
+                for (const node of m.addedNodes) {
+                    if (node.nodeType === Node.ELEMENT_NODE) watcher.touched.add(node);
+                }
+            }
+        });
+        watcher.observer.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true,
+            attributeFilter: ['type', 'name', 'id', 'placeholder', 'disabled', 'hidden',
+                              'style', 'class', 'aria-hidden']
+        });
+    }
+
+    const candidates = new Set();
+    const roots = reset ? [document] : Array.from(watcher.touched);
+    watcher.touched.clear();
+    for (const root of roots) {
+        if (root !== document && !root.isConnected) continue;
+        if (root.matches && root.matches(FIELDS)) candidates.add(root);
+        for (const el of deepQueryAll(root, FIELDS)) candidates.add(el);
+    }
+
+    const removed = [];
+    const result = {meta: {reset, removed}};
+    for (const el of candidates) {
+        const sig = signature(el);
+        const isNew = el.__autofillKey === undefined;
+        if (isNew) {
+            el.__autofillKey = watcher.nextKey++;
+            watcher.known.set(el.__autofillKey, el);
+        } else if (sig === el.__autofillSignature) {
+            continue;
+        }
+        el.__autofillSignature = sig;
+        // The first scan reports every field; later ones only those that can be filled
+        if (reset || visible(el)) result['f' + el.__autofillKey] = el;
+        else removed.push(el.__autofillKey);
+    }
+    for (const [key, el] of watcher.known) {
+        if (!el.isConnected) {
+            watcher.known.delete(key);
+            removed.push(key);
+        }
+    }
+    return result;
+}'''
+
+
+class FieldWatcher:
+    """
+    Report the fields of a page that appeared, changed or disappeared since
+    the last look, so a form can be re-detected incrementally (conditional
+    questions, wizard steps) instead of re-scanning every field.
+
+    A MutationObserver installed in the page records which subtrees changed;
+    `changes()` scans only those. If the page navigated (the observer is
+    gone), it starts over and reports every field with `reset` set. Fields
+    inside shadow roots are found by the first scan but not watched.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.generation = 0
+
+    async def changes(self) -> Dict[str, Any]:
+        """
+        Fields changed since the last call (every field on the first call).
+
+        Returns:
+            Dict with `fields` (key -> element handle of new, changed or newly
+            visible fields), `removed` (keys of fields that were removed or
+            hidden) and `reset` (True if the watcher was (re)installed, e.g.
+            after a navigation, so `fields` holds every field of the page).
+            Keys are (generation, number) pairs, unique across navigations.
+        """
+        result = await self.page.evaluate_handle(_FIELD_WATCH_JS)
+        try:
+            properties = await result.get_properties()
+            meta = await properties.pop('meta').json_value()
+        finally:
+            await result.dispose()
+        if meta['reset']:
+            # Keys restart on a new document; keep them apart from the last one's
+            self.generation += 1
+        fields = {(self.generation, int(name[1:])): handle.as_element()
+                  for name, handle in properties.items() if handle.as_element() is not None}
+        return {'fields': fields, 'removed': [(self.generation, key) for key in meta['removed']],
+                'reset': meta['reset']}
+
+
 class FormFiller:
     """Fill forms automatically based on user profile.
 
@@ -183,272 +353,393 @@ class FormFiller:
     ambiguous questions.
     """
 
-    def __init__(self, page: Page, profile: Dict[str, Any], agent: Optional[Any] = None):
+    # How long to let the page react to fills before looking for new fields (ms)
+    SETTLE_MS = 300
+
+    def __init__(self, page: Page, profile: Dict[str, Any], agent: Optional[Any] = None,
+                 snapshot: Optional[ProfileSnapshot] = None, bulk_fill: bool = True):
+        """
+        Args:
+            page: Page with the form
+            profile: Profile to fill from
+            agent: Optional agent for open-ended questions
+            snapshot: Compiled profile (defaults to compiling `profile`);
+                pass ProfileManager.snapshot() to share it
+            bulk_fill: Set all plain text fields that are filled from the
+                profile in one evaluate, instead of one page.fill per field
+                (custom widgets and fields that reject the value are still
+                filled one by one)
+        """
         self.page = page
         self.profile = profile
+        self.snapshot = snapshot or ProfileSnapshot.build(profile)
+        self.bulk_fill = bulk_fill
         self.detector = FormDetector(page)
+        # Reports fields that appear or change after the first pass
+        self.watcher = FieldWatcher(page)
         self.agent = agent
+        # Phase timings of the last auto_fill_form run, in milliseconds
+        self.timings: Dict[str, float] = {}
+        self._agent_seconds = 0.0
+        self._prompt_seconds = 0.0
+        self._detect_seconds = 0.0
+        self._fill_elapsed = 0.0
+        # field key -> (outcome, entry) of every field seen this session
+        self._outcomes: Dict[Any, Tuple[str, Any]] = {}
+
+    async def _ask_agent(self, question: str) -> Optional[str]:
+        """Ask the agent a question and return its answer, timing the call."""
+        start = time.perf_counter()
+        try:
+            resp = await self.agent.answer_question(question)
+        finally:
+            self._agent_seconds += time.perf_counter() - start
+        return resp.get('answer') if isinstance(resp, dict) else str(resp)
+
+    def _prompt(self, message: str) -> str:
+        """Ask the user on the terminal; time spent waiting is excluded from fill timing."""
+        start = time.perf_counter()
+        try:
+            return input(message)
+        finally:
+            self._prompt_seconds += time.perf_counter() - start
 
-    async def auto_fill_form(self, interactive: bool = True) -> Dict[str, Any]:
+    async def auto_fill_form(self, interactive: bool = True, watch: bool = True,
+                             max_rounds: int = 10) -> Dict[str, Any]:
         """
         Automatically detect and fill form fields.
 
         Args:
             interactive: If True, ask user for yes/no questions
+            watch: After filling, keep filling the fields that appear or change
+                in response (conditional questions) until the form is stable
+            max_rounds: Most follow-up rounds when watching
 
         Returns:
             Dictionary with fill status and unfilled fields
         """
+        self._agent_seconds = 0.0
+        self._prompt_seconds = 0.0
+        self._detect_seconds = 0.0
+        self._fill_elapsed = 0.0
+        self.detector.classify_seconds = 0.0
+        self._outcomes = {}
+
+        if watch:
+            try:
+                # The first look installs the watcher and reports every field
+                changes = await self._watch_changes()
+            except Exception as e:
+                print(f"Warning: Could not watch the form for changes, detecting once: {e}")
+            else:
+                await self._fill_changes(changes, interactive)
+                return await self.fill_until_stable(interactive, max_rounds)
+
+        detect_start = time.perf_counter()
         fields = await self.detector.detect_all_inputs()
-        filled_fields = []
-        unfilled_fields = []
-        skipped_fields = []
-        user_answered_fields = []
+        self._detect_seconds += time.perf_counter() - detect_start
+        await self._fill_fields(fields, interactive)
+        return self._results()
+
+    async def fill_until_stable(self, interactive: bool = True, max_rounds: int = 10) -> Dict[str, Any]:
+        """
+        Fill the fields that appeared or changed since the last look, until no
+        more do (call after a step transition of a multi-page form, too).
 
+        Returns:
+            Results of the whole session (see auto_fill_form)
+        """
+        for _ in range(max_rounds):
+            # Give the page a moment to react to the last fills
+            await self.page.wait_for_timeout(self.SETTLE_MS)
+            try:
+                changes = await self._watch_changes()
+            except Exception as e:
+                # Fields already filled stay filled; report what this session did
+                print(f"Warning: Stopped watching the form for changes: {e}")
+                break
+            if not await self._fill_changes(changes, interactive):
+                break
+        return self._results()
+
+    async def _watch_changes(self) -> Dict[str, Any]:
+        """Fields the watcher reports as added or removed since the last look."""
+        detect_start = time.perf_counter()
+        try:
+            return await self.watcher.changes()
+        finally:
+            self._detect_seconds += time.perf_counter() - detect_start
+
+    async def _fill_changes(self, changes: Dict[str, Any], interactive: bool) -> int:
+        """Detect and fill what the watcher reported; returns how many fields it reported."""
+        detect_start = time.perf_counter()
+        for key in changes['removed']:
+            # A question that went away no longer needs an answer; filled ones stay counted
+            if self._outcomes.get(key, ('',))[0] == 'unfilled':
+                del self._outcomes[key]
+        fields = await self.detector.detect_inputs(changes['fields'])
+        self._detect_seconds += time.perf_counter() - detect_start
+        await self._fill_fields(fields, interactive)
+        return len(changes['fields']) + len(changes['removed'])
+
+    async def _fill_fields(self, fields: List[Dict[str, Any]], interactive: bool):
+        fill_start = time.perf_counter()
+        bulk = []
         for field in fields:
+            value = self._bulk_value(field, interactive)
+            if value is not None:
+                # Keeps the field's place in the results until the bulk fill lands
+                self._outcomes[field['key']] = self._unfilled(field)
+                bulk.append((field, value))
+                continue
+            # A re-detected field replaces its earlier outcome
+            self._outcomes[field['key']] = await self._process_field(field, interactive)
+
+        if bulk:
             try:
-                # Handle EEOC fields - auto-select "Decline to self-identify"
-                if field['purpose'] == 'eeoc_decline':
+                injected = await self.page.evaluate(
+                    _BULK_FILL_JS, [[field['element'], value] for field, value in bulk])
+            except Exception as e:
+                print(f"Warning: Bulk fill failed, filling fields one by one: {e}")
+                injected = [False] * len(bulk)
+            print(f"  Filled {sum(injected)} of {len(bulk)} text fields in one pass")
+            for (field, _), ok in zip(bulk, injected):
+                self._outcomes[field['key']] = (
+                    ('filled', field['purpose']) if ok else await self._process_field(field, interactive))
+        self._fill_elapsed += time.perf_counter() - fill_start
+
+    def _bulk_value(self, field: Dict[str, Any], interactive: bool) -> Optional[str]:
+        """Profile value of a plain text field that can be set in the bulk fill, else None."""
+        if not self.bulk_fill or field.get('element') is None or not field.get('visible', True):
+            return None
+        if field.get('custom_widget') or field['purpose'] in ('eeoc_decline', 'skip_optional'):
+            return None
+        if field['purpose'] == 'ask_yes_no' and interactive:
+            return None
+        plain = field['tag'] == 'textarea' or (field['tag'] == 'input' and field['type'] in _PLAIN_TEXT_TYPES)
+        value = self._get_value_for_field(field['purpose']) if plain else None
+        return str(value) if value else None
+
+    def _results(self) -> Dict[str, Any]:
+        """Summary of the outcomes of every field seen in this session."""
+        results = {'filled': [], 'unfilled': [], 'skipped': [], 'user_answered': []}
+        for category, entry in self._outcomes.values():
+            results[category].append(entry)
+
+        fill_seconds = self._fill_elapsed - self._agent_seconds - self._prompt_seconds
+        self.timings = {
+            'detect': (self._detect_seconds - self.detector.classify_seconds) * 1000,
+            'classify': self.detector.classify_seconds * 1000,
+            'fill': fill_seconds * 1000,
+            'agent': self._agent_seconds * 1000
+        }
+
+        return {
+            'timings': self.timings,
+            'total_fields': len(self._outcomes),
+            'filled_count': len(results['filled']),
+            'unfilled_count': len(results['unfilled']),
+            'skipped_count': len(results['skipped']),
+            'user_answered_count': len(results['user_answered']),
+            'filled_fields': results['filled'],
+            'unfilled_fields': results['unfilled'],
+            'skipped_fields': results['skipped'],
+            'user_answered_fields': results['user_answered']
+        }
+
+    @staticmethod
+    def _unfilled(field: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        return 'unfilled', {
+            'purpose': field['purpose'],
+            'label': field['label'],
+            'name': field['name'],
+            'required': field['required']
+        }
+
+    async def _process_field(self, field: Dict[str, Any], interactive: bool) -> Tuple[str, Any]:
+        """
+        Fill one detected field.
+
+        Returns:
+            (outcome, entry): 'filled' with the purpose, 'skipped' or
+            'user_answered' with the field's label, or 'unfilled' with the field
+        """
+        try:
+            # Handle EEOC fields - auto-select "Decline to self-identify"
+            if field['purpose'] == 'eeoc_decline':
+                try:
+                    # Find and check the "Decline to self-identify" option in this field group
+                    element = await self._element(field)
+                    if element:
+                        # The radio comes back as a handle: ids like ':r1:' or '2-decline'
+                        # are not valid CSS selectors
+                        decline = await element.evaluate_handle('''el => {
+                            let group = el;
+                            // Go up to find the fieldset or container
+                            while (group && group.tagName !== 'FIELDSET' && String(group.className).indexOf('field') === -1) {
+                                group = group.parentElement;
+                            }
+                            group = group || el.parentElement;
+                            if (!group) return null;
+                            for (const radio of group.querySelectorAll('input[type="radio"]')) {
+                                const label = radio.parentElement?.textContent || '';
+                                const ariaLabel = radio.getAttribute('aria-label') || '';
+                                if (label.toLowerCase().includes('decline') || ariaLabel.toLowerCase().includes('decline')) {
+                                    return radio;
+                                }
+                            }
+                            return null;
+                        }''')
+                        radio = decline.as_element()
+                        if radio:
+                            try:
+                                await radio.check(timeout=3000)
+                                return 'skipped', f"{field['label'] or field['name']} (auto-declined)"
+                            except Exception as e:
+                                print(f"Warning: Could not check decline option: {e}")
+                        else:
+                            await decline.dispose()
+                except Exception as e:
+                    print(f"Warning: Could not handle EEOC field: {e}")
+
+                return 'skipped', field['label'] or field['name'] or 'unknown'
+
+            # Skip optional fields we don't have data for
+            if field['purpose'] == 'skip_optional':
+                return 'skipped', field['label'] or field['name'] or 'unknown'
+
+            # Ask user for yes/no questions
+            if field['purpose'] == 'ask_yes_no' and interactive:
+                question_text = field['label'] or field['placeholder'] or field['name']
+                print(f"\n❓ Question: {question_text}")
+
+                # Detect if it's a dropdown or radio/text
+                if field['tag'] == 'select':
+                    # It's a dropdown - get options
                     try:
-                        # Find and check the "Decline to self-identify" option in this field group
-                        element = await self.page.query_selector(field['selector'])
+                        element = await self._element(field)
                         if element:
-                            # Look for decline option in the form (usually in same field group)
-                            # First, try to find by checking all radio options and their labels
-                            parent_group = await element.evaluate('''el => {
-                                let parent = el;
-                                // Go up to find the fieldset or container
-                                while (parent && parent.tagName !== 'FIELDSET' && parent.className.indexOf('field') === -1) {
-                                    parent = parent.parentElement;
-                                }
-                                return parent || el.parentElement;
-                            }''')
-                            
-                            if parent_group:
-                                # Find all radio inputs and check for decline text
-                                decline_found = await self.page.evaluate('''groupEl => {
-                                    const radios = groupEl.querySelectorAll('input[type="radio"]');
-                                    for (let radio of radios) {
-                                        const label = radio.parentElement?.textContent || '';
-                                        const ariaLabel = radio.getAttribute('aria-label') || '';
-                                        if (label.toLowerCase().includes('decline') || ariaLabel.toLowerCase().includes('decline')) {
-                                            return radio.id || radio.getAttribute('id');
-                                        }
-                                    }
-                                    return null;
-                                }''', parent_group)
-                                
-                                if decline_found:
-                                    try:
-                                        await self.page.check(f'#{decline_found}', timeout=3000)
-                                        skipped_fields.append(f"{field['label'] or field['name']} (auto-declined)")
-                                        continue
-                                    except Exception as e:
-                                        print(f"Warning: Could not check decline option: {e}")
-                    except Exception as e:
-                        print(f"Warning: Could not handle EEOC field: {e}")
-                    
-                    skipped_fields.append(field['label'] or field['name'] or 'unknown')
-                    continue
-                
-                # Skip optional fields we don't have data for
-                if field['purpose'] == 'skip_optional':
-                    skipped_fields.append(field['label'] or field['name'] or 'unknown')
-                    continue
-
-                # Ask user for yes/no questions
-                if field['purpose'] == 'ask_yes_no' and interactive:
-                    question_text = field['label'] or field['placeholder'] or field['name']
-                    print(f"\n❓ Question: {question_text}")
-
-                    # Detect if it's a dropdown or radio/text
-                    if field['tag'] == 'select':
-                        # It's a dropdown - get options
-                        try:
-                            element = await self.page.query_selector(field['selector'])
-                            if element:
-                                options_text = await element.inner_text()
-                                print(f"   Options: Yes / No (or similar)")
-                        except:
-                            pass
+                            options_text = await element.inner_text()
+                            print(f"   Options: Yes / No (or similar)")
+                    except:
+                        pass
 
-                        user_input = input("   Your answer (yes/no): ").strip().lower()
+                    user_input = self._prompt("   Your answer (yes/no): ").strip().lower()
 
-                        # Try to select the appropriate option
-                        if user_input in ['yes', 'y']:
+                    # Try to select the appropriate option
+                    if user_input in ['yes', 'y']:
+                        try:
+                            await (await self._element(field)).select_option(label='Yes', timeout=2000)
+                            return 'user_answered', question_text
+                        except:
                             try:
-                                await self.page.select_option(field['selector'], label='Yes', timeout=2000)
-                                user_answered_fields.append(question_text)
-                                continue
+                                await (await self._element(field)).select_option(value='Yes', timeout=2000)
+                                return 'user_answered', question_text
                             except:
-                                try:
-                                    await self.page.select_option(field['selector'], value='Yes', timeout=2000)
-                                    user_answered_fields.append(question_text)
-                                    continue
-                                except:
-                                    pass
-                        elif user_input in ['no', 'n']:
+                                pass
+                    elif user_input in ['no', 'n']:
+                        try:
+                            await (await self._element(field)).select_option(label='No', timeout=2000)
+                            return 'user_answered', question_text
+                        except:
                             try:
-                                await self.page.select_option(field['selector'], label='No', timeout=2000)
-                                user_answered_fields.append(question_text)
-                                continue
+                                await (await self._element(field)).select_option(value='No', timeout=2000)
+                                return 'user_answered', question_text
                             except:
-                                try:
-                                    await self.page.select_option(field['selector'], value='No', timeout=2000)
-                                    user_answered_fields.append(question_text)
-                                    continue
-                                except:
-                                    pass
-
-                        # If selection failed, let user handle it manually
-                        print(f"   ⚠️  Could not auto-select. Please select manually in the browser.")
-                        unfilled_fields.append({
-                            'purpose': field['purpose'],
-                            'label': field['label'],
-                            'name': field['name'],
-                            'required': field['required']
-                        })
-                    else:
-                        # It's a text field - just fill the answer
-                        user_input = input("   Your answer: ").strip()
-                        if user_input:
-                            await self._fill_field(field, user_input)
-                            user_answered_fields.append(question_text)
-                        else:
-                            # If user skipped and an agent is available, ask the agent
-                            if self.agent:
-                                try:
-                                    resp = await self.agent.answer_question(question_text)
-                                    answer = resp.get('answer') if isinstance(resp, dict) else str(resp)
-                                    if answer:
-                                        await self._fill_field(field, answer)
-                                        user_answered_fields.append(question_text)
-                                        continue
-                                except Exception:
-                                    pass
-
-                            unfilled_fields.append({
-                                'purpose': field['purpose'],
-                                'label': field['label'],
-                                'name': field['name'],
-                                'required': field['required']
-                            })
-                    continue
-
-                value = self._get_value_for_field(field['purpose'])
-
-                if value and field['selector']:
-                    await self._fill_field(field, value)
-                    filled_fields.append(field['purpose'])
+                                pass
+
+                    # If selection failed, let user handle it manually
+                    print(f"   ⚠️  Could not auto-select. Please select manually in the browser.")
+                    return self._unfilled(field)
                 else:
-                    # Try agent for fields we couldn't fill from profile (skip files/passwords)
-                    if self.agent and field.get('label') and field['selector'] and field['type'] not in ['file', 'password']:
+                    # It's a text field - just fill the answer
+                    user_input = self._prompt("   Your answer: ").strip()
+                    if user_input:
+                        await self._fill_field(field, user_input)
+                        return 'user_answered', question_text
+                    # If user skipped and an agent is available, ask the agent
+                    if self.agent:
                         try:
-                            resp = await self.agent.answer_question(field['label'])
-                            answer = resp.get('answer') if isinstance(resp, dict) else str(resp)
+                            answer = await self._ask_agent(question_text)
                             if answer:
                                 await self._fill_field(field, answer)
-                                filled_fields.append(field['purpose'])
-                                continue
-                        except Exception as e:
-                            print(f"Agent error: {e}")
-
-                    unfilled_fields.append({
-                        'purpose': field['purpose'],
-                        'label': field['label'],
-                        'name': field['name'],
-                        'required': field['required']
-                    })
-            except Exception as e:
-                print(f"Error filling field {field['purpose']}: {e}")
-                unfilled_fields.append(field)
+                                return 'user_answered', question_text
+                        except Exception:
+                            pass
 
-        return {
-            'total_fields': len(fields),
-            'filled_count': len(filled_fields),
-            'unfilled_count': len(unfilled_fields),
-            'skipped_count': len(skipped_fields),
-            'user_answered_count': len(user_answered_fields),
-            'filled_fields': filled_fields,
-            'unfilled_fields': unfilled_fields,
-            'skipped_fields': skipped_fields,
-            'user_answered_fields': user_answered_fields
-        }
+                    return self._unfilled(field)
+
+            value = self._get_value_for_field(field['purpose'])
+
+            if value and (field['selector'] or field.get('element')):
+                await self._fill_field(field, value)
+                return 'filled', field['purpose']
+
+            # Try agent for fields we couldn't fill from profile (skip files/passwords)
+            if self.agent and field.get('label') and (field['selector'] or field.get('element')) and field['type'] not in ['file', 'password']:
+                try:
+                    answer = await self._ask_agent(field['label'])
+                    if answer:
+                        await self._fill_field(field, answer)
+                        return 'filled', field['purpose']
+                except Exception as e:
+                    print(f"Agent error: {e}")
+
+            return self._unfilled(field)
+        except Exception as e:
+            print(f"Error filling field {field['purpose']}: {e}")
+            # Without the element handle, so results can be pickled and logged
+            return 'unfilled', {k: v for k, v in field.items() if k != 'element'}
 
     def _get_value_for_field(self, field_purpose: str) -> Optional[str]:
         """Get the appropriate value from profile for a field."""
-        personal_info = self.profile.get('personal_info', {})
-        address = personal_info.get('address', {})
-
-        field_mapping = {
-            'first_name': personal_info.get('first_name'),
-            'last_name': personal_info.get('last_name'),
-            'middle_name': '',  # Most people don't have middle name
-            'preferred_name': personal_info.get('first_name'),
-            'full_name': f"{personal_info.get('first_name', '')} {personal_info.get('last_name', '')}".strip(),
-            'email': personal_info.get('email'),
-            'phone': personal_info.get('phone'),
-            'address': address.get('street'),
-            'city': address.get('city'),
-            'state': address.get('state'),
-            'zip': address.get('zip'),
-            'country': address.get('country', 'USA'),
-            'linkedin': personal_info.get('linkedin'),
-            'github': personal_info.get('github'),
-            'portfolio': personal_info.get('portfolio'),
-        }
+        return self.snapshot.field_values.get(field_purpose)
 
-        # Get education info if available
-        if self.profile.get('education'):
-            latest_edu = self.profile['education'][0]
-            field_mapping.update({
-                'university': latest_edu.get('school'),
-                'degree': latest_edu.get('degree'),
-                'major': latest_edu.get('major'),
-                'gpa': str(latest_edu.get('gpa', '')),
-                'graduation': latest_edu.get('end_date'),
-            })
-
-        # Handle file uploads
-        documents = self.profile.get('documents', {})
-        field_mapping.update({
-            'resume': documents.get('resume_path'),
-            'cover_letter': documents.get('cover_letter_template'),
-            'transcript': documents.get('transcript_path'),
-        })
-
-        return field_mapping.get(field_purpose)
+    async def _element(self, field: Dict[str, Any], refresh: bool = False) -> ElementHandle:
+        """
+        The field's element from detection, or looked up by its selector if it
+        has none or `refresh` is set (the page re-rendered it).
+        """
+        element = None if refresh else field.get('element')
+        if element is None:
+            element = await self.page.query_selector(field['selector']) if field.get('selector') else None
+            if not element:
+                raise Exception(f"Element not found: {field.get('selector')}")
+            field['element'] = element
+        return element
 
     async def _fill_field(self, field: Dict[str, Any], value: str):
         """Fill a specific field based on its type."""
-        selector = field['selector']
-
-        # Check if field is visible before trying to fill
         try:
-            element = await self.page.query_selector(selector)
-            if not element:
-                raise Exception(f"Element not found: {selector}")
-
-            is_visible = await element.is_visible()
-            if not is_visible:
-                raise Exception(f"Element not visible: {selector}")
-
-            if field['tag'] == 'select':
-                # Handle dropdown
-                await self.page.select_option(selector, value, timeout=5000)
-            elif field['type'] == 'file':
-                # Handle file upload
-                if value:  # Only upload if file path exists
-                    await self.page.set_input_files(selector, value, timeout=5000)
-            elif field['type'] == 'checkbox':
-                # Handle checkbox
-                if value.lower() in ['true', 'yes', '1']:
-                    await self.page.check(selector, timeout=5000)
-            elif field['type'] == 'radio':
-                # Handle radio button
-                await self.page.check(selector, timeout=5000)
-            else:
-                # Handle text inputs
-                await self.page.fill(selector, str(value), timeout=5000)
+            # Visibility was checked at detection (the watcher re-detects fields that appear)
+            if not field.get('visible', True):
+                raise Exception(f"Element not visible: {field['selector']}")
+            try:
+                await self._fill_element(await self._element(field), field, value)
+            except Exception as e:
+                if 'not attached' not in str(e) or not field.get('selector'):
+                    raise
+                # Re-rendered since detection: act on the current element instead
+                await self._fill_element(await self._element(field, refresh=True), field, value)
         except Exception as e:
             raise Exception(f"Failed to fill field {field['purpose']}: {str(e)}")
+
+    @staticmethod
+    async def _fill_element(element: ElementHandle, field: Dict[str, Any], value: str):
+        if field['tag'] == 'select':
+            # Handle dropdown
+            await element.select_option(value, timeout=5000)
+        elif field['type'] == 'file':
+            # Handle file upload
+            if value:  # Only upload if file path exists
+                await element.set_input_files(value, timeout=5000)
+        elif field['type'] == 'checkbox':
+            # Handle checkbox
+            if value.lower() in ['true', 'yes', '1']:
+                await element.check(timeout=5000)
+        elif field['type'] == 'radio':
+            # Handle radio button
+            await element.check(timeout=5000)
+        else:
+            # Handle text inputs
+            await element.fill(str(value), timeout=5000)
@@ -3,7 +3,9 @@ import asyncio
 import json
 import re
 import numpy as np
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
+
+from .profile_snapshot import ProfileSnapshot, as_snapshot
 
 try:
     import tensorflow as tf
@@ -25,34 +27,11 @@ class TensorFlowClient:
         self.model = hub.load("https://tfhub.dev/google/universal-sentence-encoder/4")
         print("✅ TensorFlow model loaded.")
 
-    def _flatten_profile(self, profile: Dict[str, Any]) -> List[str]:
-        """Convert nested profile dict into a list of 'key: value' fact strings."""
-        facts = []
-        
-        def recurse(data, prefix=""):
-            if isinstance(data, dict):
-                for k, v in data.items():
-                    # clean key
-                    clean_k = k.replace('_', ' ')
-                    new_prefix = f"{prefix} {clean_k}" if prefix else clean_k
-                    recurse(v, new_prefix)
-            elif isinstance(data, list):
-                for item in data:
-                    recurse(item, prefix)
-            elif data is not None and str(data).strip():
-                # It's a leaf value
-                facts.append(f"{prefix}: {data}")
-                
-        recurse(profile)
-        # Add some combined/synthetic facts for better matching
-        p = profile.get('personal_info', {})
-        if p:
-            facts.append(f"My full name is {p.get('first_name', '')} {p.get('last_name', '')}")
-            facts.append(f"I live in {p.get('address', {}).get('city', '')}, {p.get('address', {}).get('state', '')}")
-            
-        return facts
+    def _flatten_profile(self, profile: Union[Dict[str, Any], ProfileSnapshot]) -> List[str]:
+        """Convert a profile into a list of 'key: value' fact strings (plus synthetic facts)."""
+        return list(as_snapshot(profile).all_facts)
 
-    async def generate(self, profile: Dict[str, Any], question: str, **kwargs) -> dict:
+    async def generate(self, profile: Union[Dict[str, Any], ProfileSnapshot], question: str, **kwargs) -> dict:
         """
         Finds the best matching fact from the profile for the given question.
         Returns empty answer if confidence is too low or question is about fields we shouldn't fill.
@@ -74,23 +53,23 @@ class TensorFlowClient:
                 return {"answer": "", "score": 0, "skipped": True}
         
         # 1. Flatten profile into candidate answers
-        candidates = self._flatten_profile(profile)
+        snapshot = as_snapshot(profile)
+        candidates = list(snapshot.all_facts)
         if not candidates:
             return {"answer": "I don't have enough information in my profile."}
 
         # 2. Run inference in a separate thread (CPU bound)
         def _inference():
-            # Embed the question
-            # Embed all candidates
-            all_text = [question] + candidates
-            embeddings = self.model(all_text)
+            # Embed all candidates once per profile version, then just the question
+            cand_vecs = snapshot.cache.get('fact_embeddings')
+            if cand_vecs is None:
+                cand_vecs = snapshot.cache['fact_embeddings'] = self.model(candidates)
             
             # Calculate cosine similarity (dot product for normalized vectors)
             # USE vectors are approximately normalized, but let's be safe if we want strict cosine
             # The raw outputs of USE are already normalized to length 1 usually.
             
-            q_vec = embeddings[0]
-            cand_vecs = embeddings[1:]
+            q_vec = self.model([question])[0]
             
             # Scores = dot product of q_vec with every cand_vec
             scores = tf.tensordot(cand_vecs, q_vec, axes=1)
@@ -0,0 +1,145 @@
+from playwright.async_api import Page, Frame
+from typing import Dict, Any, Optional
+
+# `deepQueryAll(root, selector)`: matching elements in document order,
+# including those in open shadow roots (like Playwright's CSS selectors).
+# Prepended to page scripts that look for inputs or buttons.
+DEEP_QUERY_JS = '''
+    const deepQueryAll = (root, selector, found = []) => {
+        for (const el of root.querySelectorAll('*')) {
+            if (el.matches(selector)) found.push(el);
+            if (el.shadowRoot) deepQueryAll(el.shadowRoot, selector, found);
+        }
+        return found;
+    };
+'''
+
+# Phrases looked for in the page text, by signal
+TEXT_KEYWORDS = {
+    'signup': ['create account', 'sign up', 'register', 'new user', 'create profile',
+               'get started', 'join us', 'registration'],
+    'login': ['log in', 'login', 'sign in', 'signin'],
+    'closed': ['no longer accepting', 'no longer available', 'no longer open',
+               'position has been filled', 'job has expired', 'posting has closed',
+               'job is closed', 'page you are looking for doesn'],
+    'blocked': ['verify you are human', 'are you a robot', 'unusual traffic',
+                'checking your browser', 'access denied', 'complete the security check'],
+    'application': ['apply', 'resume', 'cover letter', 'application'],
+}
+
+# Markers in the URL, by signal
+URL_KEYWORDS = {
+    'signup': ['signup', 'register', 'create-account', 'join'],
+    'login': ['login', 'signin', 'auth'],
+}
+
+# Text signals plus input counts, gathered in one pass over the page
+_FEATURES_JS = '''keywords => {''' + DEEP_QUERY_JS + '''
+    const text = (document.body ? document.body.innerText : '').toLowerCase();
+    const matched = {};
+    for (const [signal, phrases] of Object.entries(keywords)) {
+        matched[signal] = phrases.filter(phrase => text.includes(phrase));
+    }
+    const inputs = deepQueryAll(document, 'input, textarea, select');
+    const count = predicate => inputs.filter(predicate).length;
+    const type = el => (el.getAttribute('type') || '').toLowerCase();
+    return {
+        matched,
+        password_fields: count(el => type(el) === 'password'),
+        email_fields: count(el => type(el) === 'email'),
+        username_fields: count(el => (el.getAttribute('name') || '').includes('username')),
+        file_inputs: count(el => type(el) === 'file'),
+        form_fields: count(el => !['hidden', 'submit', 'button', 'reset', 'image'].includes(type(el))),
+        captcha: deepQueryAll(document,
+            'iframe[src*="recaptcha"], iframe[src*="hcaptcha"], iframe[src*="turnstile"], ' +
+            'iframe[src*="challenges.cloudflare"], .g-recaptcha, .h-captcha, #challenge-form, ' +
+            '#cf-challenge-running').length > 0
+    };
+}'''
+
+
+def classify_features(url: str, features: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Classify a page from its URL and in-page features (see PageClassifier).
+
+    Returns:
+        Dict with the page `type` ('blocked', 'closed', 'signup', 'login',
+        'application_form' or 'other'), `is_signup` and `is_login` (which can
+        both hold on a combined page), and the features it was decided from
+    """
+    url = url.lower()
+    matched = features['matched']
+    passwords = features['password_fields']
+    fields = features['form_fields']
+    has_form = features['file_inputs'] > 0 or fields >= 3
+
+    is_signup = any(marker in url for marker in URL_KEYWORDS['signup']) or bool(
+        matched['signup'] and (passwords >= 2 or (passwords >= 1 and (
+            features['email_fields'] or features['username_fields'])))
+    )
+    is_login = any(marker in url for marker in URL_KEYWORDS['login']) or bool(
+        matched['login'] and passwords >= 1
+    )
+
+    # A CAPTCHA on a real application form is usually invisible and solved on
+    # submit; only an interstitial challenge with nothing to fill is "blocked"
+    if (features['captcha'] or matched['blocked']) and fields == 0:
+        page_type = 'blocked'
+    elif matched['closed'] and not has_form:
+        page_type = 'closed'
+    elif is_signup:
+        page_type = 'signup'
+    elif is_login:
+        page_type = 'login'
+    elif has_form or (matched['application'] and fields > 0):
+        page_type = 'application_form'
+    else:
+        page_type = 'other'
+
+    return {
+        'type': page_type,
+        'is_signup': is_signup,
+        'is_login': is_login,
+        'url': url,
+        **features
+    }
+
+
+class PageClassifier:
+    """
+    Classify the page a tab is on: login, signup, application form, closed
+    posting or blocked (CAPTCHA / bot check).
+
+    The URL and text signals and the input counts are gathered in a single
+    evaluate, and the result is cached until the page navigates, so the bot
+    and AccountCreator can ask as often as they like.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self._result: Optional[Dict[str, Any]] = None
+        page.on('framenavigated', self._on_navigated)
+
+    def _on_navigated(self, frame: Frame):
+        if frame == self.page.main_frame:
+            self._result = None
+
+    def invalidate(self):
+        """Forget the cached result (e.g. after the page re-rendered in place)."""
+        self._result = None
+
+    async def classify(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Classify the current page (cached until the next navigation).
+
+        Args:
+            refresh: Reclassify even if a result for this page is cached
+
+        Returns:
+            See classify_features
+        """
+        url = self.page.url
+        if refresh or self._result is None or self._result['url'] != url.lower():
+            features = await self.page.evaluate(_FEATURES_JS, TEXT_KEYWORDS)
+            self._result = classify_features(url, features)
+        return self._result
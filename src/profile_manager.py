@@ -1,8 +1,33 @@
 import pandas as pd
+import copy
 import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .profile_snapshot import ProfileSnapshot, profile_hash
+
+def atomic_write_text(path: Path, text: str):
+    """
+    Replace a file's contents so that readers, and the file after a crash,
+    see either the old or the new contents, never a truncated mix.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    # Make the rename itself durable (not possible on Windows)
+    if hasattr(os, 'O_DIRECTORY'):
+        fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
 
 class ProfileManager:
     """Manages user profile data for internship applications."""
@@ -10,13 +35,20 @@ class ProfileManager:
     def __init__(self, profile_path: str = "data/user_profile.json"):
         self.profile_path = Path(profile_path)
         self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+        # Serialized profile as last read or written, to skip saves that change nothing
+        self._saved_text: Optional[str] = None
+        self._batch_depth = 0
+        self._dirty = False
+        self._snapshot: Optional[ProfileSnapshot] = None
         self.profile = self._load_profile()
 
     def _load_profile(self) -> Dict[str, Any]:
         """Load user profile from JSON file."""
         if self.profile_path.exists():
             with open(self.profile_path, 'r') as f:
-                return json.load(f)
+                profile = json.load(f)
+            self._saved_text = json.dumps(profile, indent=2)
+            return profile
         return self._create_default_profile()
 
     def _create_default_profile(self) -> Dict[str, Any]:
@@ -56,13 +88,60 @@ class ProfileManager:
         }
 
     def save_profile(self):
-        """Save profile to JSON file."""
-        with open(self.profile_path, 'w') as f:
-            json.dump(self.profile, f, indent=2)
+        """
+        Save profile to JSON file.
+
+        The file is replaced atomically, and not rewritten at all if the profile
+        is unchanged since it was loaded or last saved. Inside `batch()` the
+        save is deferred until the batch ends.
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+        text = json.dumps(self.profile, indent=2)
+        if text != self._saved_text:
+            atomic_write_text(self.profile_path, text)
+            self._saved_text = text
+        self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several changes into one transaction with a single write.
+
+        Example:
+            with profile.batch():
+                profile.update_personal_info(first_name="Ada")
+                for job in jobs:
+                    profile.add_experience(**job)
+
+        If the block raises, the in-memory profile is rolled back to its state
+        before the batch and nothing is written. Batches can be nested; only the
+        outermost one saves.
+        """
+        if self._batch_depth == 0:
+            before = copy.deepcopy(self.profile)
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                # Restore in place: the bot and form filler hold references to this dict
+                self.profile.clear()
+                self.profile.update(before)
+                self._dirty = False
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self.save_profile()
 
     def update_personal_info(self, **kwargs):
         """Update personal information."""
-        self.profile["personal_info"].update(kwargs)
+        personal_info = self.profile["personal_info"]
+        if all(key in personal_info and personal_info[key] == value for key, value in kwargs.items()):
+            return
+        personal_info.update(kwargs)
         self.save_profile()
 
     def add_education(self, school: str, degree: str, major: str,
@@ -107,21 +186,24 @@ class ProfileManager:
         self.profile["projects"].append(project_entry)
         self.save_profile()
 
+    def snapshot(self) -> ProfileSnapshot:
+        """
+        Immutable compiled view of the current profile (see ProfileSnapshot).
+
+        The profile is hashed on every call (tens of microseconds), so edits
+        made directly to `self.profile` (e.g. credentials stored by
+        AccountCreator) show up right away, saved or not. It is recompiled,
+        and its version moves, only when the content actually differs.
+        """
+        content_hash = profile_hash(self.profile)
+        if self._snapshot is None or content_hash != self._snapshot.content_hash:
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            self._snapshot = ProfileSnapshot.build(self.profile, version, content_hash)
+        return self._snapshot
+
     def get_profile_summary(self) -> str:
         """Get a formatted summary of the profile."""
-        summary = f"""
-Profile Summary:
-----------------
-Name: {self.profile['personal_info']['first_name']} {self.profile['personal_info']['last_name']}
-Email: {self.profile['personal_info']['email']}
-Phone: {self.profile['personal_info']['phone']}
-
-Education: {len(self.profile['education'])} entries
-Experience: {len(self.profile['experience'])} entries
-Projects: {len(self.profile['projects'])} entries
-Skills: {', '.join(self.profile['skills']['technical'][:5])}{'...' if len(self.profile['skills']['technical']) > 5 else ''}
-"""
-        return summary.strip()
+        return self.snapshot().summary
 
     def export_to_dataframe(self, section: str) -> pd.DataFrame:
         """Export a section of the profile to pandas DataFrame."""
@@ -0,0 +1,161 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Mapping, Union
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only deep copy: dicts become mappingproxies, lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def profile_hash(profile: Dict[str, Any]) -> str:
+    """Content hash of a profile, independent of key order."""
+    text = json.dumps(profile, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _flatten(profile: Dict[str, Any]) -> Tuple[str, ...]:
+    """Nested profile as 'key: value' fact strings, in document order."""
+    facts = []
+
+    def recurse(data, prefix=""):
+        if isinstance(data, dict):
+            for k, v in data.items():
+                clean_k = k.replace('_', ' ')
+                recurse(v, f"{prefix} {clean_k}" if prefix else clean_k)
+        elif isinstance(data, list):
+            for item in data:
+                recurse(item, prefix)
+        elif data is not None and str(data).strip():
+            facts.append(f"{prefix}: {data}")
+
+    recurse(profile)
+    return tuple(facts)
+
+
+def _synthetic_facts(profile: Dict[str, Any]) -> Tuple[str, ...]:
+    """Combined facts that match natural-language questions better than single leaves."""
+    p = profile.get('personal_info', {})
+    if not p:
+        return ()
+    address = p.get('address', {})
+    return (
+        f"My full name is {p.get('first_name', '')} {p.get('last_name', '')}",
+        f"I live in {address.get('city', '')}, {address.get('state', '')}",
+    )
+
+
+def _field_values(profile: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Form field purpose (see FormDetector) -> value to fill in."""
+    personal_info = profile.get('personal_info', {})
+    address = personal_info.get('address', {})
+
+    values = {
+        'first_name': personal_info.get('first_name'),
+        'last_name': personal_info.get('last_name'),
+        'middle_name': '',  # Most people don't have middle name
+        'preferred_name': personal_info.get('first_name'),
+        'full_name': f"{personal_info.get('first_name', '')} {personal_info.get('last_name', '')}".strip(),
+        'email': personal_info.get('email'),
+        'phone': personal_info.get('phone'),
+        'address': address.get('street'),
+        'city': address.get('city'),
+        'state': address.get('state'),
+        'zip': address.get('zip'),
+        'country': address.get('country', 'USA'),
+        'linkedin': personal_info.get('linkedin'),
+        'github': personal_info.get('github'),
+        'portfolio': personal_info.get('portfolio'),
+    }
+
+    if profile.get('education'):
+        latest_edu = profile['education'][0]
+        values.update({
+            'university': latest_edu.get('school'),
+            'degree': latest_edu.get('degree'),
+            'major': latest_edu.get('major'),
+            'gpa': str(latest_edu.get('gpa', '')),
+            'graduation': latest_edu.get('end_date'),
+        })
+
+    documents = profile.get('documents', {})
+    values.update({
+        'resume': documents.get('resume_path'),
+        'cover_letter': documents.get('cover_letter_template'),
+        'transcript': documents.get('transcript_path'),
+    })
+    return values
+
+
+def _summary(profile: Dict[str, Any]) -> str:
+    p = profile.get('personal_info', {})
+    technical = profile.get('skills', {}).get('technical', [])
+    summary = f"""
+Profile Summary:
+----------------
+Name: {p.get('first_name', '')} {p.get('last_name', '')}
+Email: {p.get('email', '')}
+Phone: {p.get('phone', '')}
+
+Education: {len(profile.get('education', []))} entries
+Experience: {len(profile.get('experience', []))} entries
+Projects: {len(profile.get('projects', []))} entries
+Skills: {', '.join(technical[:5])}{'...' if len(technical) > 5 else ''}
+"""
+    return summary.strip()
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """
+    Immutable, precompiled view of a profile.
+
+    `ProfileManager.snapshot()` builds one per profile version, so consumers
+    (form filling, the retrieval agent, account creation) share the derived
+    data instead of walking the nested dict on every use. Caches of anything
+    derived from the profile can be keyed on `version` (within one manager) or
+    `content_hash` (across processes), or live in `cache`, a memo that is
+    dropped together with the snapshot when the profile changes or its
+    candidate is evicted from a ProfileStore.
+    """
+
+    version: int
+    content_hash: str
+    profile: Mapping[str, Any] = field(repr=False)
+    facts: Tuple[str, ...] = field(repr=False)
+    synthetic_facts: Tuple[str, ...] = field(repr=False)
+    field_values: Mapping[str, Optional[str]] = field(repr=False)
+    summary: str = field(repr=False)
+    cache: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def build(cls, profile: Dict[str, Any], version: int = 0,
+              content_hash: Optional[str] = None) -> 'ProfileSnapshot':
+        """Compile a profile dict into a snapshot."""
+        return cls(
+            version=version,
+            content_hash=content_hash or profile_hash(profile),
+            profile=_freeze(profile),
+            facts=_flatten(profile),
+            synthetic_facts=_synthetic_facts(profile),
+            field_values=MappingProxyType(_field_values(profile)),
+            summary=_summary(profile),
+        )
+
+    @property
+    def all_facts(self) -> Tuple[str, ...]:
+        """Profile facts followed by the synthetic ones (the agent's retrieval candidates)."""
+        return self.facts + self.synthetic_facts
+
+
+def as_snapshot(profile: Union[Dict[str, Any], ProfileSnapshot]) -> ProfileSnapshot:
+    """Accept a snapshot or a raw profile dict (compiled on the fly)."""
+    if isinstance(profile, ProfileSnapshot):
+        return profile
+    return ProfileSnapshot.build(profile)
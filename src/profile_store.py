@@ -0,0 +1,135 @@
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+
+from .application_tracker import ApplicationTracker
+from .profile_manager import ProfileManager
+from .profile_snapshot import ProfileSnapshot
+
+_CANDIDATE_ID = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]*$')
+
+
+class ProfileStore:
+    """
+    Profiles of many candidates, loaded on demand.
+
+    Each candidate has a directory under `root` with their profile and their
+    own application tracker:
+
+        data/candidates/<candidate_id>/user_profile.json
+        data/candidates/<candidate_id>/applications.csv
+
+    At most `capacity` candidates are kept in memory. The least recently used
+    one is evicted together with everything derived from it: the compiled
+    snapshot and its memo cache (embeddings, resolved values) and the open
+    tracker, which is flushed and closed.
+    """
+
+    PROFILE_FILE = "user_profile.json"
+
+    def __init__(self, root: str = "data/candidates", capacity: int = 128,
+                 tracker_file: str = "applications.csv", write_behind: bool = False):
+        """
+        Args:
+            root: Directory with one subdirectory per candidate
+            capacity: Candidates kept in memory at once
+            tracker_file: Tracker database name inside each candidate directory
+                (the suffix selects the backend, see ApplicationTracker)
+            write_behind: Open candidate trackers in write-behind mode
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.capacity = max(1, capacity)
+        self.tracker_file = tracker_file
+        self.write_behind = write_behind
+        # candidate_id -> {'profile': ProfileManager, 'tracker': Optional[ApplicationTracker]}
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _candidate_dir(self, candidate_id: str) -> Path:
+        if not isinstance(candidate_id, str) or not _CANDIDATE_ID.match(candidate_id):
+            raise ValueError(f"Invalid candidate id '{candidate_id}' (use letters, digits, '_', '-', '.')")
+        return self.root / candidate_id
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return (self._candidate_dir(candidate_id) / self.PROFILE_FILE).exists()
+
+    def candidate_ids(self) -> Iterator[str]:
+        """Ids of all stored candidates (nothing is loaded)."""
+        for entry in sorted(self.root.iterdir()):
+            if entry.is_dir() and (entry / self.PROFILE_FILE).exists():
+                yield entry.name
+
+    def create(self, candidate_id: str, profile: Optional[Dict[str, Any]] = None) -> ProfileManager:
+        """Add a candidate (with a default profile unless one is given)."""
+        if candidate_id in self:
+            raise ValueError(f"Candidate '{candidate_id}' already exists")
+        self._candidate_dir(candidate_id).mkdir(parents=True, exist_ok=True)
+        manager = self.get(candidate_id, create=True)
+        if profile is not None:
+            with manager.batch():
+                manager.profile.clear()
+                manager.profile.update(profile)
+        manager.save_profile()
+        return manager
+
+    def _entry(self, candidate_id: str, create: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._entries.get(candidate_id)
+            if entry is not None:
+                self._entries.move_to_end(candidate_id)
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            if not create and candidate_id not in self:
+                raise ValueError(f"Candidate '{candidate_id}' not found in {self.root}")
+            path = self._candidate_dir(candidate_id) / self.PROFILE_FILE
+            entry = {'profile': ProfileManager(str(path)), 'tracker': None}
+            self._entries[candidate_id] = entry
+            while len(self._entries) > self.capacity:
+                self._evict(*self._entries.popitem(last=False))
+            return entry
+
+    def _evict(self, candidate_id: str, entry: Dict[str, Any]):
+        if entry['tracker'] is not None:
+            try:
+                entry['tracker'].close()
+            except Exception as e:
+                print(f"Warning: Could not close tracker for candidate {candidate_id}: {e}")
+
+    def get(self, candidate_id: str, create: bool = False) -> ProfileManager:
+        """Profile manager of a candidate, loading it if needed."""
+        return self._entry(candidate_id, create)['profile']
+
+    def snapshot(self, candidate_id: str) -> ProfileSnapshot:
+        """Compiled profile of a candidate (see ProfileManager.snapshot)."""
+        return self.get(candidate_id).snapshot()
+
+    def tracker(self, candidate_id: str) -> ApplicationTracker:
+        """The candidate's own application tracker."""
+        with self._lock:
+            entry = self._entry(candidate_id)
+            if entry['tracker'] is None:
+                entry['tracker'] = ApplicationTracker(
+                    db_path=str(self._candidate_dir(candidate_id) / self.tracker_file),
+                    write_behind=self.write_behind
+                )
+            return entry['tracker']
+
+    def evict(self, candidate_id: str):
+        """Drop a candidate from memory (closing their tracker)."""
+        with self._lock:
+            entry = self._entries.pop(candidate_id, None)
+            if entry is not None:
+                self._evict(candidate_id, entry)
+
+    def close(self):
+        """Evict every candidate."""
+        with self._lock:
+            while self._entries:
+                self._evict(*self._entries.popitem(last=False))
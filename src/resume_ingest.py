@@ -0,0 +1,244 @@
+"""
+Bulk resume ingestion.
+
+Parses a directory tree or a manifest of PDF/DOCX resumes across a process
+pool and streams one JSON record per file to a JSONL output (text, sections,
+statistics, or the error). Files whose content hash already has a record in
+the output are skipped, so an interrupted or repeated run only parses what is
+new. Parsed resumes also land in the shared ResumeCache, so a later
+`ResumeParser` on the same file is a cache hit.
+
+Usage:
+    python -m src.resume_ingest data/resumes --out data/resumes.jsonl --workers 4
+    python -m src.resume_ingest manifest.csv --out data/resumes.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Optional, Set, Union
+
+import pandas as pd
+
+from .resume_parser import ResumeCache, ResumeParser, file_sha256
+
+RESUME_SUFFIXES = ('.pdf', '.docx', '.doc')
+
+
+def iter_resume_paths(source: Union[str, Path]) -> Iterator[Path]:
+    """
+    Resumes to ingest from a directory (searched recursively) or a manifest.
+
+    A manifest is a CSV with a `path` column, a JSON list of paths, or a text
+    file with one path per line ('#' starts a comment). Relative paths are
+    resolved against the manifest's directory.
+    """
+    source = Path(source)
+    if source.is_dir():
+        for path in sorted(source.rglob('*')):
+            if path.suffix.lower() in RESUME_SUFFIXES and path.is_file():
+                yield path
+        return
+
+    if source.suffix == '.csv':
+        entries = pd.read_csv(source, dtype={'path': str})['path'].dropna().tolist()
+    elif source.suffix == '.json':
+        with open(source) as f:
+            entries = json.load(f)
+    else:
+        with open(source) as f:
+            entries = [line.split('#', 1)[0].strip() for line in f]
+    for entry in entries:
+        if entry:
+            path = Path(entry)
+            yield path if path.is_absolute() else source.parent / path
+
+
+def processed_hashes(output_path: Union[str, Path]) -> Set[str]:
+    """Content hashes of the files already parsed successfully into an output JSONL."""
+    hashes = set()
+    output_path = Path(output_path)
+    if not output_path.exists():
+        return hashes
+    with open(output_path, 'rb') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn last line of an interrupted run
+            if record.get('sha256') and not record.get('error'):
+                hashes.add(record['sha256'])
+    return hashes
+
+
+def parse_resume(path: str, digest: Optional[str] = None,
+                 cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Parse one resume into an output record (the unit of work of the pool).
+
+    Args:
+        path: PDF or DOCX resume
+        digest: Content hash of the file, if already known
+        cache_dir: ResumeCache directory to read and fill, or None to always extract
+
+    Returns:
+        Dict with path, sha256, text, sections and statistics, or with
+        path, sha256 and error if the file could not be parsed
+    """
+    start = time.perf_counter()
+    record = {'path': str(path), 'sha256': digest}
+    try:
+        cache = ResumeCache.default(cache_dir) if cache_dir else None
+        record['sha256'] = digest or (cache.content_hash(path) if cache else file_sha256(path))
+        parser = ResumeParser(str(path), cache=cache or False)
+        record.update({
+            'text': parser.text,
+            'sections': parser.extract_sections(),
+            'statistics': parser.get_statistics(),
+            'error': None
+        })
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+    record['seconds'] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def ingest_resumes(paths: Iterable[Union[str, Path]], output_path: Union[str, Path],
+                   workers: int = 1, cache_dir: Optional[str] = "data/cache/resumes",
+                   skip_processed: bool = True, max_tasks_per_child: Optional[int] = 100,
+                   progress_every: int = 50) -> Dict[str, Any]:
+    """
+    Parse resumes across a process pool, appending a record per file to a JSONL file.
+
+    Records are written as they complete (not in input order). At most two
+    files per worker are in flight and each record is written out as soon as
+    it arrives, so memory stays bounded however many files there are.
+
+    Args:
+        paths: Resume files (see iter_resume_paths)
+        output_path: JSONL file to append the records to
+        workers: Worker processes (1 parses in this process)
+        cache_dir: ResumeCache directory shared by the workers, or None
+        skip_processed: Skip files whose content hash already has a successful
+            record in `output_path`, and repeats of a file within `paths`
+        max_tasks_per_child: Restart a worker after this many files, to return
+            memory held by the PDF library (Python 3.11+)
+        progress_every: Print throughput every this many files (0 to disable)
+
+    Returns:
+        Summary with files, skipped, errors, pages, seconds, files_per_sec and pages_per_sec
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    seen = processed_hashes(output_path) if skip_processed else set()
+    hasher = ResumeCache.default(cache_dir) if cache_dir else None
+    summary = {'files': 0, 'skipped': 0, 'errors': 0, 'pages': 0}
+    start = time.perf_counter()
+
+    def tasks() -> Iterator[tuple]:
+        for path in paths:
+            digest = None
+            if skip_processed:
+                try:
+                    digest = hasher.content_hash(path) if hasher else file_sha256(path)
+                except OSError:
+                    pass  # reported as the file's error by parse_resume
+                if digest in seen:
+                    summary['skipped'] += 1
+                    continue
+                if digest:
+                    seen.add(digest)
+            yield str(path), digest, cache_dir
+
+    def throughput() -> Dict[str, Any]:
+        seconds = time.perf_counter() - start
+        return {
+            **summary,
+            'seconds': round(seconds, 3),
+            'files_per_sec': round(summary['files'] / seconds, 2) if seconds else 0.0,
+            'pages_per_sec': round(summary['pages'] / seconds, 2) if seconds else 0.0
+        }
+
+    with open(output_path, 'ab+') as out:
+        # Terminate a line torn by an interrupted run before appending
+        if out.seek(0, 2):
+            out.seek(-1, 2)
+            if out.read(1) != b'\n':
+                out.write(b'\n')
+
+        def record_result(record: Dict[str, Any]):
+            out.write(json.dumps(record).encode('utf-8') + b'\n')
+            out.flush()
+            summary['files'] += 1
+            if record['error']:
+                summary['errors'] += 1
+                print(f"✗ {record['path']}: {record['error']}")
+            else:
+                # A DOCX has no pages and counts as one
+                summary['pages'] += record['statistics'].get('page_count') or 1
+            if progress_every and summary['files'] % progress_every == 0:
+                stats = throughput()
+                print(f"Parsed {stats['files']} files ({stats['files_per_sec']} files/s, "
+                      f"{stats['pages_per_sec']} pages/s)")
+
+        if workers <= 1:
+            for task in tasks():
+                record_result(parse_resume(*task))
+            return throughput()
+
+        # Spawn rather than fork: the parent may hold threads (e.g. a tracker flusher)
+        pool_options = {'max_workers': workers, 'mp_context': mp.get_context('spawn')}
+        if sys.version_info >= (3, 11):
+            pool_options['max_tasks_per_child'] = max_tasks_per_child
+        with ProcessPoolExecutor(**pool_options) as pool:
+            pending = tasks()
+            in_flight = set()
+            while True:
+                for task in pending:
+                    in_flight.add(pool.submit(parse_resume, *task))
+                    if len(in_flight) >= 2 * workers:
+                        break
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record_result(future.result())
+    return throughput()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse a batch of resumes into a JSONL file.")
+    parser.add_argument("source", help="Directory of resumes, or a manifest (CSV with a path column, JSON list, or text)")
+    parser.add_argument("--out", default="data/resumes.jsonl", help="JSONL file to append the records to")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes")
+    parser.add_argument("--cache", default="data/cache/resumes", help="Resume cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or fill the resume cache")
+    parser.add_argument("--reprocess", action="store_true", help="Parse files that already have a record")
+    args = parser.parse_args()
+
+    summary = ingest_resumes(
+        iter_resume_paths(args.source),
+        args.out,
+        workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache,
+        skip_processed=not args.reprocess
+    )
+
+    print(f"\n{'='*60}")
+    print("RESUME INGESTION SUMMARY")
+    print(f"{'='*60}")
+    print(f"Parsed: {summary['files']} ({summary['errors']} failed)")
+    print(f"Skipped (already processed): {summary['skipped']}")
+    print(f"Pages: {summary['pages']}")
+    print(f"Time: {summary['seconds']:.1f}s")
+    print(f"Throughput: {summary['files_per_sec']} files/s, {summary['pages_per_sec']} pages/s")
+    print(f"{'='*60}\n")
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,463 @@
+"""
+Storage engines for ApplicationTracker.
+
+A backend loads the application table once and then persists batches of
+mutations. Each mutation is an `(op, application_id, values)` tuple where `op`
+is 'insert' (values is the full row, replacing any existing one) or 'update'
+(values holds only the changed columns). `needs_table(pending)` tells the
+caller whether the next write will read the full in-memory table, so
+write-behind flushes only copy it when needed.
+
+Several processes may share one database. Writes happen inside `lock()`, a
+cross-process lock, and `read_external()` returns the mutations other
+processes persisted since this backend last loaded, read or wrote, so the
+caller can merge them into its in-memory table. Backends that rewrite or
+compact the whole table set MERGE_BEFORE_WRITE so the caller merges before
+every write and no other process's rows are lost.
+"""
+
+import json
+import math
+import os
+import sqlite3
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+Mutation = Tuple[str, str, Dict[str, Any]]
+
+
+@contextmanager
+def file_lock(path: Path):
+    """Hold an exclusive lock on `path` (created if missing), blocking other processes."""
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Identity of a file's current contents, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _as_inserts(rows: List[Dict[str, Any]]) -> List[Mutation]:
+    return [('insert', row['application_id'], row) for row in rows]
+
+
+def clean_value(value: Any) -> Any:
+    """Convert pandas/numpy scalars and NaN into plain Python values."""
+    if hasattr(value, 'item') and not isinstance(value, (str, bytes)):
+        try:
+            value = value.item()
+        except (ValueError, AttributeError):
+            pass
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _quote(column: str) -> str:
+    return f'"{column}"'
+
+
+def read_csv_rows(path: Path, columns: List[str]) -> List[Dict[str, Any]]:
+    """Read a tracker CSV into row dicts, filling in columns older files lack."""
+    df = pd.read_csv(path)
+    for column in columns:
+        if column not in df.columns:
+            df[column] = None
+    return df[columns].to_dict('records')
+
+
+class CSVBackend:
+    """
+    Keeps the whole table in a CSV file, rewritten on every batch.
+
+    The file is replaced atomically under a lock file, and rows other processes
+    wrote since our last read are merged in before each rewrite.
+    """
+
+    MERGE_BEFORE_WRITE = True
+
+    def __init__(self, path: Path, columns: List[str]):
+        self.path = Path(path)
+        self.columns = columns
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self._stamp = None
+
+    def lock(self):
+        return file_lock(self.lock_path)
+
+    def load(self) -> List[Dict[str, Any]]:
+        self._stamp = _file_stamp(self.path)
+        if self._stamp is None:
+            return []
+        return read_csv_rows(self.path, self.columns)
+
+    def read_external(self) -> List[Mutation]:
+        if _file_stamp(self.path) == self._stamp:
+            return []
+        return _as_inserts(self.load())
+
+    def needs_table(self, pending: int) -> bool:
+        return True
+
+    def write(self, mutations: List[Mutation], table: Dict[str, Dict[str, Any]]):
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        pd.DataFrame(list(table.values()), columns=self.columns).to_csv(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+        self._stamp = _file_stamp(self.path)
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    """
+    Keeps the table in SQLite (WAL mode) with one row per application.
+
+    Inserts and updates touch only the affected rows through the primary key,
+    so a write costs O(log n) instead of rewriting the whole table. Each batch
+    is one IMMEDIATE transaction that stamps its rows with the next value of a
+    hidden `_version` counter, which lets other processes fetch just the rows
+    that changed since they last looked.
+    """
+
+    TABLE = 'applications'
+    INDEXED_COLUMNS = ['status', 'company', 'url', '_version']
+    MERGE_BEFORE_WRITE = False
+    BUSY_TIMEOUT = 30.0
+
+    def __init__(self, path: Path, columns: List[str]):
+        self.path = Path(path)
+        self.columns = columns
+        self.version = 0
+        # Writes may be flushed from a background thread; transactions are explicit
+        self.conn = sqlite3.connect(str(self.path), timeout=self.BUSY_TIMEOUT,
+                                    check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_schema()
+
+    @contextmanager
+    def _transaction(self):
+        # IMMEDIATE takes the write lock up front, so concurrent writers queue
+        # (up to BUSY_TIMEOUT) instead of failing halfway through a batch
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+
+    def _create_schema(self):
+        other_columns = ', '.join(_quote(c) for c in self.columns if c != 'application_id')
+        with self._transaction():
+            self.conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.TABLE} '
+                f'(application_id TEXT PRIMARY KEY, {other_columns}, _version INTEGER DEFAULT 0)'
+            )
+            # Databases created by older versions may predate some columns
+            existing = {row[1] for row in self.conn.execute(f'PRAGMA table_info({self.TABLE})')}
+            for column in self.columns + ['_version']:
+                if column not in existing:
+                    self.conn.execute(f'ALTER TABLE {self.TABLE} ADD COLUMN {_quote(column)}')
+            for column in self.INDEXED_COLUMNS:
+                self.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_{column.strip("_")} '
+                    f'ON {self.TABLE}({_quote(column)})'
+                )
+
+    def lock(self):
+        # Transactions already serialize writers
+        return nullcontext()
+
+    def _select(self, where: str = '', params: Tuple = ()) -> List[Dict[str, Any]]:
+        column_list = ', '.join(_quote(c) for c in self.columns)
+        cursor = self.conn.execute(
+            f'SELECT {column_list}, _version FROM {self.TABLE} {where}', params
+        )
+        rows = []
+        for *values, version in cursor:
+            rows.append(dict(zip(self.columns, values)))
+            self.version = max(self.version, version or 0)
+        return rows
+
+    def load(self) -> List[Dict[str, Any]]:
+        return self._select('ORDER BY rowid')
+
+    def read_external(self) -> List[Mutation]:
+        return _as_inserts(self._select('WHERE _version > ? ORDER BY _version', (self.version,)))
+
+    def needs_table(self, pending: int) -> bool:
+        return False
+
+    def write(self, mutations: List[Mutation], table: Dict[str, Dict[str, Any]]):
+        with self._transaction():
+            version = self.conn.execute(
+                f'SELECT COALESCE(MAX(_version), 0) + 1 FROM {self.TABLE}'
+            ).fetchone()[0]
+            for op, application_id, values in mutations:
+                if op == 'insert':
+                    columns = [c for c in self.columns if c in values]
+                    self.conn.execute(
+                        f'INSERT OR REPLACE INTO {self.TABLE} '
+                        f'({", ".join(_quote(c) for c in columns)}, _version) '
+                        f'VALUES ({", ".join("?" for _ in columns)}, ?)',
+                        [clean_value(values[c]) for c in columns] + [version]
+                    )
+                else:
+                    columns = [c for c in values if c in self.columns and c != 'application_id']
+                    if not columns:
+                        continue
+                    self.conn.execute(
+                        f'UPDATE {self.TABLE} SET {", ".join(_quote(c) + " = ?" for c in columns)}, '
+                        f'_version = ? WHERE application_id = ?',
+                        [clean_value(values[c]) for c in columns] + [version, application_id]
+                    )
+        if self.version == version - 1:
+            # Nobody else wrote in between, so there is nothing new to read back
+            self.version = version
+
+    def close(self):
+        self.conn.close()
+
+
+class EventLogBackend:
+    """
+    Appends every mutation as a JSON line to an event log.
+
+    Writes are O(1) appends with a single fsync per batch. On load the table is
+    materialized from the latest snapshot plus the events logged after it. Once
+    the log grows past COMPACT_EVERY events it is compacted: the table is
+    written to a snapshot and the old events move to a history archive, so the
+    full per-application status history is kept.
+
+    Appends and compactions happen under a lock file. Each process remembers
+    how far it has read the log and replays only the events appended by others
+    since; a compaction by another process is noticed from the replaced
+    snapshot file and triggers a full reload.
+
+    Files (for a log at `applications.jsonl`):
+        applications.jsonl           events since the last snapshot
+        applications.snapshot.json   table as of the last compaction
+        applications.history.jsonl   archived events from earlier compactions
+        applications.jsonl.lock      lock file
+    """
+
+    COMPACT_EVERY = 1000
+    MERGE_BEFORE_WRITE = True
+
+    def __init__(self, path: Path, columns: List[str]):
+        self.path = Path(path)
+        self.columns = columns
+        self.snapshot_path = self.path.with_name(f"{self.path.stem}.snapshot.json")
+        self.history_path = self.path.with_name(f"{self.path.stem}.history.jsonl")
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        # Bytes of the log replayed so far, and the snapshot they apply to
+        self.offset = 0
+        self._snapshot_stamp = None
+        self.log_events = 0
+
+    @staticmethod
+    def _event_type(op: str, values: Dict[str, Any]) -> str:
+        if op == 'insert':
+            return 'created'
+        if values.get('status'):
+            return values['status']
+        if 'filled_fields' in values:
+            return 'filled'
+        return 'updated'
+
+    @staticmethod
+    def _parse_events(data: bytes) -> Tuple[List[Dict[str, Any]], int]:
+        """Parse complete lines; returns the events and the number of bytes consumed."""
+        consumed = data.rfind(b'\n') + 1
+        events = []
+        for line in data[:consumed].splitlines():
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                # A crash can leave a partially written line behind
+                continue
+        return events, consumed
+
+    @classmethod
+    def _read_events(cls, path: Path) -> List[Dict[str, Any]]:
+        if not path.exists():
+            return []
+        with open(path, 'rb') as f:
+            return cls._parse_events(f.read() + b'\n')[0]
+
+    def _apply(self, table: Dict[str, Dict[str, Any]], event: Dict[str, Any]):
+        if event['op'] == 'insert':
+            table[event['id']] = {c: event['values'].get(c) for c in self.columns}
+        elif event['id'] in table:
+            table[event['id']].update(event['values'])
+
+    def lock(self):
+        return file_lock(self.lock_path)
+
+    def load(self) -> List[Dict[str, Any]]:
+        with self.lock():
+            return self._load()
+
+    def _load(self) -> List[Dict[str, Any]]:
+        table: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_stamp = _file_stamp(self.snapshot_path)
+        if self._snapshot_stamp is not None:
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+            table = {row['application_id']: {c: row.get(c) for c in self.columns}
+                     for row in snapshot['rows']}
+
+        # Replaying events the snapshot already covers (left by an interrupted
+        # compaction) is harmless: they are applied in order and end in the same state
+        self.offset = 0
+        self.log_events = 0
+        for event in self._read_new_events():
+            self._apply(table, event)
+        return list(table.values())
+
+    def _read_new_events(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            events, consumed = self._parse_events(f.read())
+        self.offset += consumed
+        self.log_events += len(events)
+        return events
+
+    def read_external(self) -> List[Mutation]:
+        log_size = os.path.getsize(self.path) if self.path.exists() else 0
+        if _file_stamp(self.snapshot_path) != self._snapshot_stamp or log_size < self.offset:
+            # Another process compacted the log
+            return _as_inserts(self._load())
+        return [(e['op'], e['id'], e['values']) for e in self._read_new_events()]
+
+    def needs_table(self, pending: int) -> bool:
+        # The table is only read when this batch triggers a compaction
+        return self.log_events + pending >= self.COMPACT_EVERY
+
+    def write(self, mutations: List[Mutation], table: Dict[str, Dict[str, Any]]):
+        if not mutations:
+            return
+        lines = []
+        now = datetime.now().isoformat()
+        for op, application_id, values in mutations:
+            clean = {k: clean_value(v) for k, v in values.items()}
+            lines.append(json.dumps({
+                'ts': now,
+                'event': self._event_type(op, clean),
+                'op': op,
+                'id': application_id,
+                'values': clean
+            }) + '\n')
+
+        with open(self.path, 'ab') as log:
+            if log.tell() > 0:
+                with open(self.path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        # Terminate a torn line so the next event starts cleanly
+                        lines.insert(0, '\n')
+            log.write(''.join(lines).encode('utf-8'))
+            log.flush()
+            os.fsync(log.fileno())
+            # Callers merge other processes' events first, so the log is read up to here
+            self.offset = log.tell()
+        self.log_events += len(mutations)
+
+        if self.log_events >= self.COMPACT_EVERY:
+            self.compact(table)
+
+    def compact(self, table: Dict[str, Dict[str, Any]]):
+        """Snapshot the table, archive the logged events and truncate the log."""
+        rows = [{k: clean_value(v) for k, v in row.items()} for row in table.values()]
+        tmp_path = self.snapshot_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'rows': rows}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._snapshot_stamp = _file_stamp(self.snapshot_path)
+
+        if self.path.exists():
+            with open(self.path, 'rb') as src, open(self.history_path, 'ab') as dst:
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+            # Everything in the log is now covered by the snapshot and the archive
+            open(self.path, 'wb').close()
+        self.offset = 0
+        self.log_events = 0
+
+    def history(self, application_id: str) -> List[Dict[str, Any]]:
+        """All events recorded for an application, oldest first."""
+        events = {}
+        for event in self._read_events(self.history_path) + self._read_events(self.path):
+            if event['id'] == application_id:
+                # An interrupted compaction can archive the same events twice
+                events.setdefault(json.dumps(event, sort_keys=True), event)
+        return list(events.values())
+
+    def close(self):
+        pass
+
+
+BACKENDS = {
+    'csv': CSVBackend,
+    'sqlite': SQLiteBackend,
+    'eventlog': EventLogBackend,
+}
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+EVENTLOG_SUFFIXES = ('.jsonl',)
+
+
+def create_backend(path: Path, columns: List[str], backend: str = None):
+    """
+    Create the storage backend for a tracker database.
+
+    Args:
+        path: Database file
+        columns: Table schema
+        backend: 'csv', 'sqlite' or 'eventlog'; inferred from the file suffix if None
+    """
+    if backend is None:
+        suffix = Path(path).suffix.lower()
+        if suffix in SQLITE_SUFFIXES:
+            backend = 'sqlite'
+        elif suffix in EVENTLOG_SUFFIXES:
+            backend = 'eventlog'
+        else:
+            backend = 'csv'
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown tracker backend '{backend}'. Choose from: {', '.join(BACKENDS)}")
+    return BACKENDS[backend](path, columns)
@@ -0,0 +1,187 @@
+"""
+Columnar export and out-of-core reporting for the application history.
+
+`export_parquet` writes the tracker table as a Parquet dataset partitioned by
+submission month (`month=YYYY-MM/part-0.parquet`). The report functions scan
+that dataset batch by batch, reading only the columns they need and skipping
+month partitions outside the requested range, so multi-year histories never
+have to fit in memory at once.
+
+Requires the optional `pyarrow` package.
+"""
+
+from collections import Counter
+from typing import Dict, Any, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+    ds = None
+
+from .application_tracker import ApplicationTracker, ats_domain
+
+TEXT_COLUMNS = [
+    'application_id', 'company', 'position', 'url', 'status', 'submitted_date',
+    'last_updated', 'notes', 'resume_used', 'cover_letter_used', 'errors'
+]
+NUMERIC_COLUMNS = [c for c in ApplicationTracker.COLUMNS if c not in TEXT_COLUMNS]
+UNKNOWN_MONTH = 'unknown'
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet export requires the 'pyarrow' package (pip install pyarrow).")
+
+
+def _schema():
+    fields = [(c, pa.string()) for c in TEXT_COLUMNS]
+    fields += [(c, pa.float64()) for c in NUMERIC_COLUMNS]
+    fields += [('domain', pa.string()), ('month', pa.string())]
+    return pa.schema(fields)
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([('month', pa.string())]), flavor='hive')
+
+
+def export_parquet(df: pd.DataFrame, output_dir: str) -> str:
+    """
+    Write applications as a Parquet dataset partitioned by submission month.
+
+    Months present in `df` replace their existing partitions; other months
+    already in `output_dir` are kept.
+
+    Args:
+        df: Tracker table (ApplicationTracker.df)
+        output_dir: Dataset directory
+
+    Returns:
+        output_dir
+    """
+    _require_pyarrow()
+    data = pd.DataFrame(index=df.index)
+    for column in TEXT_COLUMNS:
+        data[column] = df[column].map(lambda v: None if pd.isna(v) else str(v))
+    for column in NUMERIC_COLUMNS:
+        data[column] = pd.to_numeric(df[column], errors='coerce')
+    # Precomputed so reports never need to read the URL column
+    data['domain'] = data['url'].map(lambda u: ats_domain(u) if u else None)
+    data['month'] = data['submitted_date'].map(lambda d: d[:7] if d else UNKNOWN_MONTH)
+
+    table = pa.Table.from_pandas(data, schema=_schema(), preserve_index=False)
+    ds.write_dataset(
+        table, output_dir, format='parquet',
+        partitioning=_partitioning(),
+        existing_data_behavior='delete_matching',
+        basename_template='part-{i}.parquet'
+    )
+    return output_dir
+
+
+def open_dataset(path: str):
+    """Open an exported Parquet dataset without reading any data."""
+    _require_pyarrow()
+    return ds.dataset(path, format='parquet', partitioning=_partitioning())
+
+
+def _month_filter(start_month: Optional[str], end_month: Optional[str]):
+    """Filter on the partition key, so whole months are skipped without being opened."""
+    _require_pyarrow()
+    condition = None
+    if start_month:
+        condition = ds.field('month') >= start_month
+    if end_month:
+        upper = ds.field('month') <= end_month
+        condition = upper if condition is None else condition & upper
+    return condition
+
+
+def _scan(path: str, columns, condition):
+    """Yield the matching rows as small DataFrames, one record batch at a time."""
+    for batch in open_dataset(path).to_batches(columns=columns, filter=condition):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+def success_rate_by_domain(path: str, start_month: Optional[str] = None,
+                           end_month: Optional[str] = None) -> pd.DataFrame:
+    """
+    Submitted and failed applications per ATS domain.
+
+    Args:
+        path: Exported Parquet dataset
+        start_month: First month to include ('YYYY-MM'), inclusive
+        end_month: Last month to include ('YYYY-MM'), inclusive
+
+    Returns:
+        DataFrame indexed by domain with applications, submitted, failed and
+        success_rate (submitted / applications) columns
+    """
+    counts: Dict[Any, Counter] = {}
+    for chunk in _scan(path, ['domain', 'status'], _month_filter(start_month, end_month)):
+        for (domain, status), n in chunk.value_counts(['domain', 'status'], dropna=False).items():
+            counts.setdefault(domain, Counter())[status] += n
+
+    report = pd.DataFrame(
+        [{'domain': domain, 'applications': sum(c.values()),
+          'submitted': c['submitted'], 'failed': c['failed']}
+         for domain, c in counts.items()],
+        columns=['domain', 'applications', 'submitted', 'failed']
+    ).set_index('domain')
+    report['success_rate'] = report['submitted'] / report['applications']
+    return report.sort_values('applications', ascending=False)
+
+
+def fill_rate_trend(path: str, start_month: Optional[str] = None,
+                    end_month: Optional[str] = None) -> pd.DataFrame:
+    """
+    Share of detected fields that were filled, per month.
+
+    Returns:
+        DataFrame indexed by month with applications, filled_fields,
+        unfilled_fields and fill_rate columns
+    """
+    columns = ['month', 'filled_fields', 'unfilled_fields']
+    totals = pd.DataFrame(columns=['applications', 'filled_fields', 'unfilled_fields'], dtype=float)
+    for chunk in _scan(path, columns, _month_filter(start_month, end_month)):
+        grouped = chunk.groupby('month').agg(
+            applications=('filled_fields', 'size'),
+            filled_fields=('filled_fields', 'sum'),
+            unfilled_fields=('unfilled_fields', 'sum')
+        )
+        totals = totals.add(grouped, fill_value=0)
+
+    totals['applications'] = totals['applications'].astype(int)
+    detected = totals['filled_fields'] + totals['unfilled_fields']
+    totals['fill_rate'] = totals['filled_fields'] / detected.where(detected > 0)
+    totals.index.name = 'month'
+    return totals.sort_index()
+
+
+def failure_reasons(path: str, start_month: Optional[str] = None,
+                    end_month: Optional[str] = None, top: int = 20) -> pd.DataFrame:
+    """
+    Most common errors of failed applications.
+
+    Only rows with status 'failed' are read; the status filter is pushed down
+    into the Parquet scan.
+
+    Returns:
+        DataFrame with reason and count columns, most common first
+    """
+    _require_pyarrow()
+    condition = ds.field('status') == 'failed'
+    months = _month_filter(start_month, end_month)
+    if months is not None:
+        condition = condition & months
+
+    reasons = Counter()
+    for chunk in _scan(path, ['errors'], condition):
+        # Error messages can be long tracebacks; group by their first line
+        first_lines = chunk['errors'].fillna('').map(lambda e: e.strip().split('\n')[0][:120])
+        reasons.update(first_lines.replace('', 'Unknown error'))
+    return pd.DataFrame(reasons.most_common(top), columns=['reason', 'count'])
@@ -0,0 +1,95 @@
+from collections import Counter
+from typing import Dict, Set, List, Tuple, Hashable
+
+
+def trigrams(text: str) -> Set[str]:
+    """All distinct 3-character substrings of `text`."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    In-memory trigram index for case-insensitive substring and fuzzy search.
+
+    Documents are short strings (company names, position titles) identified by
+    any hashable id. Substring queries intersect the posting sets of the query's
+    trigrams, starting with the rarest, and verify the few remaining candidates,
+    so results match `query.lower() in text.lower()` exactly.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Set[Hashable]] = {}
+        self.texts: Dict[Hashable, str] = {}
+        self.gram_counts: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add(self, doc_id: Hashable, text: str):
+        """Index `text` under `doc_id` (replacing whatever was indexed for it)."""
+        self.remove(doc_id)
+        if not isinstance(text, str):
+            return
+        lowered = text.lower()
+        grams = trigrams(lowered)
+        self.texts[doc_id] = lowered
+        self.gram_counts[doc_id] = len(grams)
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: Hashable):
+        """Drop `doc_id` from the index."""
+        lowered = self.texts.pop(doc_id, None)
+        if lowered is None:
+            return
+        del self.gram_counts[doc_id]
+        for gram in trigrams(lowered):
+            docs = self.postings.get(gram)
+            if docs is not None:
+                docs.discard(doc_id)
+                if not docs:
+                    del self.postings[gram]
+
+    def search(self, query: str) -> Set[Hashable]:
+        """Ids of all documents containing `query`, ignoring case."""
+        query = query.lower()
+        if len(query) < 3:
+            # Too short to have a trigram; these queries match most rows anyway
+            return {doc_id for doc_id, text in self.texts.items() if query in text}
+
+        candidates = None
+        for gram in sorted(trigrams(query), key=lambda g: len(self.postings.get(g, ()))):
+            docs = self.postings.get(gram)
+            if not docs:
+                return set()
+            candidates = set(docs) if candidates is None else candidates & docs
+            if not candidates:
+                return set()
+
+        # Every trigram matching does not guarantee they are contiguous
+        return {doc_id for doc_id in candidates if query in self.texts[doc_id]}
+
+    def fuzzy_search(self, query: str, threshold: float = 0.4,
+                     limit: int = 20) -> List[Tuple[Hashable, float]]:
+        """
+        Documents whose trigrams overlap the query's, ranked by Dice similarity.
+
+        Returns:
+            List of (doc_id, score) with score >= threshold, best first
+        """
+        query_grams = trigrams(query.lower())
+        if not query_grams:
+            return []
+
+        shared = Counter()
+        for gram in query_grams:
+            for doc_id in self.postings.get(gram, ()):
+                shared[doc_id] += 1
+
+        scored = []
+        for doc_id, count in shared.items():
+            score = 2 * count / (len(query_grams) + self.gram_counts[doc_id])
+            if score >= threshold:
+                scored.append((doc_id, score))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
@@ -150,6 +150,7 @@ def test_application_tracker():
 
         # Clean up
         Path("data/test_applications.csv").unlink(missing_ok=True)
+        tracker.backend.lock_path.unlink(missing_ok=True)
 
     except Exception as e:
         print(f"✗ ApplicationTracker test failed: {e}")
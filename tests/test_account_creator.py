@@ -0,0 +1,52 @@
+import pytest
+
+from src.account_creator import AccountCreator
+
+
+class FakeHandle:
+    def __init__(self, is_element=True):
+        self.is_element = is_element
+        self.disposed = False
+        self.value = None
+
+    def as_element(self):
+        return self if self.is_element else None
+
+    async def fill(self, value):
+        self.value = value
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class FakePage:
+    url = "https://acme.myworkdayjobs.com/login"
+
+    def __init__(self, properties):
+        self.container = FakeHandle(is_element=False)
+        self.properties = properties
+
+    def on(self, event, handler):
+        pass
+
+    async def evaluate_handle(self, script):
+        return self
+
+    async def get_properties(self):
+        return self.properties
+
+    async def dispose(self):
+        self.container.disposed = True
+
+
+@pytest.mark.asyncio
+async def test_login_disposes_every_handle_once_filled():
+    email, password, note = FakeHandle(), FakeHandle(), FakeHandle(is_element=False)
+    page = FakePage({'email': email, 'password': password, 'note': note})
+    profile = {'credentials': {'acme.myworkdayjobs.com': {'email': "ada@example.com", 'password': "pw"}}}
+
+    result = await AccountCreator(page, profile).login_with_credentials('acme.myworkdayjobs.com')
+
+    assert result['success'] and email.value == "ada@example.com" and password.value == "pw"
+    assert page.container.disposed and note.disposed
+    assert email.disposed and password.disposed
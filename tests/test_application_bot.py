@@ -0,0 +1,108 @@
+import pytest
+
+from src.application_bot import InternshipApplicationBot
+from src.application_tracker import ApplicationTracker
+from src.form_filler import FormFiller
+
+URL = "https://boards.greenhouse.io/acme/jobs/4012345"
+
+
+class FakeClassifier:
+    async def classify(self):
+        return {'type': 'application_form'}
+
+
+class FakeBrowser:
+    page = None
+    classifier = FakeClassifier()
+
+    async def navigate(self, url):
+        pass
+
+    async def wait(self, ms):
+        pass
+
+    async def screenshot(self, path):
+        pass
+
+    async def get_page_metrics(self):
+        return {}
+
+    def is_healthy(self):
+        return True
+
+    def get_rss_bytes(self):
+        return None
+
+
+class FakeProfileManager:
+    profile = {}
+
+    def snapshot(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_preview_does_not_block_a_later_submit(tmp_path, monkeypatch):
+    async def auto_fill_form(self, interactive=True):
+        return {'total_fields': 1, 'filled_count': 1, 'unfilled_count': 0,
+                'filled_fields': ['email'], 'unfilled_fields': [], 'timings': {}}
+
+    submitted = []
+
+    async def submit_application(self):
+        submitted.append(self.current_application_id)
+
+    async def ensure_browser(self):
+        pass
+
+    monkeypatch.setattr(FormFiller, "auto_fill_form", auto_fill_form)
+    monkeypatch.setattr(InternshipApplicationBot, "_submit_application", submit_application)
+    monkeypatch.setattr(InternshipApplicationBot, "_ensure_browser", ensure_browser)
+
+    tracker = ApplicationTracker(db_path=str(tmp_path / "applications.csv"))
+    bot = InternshipApplicationBot(FakeProfileManager(), tracker=tracker, interactive=False)
+    bot.browser = FakeBrowser()
+    job = [{'company': 'Acme', 'position': 'Intern', 'url': URL}]
+
+    preview = await bot.apply_to_multiple_jobs(job, submit=False, delay=0)
+    assert tracker.get_application(preview[0]['application_id'])['status'] == 'previewed'
+
+    result = await bot.apply_to_multiple_jobs(job, submit=True, delay=0)
+    assert not result[0].get('skipped') and submitted == [result[0]['application_id']]
+
+    # Now it was submitted, the posting is skipped
+    again = await bot.apply_to_multiple_jobs(job, submit=True, delay=0)
+    assert again[0]['skipped'] and again[0]['application_id'] == submitted[0]
+
+
+def test_stale_in_progress_application_does_not_block(tmp_path):
+    tracker = ApplicationTracker(db_path=str(tmp_path / "applications.csv"))
+    app_id = tracker.add_application("Acme", "Intern", URL, status='in_progress')
+
+    assert tracker.find_existing_application(URL) == app_id
+    # Left behind by a run that crashed an hour ago
+    tracker._rows[app_id]['last_updated'] = "2000-01-01T00:00:00"
+    assert tracker.find_existing_application(URL) is None
+
+
+@pytest.mark.asyncio
+async def test_failure_is_recorded_in_one_update(tmp_path, monkeypatch):
+    async def process_application(self, url, submit):
+        raise Exception("Job posting is closed")
+
+    async def ensure_browser(self):
+        pass
+
+    monkeypatch.setattr(InternshipApplicationBot, "_process_application", process_application)
+    monkeypatch.setattr(InternshipApplicationBot, "_ensure_browser", ensure_browser)
+    tracker = ApplicationTracker(db_path=str(tmp_path / "applications.jsonl"))
+    bot = InternshipApplicationBot(FakeProfileManager(), tracker=tracker, interactive=False)
+    bot.browser = FakeBrowser()
+
+    result = await bot.apply_to_job("Acme", "Intern", URL)
+
+    history = tracker.get_status_history(result['application_id'])
+    assert [event['event'] for event in history] == ['created', 'failed']
+    assert history[-1]['values']['errors'] == "Job posting is closed"
+    assert 'browser_rss_mb' in history[-1]['values']
@@ -0,0 +1,310 @@
+import multiprocessing
+import time
+import pytest
+
+from src.application_tracker import ApplicationTracker, ats_domain, canonical_job_url
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return ApplicationTracker(db_path=str(tmp_path / "applications.csv"))
+
+
+def test_ats_domain_groups_employer_subdomains():
+    assert ats_domain("https://boards.greenhouse.io/acme/jobs/123") == "greenhouse.io"
+    assert ats_domain("https://acme.wd5.myworkdayjobs.com/en-US/careers/job/1") == "myworkdayjobs.com"
+    assert ats_domain("https://www.example.com/careers") == "example.com"
+
+
+def test_performance_report_percentiles_per_domain(tracker):
+    tracker.add_application("Acme", "Intern", "https://boards.greenhouse.io/acme/jobs/1",
+                            fill_ms=100.0, navigate_ms=50.0)
+    tracker.import_application({**tracker.df.iloc[0].to_dict(),
+                                'application_id': 'second', 'fill_ms': 300.0})
+
+    report = tracker.get_performance_report(['fill_ms', 'navigate_ms'])
+
+    assert report.loc['greenhouse.io', 'applications'] == 2
+    assert report.loc['greenhouse.io', 'fill_ms_p50'] == pytest.approx(200.0)
+    assert report.loc['greenhouse.io', 'fill_ms_p95'] == pytest.approx(290.0)
+    assert report.loc['greenhouse.io', 'navigate_ms_p50'] == pytest.approx(50.0)
+
+
+def test_sqlite_backend_persists_inserts_and_updates(tmp_path):
+    db_path = str(tmp_path / "applications.db")
+    tracker = ApplicationTracker(db_path=db_path)
+    app_id = tracker.add_application("Acme", "Intern", "https://example.com/jobs/1")
+    tracker.update_application(app_id, filled_fields=7)
+    tracker.mark_submitted(app_id)
+    tracker.close()
+
+    reopened = ApplicationTracker(db_path=db_path)
+    record = reopened.get_application(app_id)
+    assert record['status'] == 'submitted'
+    assert record['filled_fields'] == 7
+    assert reopened.get_statistics()['submitted'] == 1
+    mode = reopened.backend.conn.execute('PRAGMA journal_mode').fetchone()[0]
+    assert mode == 'wal'
+    reopened.close()
+
+
+def test_csv_import_and_export_bridge(tmp_path, tracker):
+    app_id = tracker.add_application("Acme", "Intern", "https://example.com/jobs/1")
+    tracker.mark_failed(app_id, "timeout")
+
+    sqlite_tracker = ApplicationTracker(db_path=str(tmp_path / "applications.sqlite"))
+    assert sqlite_tracker.import_csv(str(tracker.db_path)) == 1
+    assert sqlite_tracker.get_application(app_id)['errors'] == "timeout"
+
+    exported = sqlite_tracker.export_report(str(tmp_path / "export.csv"))
+    roundtrip = ApplicationTracker(db_path=exported)
+    assert roundtrip.get_application(app_id)['status'] == 'failed'
+    sqlite_tracker.close()
+
+
+def test_event_log_replays_and_keeps_history_across_compaction(tmp_path):
+    db_path = str(tmp_path / "applications.jsonl")
+    tracker = ApplicationTracker(db_path=db_path)
+    app_id = tracker.add_application("Acme", "Intern", "https://example.com/jobs/1",
+                                     status='in_progress')
+    tracker.update_application(app_id, filled_fields=5, unfilled_fields=1)
+    tracker.compact()
+    tracker.mark_submitted(app_id)
+    tracker.close()
+
+    reopened = ApplicationTracker(db_path=db_path)
+    record = reopened.get_application(app_id)
+    assert record['status'] == 'submitted'
+    assert record['filled_fields'] == 5
+    events = [e['event'] for e in reopened.get_status_history(app_id)]
+    assert events == ['created', 'filled', 'submitted']
+    reopened.close()
+
+
+def test_event_log_ignores_torn_last_line(tmp_path):
+    db_path = tmp_path / "applications.jsonl"
+    tracker = ApplicationTracker(db_path=str(db_path))
+    app_id = tracker.add_application("Acme", "Intern", "https://example.com/jobs/1")
+    tracker.close()
+    with open(db_path, 'a') as f:
+        f.write('{"seq": 2, "op": "upd')
+
+    reopened = ApplicationTracker(db_path=str(db_path))
+    assert reopened.get_application(app_id)['status'] == 'pending'
+    reopened.mark_failed(app_id, "timeout")
+    reopened.close()
+
+    assert ApplicationTracker(db_path=str(db_path)).get_application(app_id)['status'] == 'failed'
+
+
+def test_write_behind_buffers_until_flush_and_close(tmp_path):
+    db_path = str(tmp_path / "applications.db")
+    tracker = ApplicationTracker(db_path=db_path, write_behind=True,
+                                 flush_interval=60, flush_every=1000)
+    app_id = tracker.add_application("Acme", "Intern", "https://example.com/jobs/1")
+    tracker.mark_submitted(app_id)
+
+    # Reads see buffered changes immediately; the database does not yet
+    assert tracker.get_application(app_id)['status'] == 'submitted'
+    assert ApplicationTracker(db_path=db_path).get_application(app_id) is None
+
+    tracker.close()
+    assert ApplicationTracker(db_path=db_path).get_application(app_id)['status'] == 'submitted'
+
+
+def test_write_behind_flushes_after_n_changes(tmp_path):
+    db_path = str(tmp_path / "applications.jsonl")
+    tracker = ApplicationTracker(db_path=db_path, write_behind=True,
+                                 flush_interval=60, flush_every=2)
+    app_id = tracker.add_application("Acme", "Intern", "https://example.com/jobs/1")
+    tracker.mark_failed(app_id, "timeout")
+
+    def persisted_status():
+        record = ApplicationTracker(db_path=db_path).get_application(app_id)
+        return record and record['status']
+
+    deadline = time.time() + 5
+    while persisted_status() != 'failed' and time.time() < deadline:
+        time.sleep(0.05)
+    assert persisted_status() == 'failed'
+    tracker.close()
+
+
+def test_incremental_statistics_match_full_recompute(tracker):
+    rows = [("Acme", "Intern", "2026-01-03T10:00:00"), ("Acme", "SWE Intern", "2026-01-01T09:00:00"),
+            ("Globex", "Intern", "2026-01-02T08:00:00")]
+    for i, (company, position, submitted) in enumerate(rows):
+        tracker.import_application({'application_id': f"app{i}", 'company': company,
+                                    'position': position, 'url': f"https://example.com/{i}",
+                                    'status': 'pending', 'submitted_date': submitted})
+    tracker.mark_submitted("app0")
+    tracker.mark_failed("app2", "timeout")
+    tracker.import_application({**tracker.get_application("app1"), 'company': "Initech"})
+
+    df = tracker.df
+    stats = tracker.get_statistics()
+    assert stats['submitted'] == 1 and stats['failed'] == 1 and stats['pending'] == 1
+    assert stats['companies_applied'] == df['company'].nunique() == 3
+    assert stats['positions_applied'] == df['position'].nunique() == 2
+    assert tracker.get_daily_counts() == {'2026-01-01': 1, '2026-01-02': 1, '2026-01-03': 1}
+
+    recent = tracker.get_recent_applications(2)
+    assert list(recent['application_id']) == ["app0", "app2"]
+
+
+def test_indexed_search_matches_substring_semantics(tracker):
+    companies = ["Acme Corp", "ACME Labs", "Globex", "Initech", "Umbrella Acmeworks"]
+    positions = ["Software Intern", "Data Science Intern", "SWE", "Research Assistant", "Intern"]
+    for i, (company, position) in enumerate(zip(companies, positions)):
+        tracker.import_application({'application_id': f"app{i}", 'company': company,
+                                    'position': position, 'url': f"https://example.com/{i}"})
+    tracker.update_application("app3", company="Initech Acme")
+
+    df = tracker.df
+    for query in ["acme", "ACME L", "intern", "sc", "x", "tech acme", "nothing"]:
+        expected = df[df['company'].str.contains(query, case=False, regex=False, na=False) |
+                      df['position'].str.contains(query, case=False, regex=False, na=False)]
+        assert list(tracker.search_applications(query)['application_id']) == \
+            list(expected['application_id'])
+
+    assert list(tracker.get_applications_by_company("acme")['application_id']) == \
+        ["app0", "app1", "app3", "app4"]
+    assert tracker.fuzzy_search_applications("Globx")['application_id'].iloc[0] == "app2"
+
+
+@pytest.mark.parametrize("first, second", [
+    ("https://boards.greenhouse.io/acme/jobs/4012345?gh_src=li&utm_source=x",
+     "https://www.acme.com/careers/?gh_jid=4012345"),
+    ("https://jobs.lever.co/acme/0b6a0f7e-1234-4abc-9def-0123456789ab/apply?lever-source=LinkedIn",
+     "https://jobs.lever.co/acme/0b6a0f7e-1234-4abc-9def-0123456789ab"),
+    ("https://acme.wd5.myworkdayjobs.com/en-US/External/job/Atlanta-GA/Intern_R-12345?source=li",
+     "https://acme.wd1.myworkdayjobs.com/External/job/Atlanta-GA/Intern_R-12345/apply"),
+    ("HTTPS://WWW.Example.com:443/careers/intern/?b=2&a=1&utm_campaign=x#apply",
+     "http://example.com/careers/intern?a=1&b=2"),
+])
+def test_canonical_job_url_matches_same_posting(first, second):
+    assert canonical_job_url(first) == canonical_job_url(second)
+
+
+def test_find_existing_application_by_canonical_url(tracker):
+    app_id = tracker.add_application("Acme", "Intern", "https://jobs.lever.co/acme/"
+                                     "0b6a0f7e-1234-4abc-9def-0123456789ab", status='in_progress')
+    repost = "https://jobs.lever.co/acme/0b6a0f7e-1234-4abc-9def-0123456789ab/apply?lever-via=x"
+
+    assert tracker.find_existing_application(repost) == app_id
+    tracker.mark_failed(app_id, "timeout")
+    assert tracker.find_existing_application(repost) is None
+    assert [a['application_id'] for a in tracker.get_applications_by_url(repost)] == [app_id]
+
+
+def test_application_ids_are_unique_and_time_ordered(tracker):
+    ids = [tracker.add_application("Acme Corp", "Intern", f"https://example.com/jobs/{i}")
+           for i in range(50)]
+
+    assert len(set(ids)) == 50 == len(tracker.df)
+    assert ids == sorted(ids)
+    assert ids[0].startswith("Acme_Corp_")
+
+
+def _terminate_self(db_path, inside_flush):
+    import os
+    import signal
+    from src import application_tracker
+    application_tracker.SIGTERM_FLUSH_TIMEOUT = 1.0
+
+    tracker = ApplicationTracker(db_path=db_path, write_behind=True,
+                                 flush_interval=60, flush_every=1000)
+    tracker.add_application("Acme", "Intern", "https://example.com/jobs/1")
+    if inside_flush:
+        # SIGTERM arrives while the main thread is inside flush()
+        with tracker._flush_lock:
+            os.kill(os.getpid(), signal.SIGTERM)
+            time.sleep(60)
+    os.kill(os.getpid(), signal.SIGTERM)
+    time.sleep(60)
+
+
+@pytest.mark.parametrize("inside_flush", [False, True])
+def test_sigterm_flushes_without_hanging(tmp_path, inside_flush):
+    db_path = str(tmp_path / "applications.jsonl")
+    process = multiprocessing.get_context('spawn').Process(
+        target=_terminate_self, args=(db_path, inside_flush))
+    process.start()
+    process.join(timeout=30)
+    assert process.exitcode == 143
+
+    if not inside_flush:
+        assert len(ApplicationTracker(db_path=db_path).df) == 1
+
+
+def _add_from_process(db_path, worker, count):
+    tracker = ApplicationTracker(db_path=db_path)
+    for i in range(count):
+        app_id = tracker.add_application("Acme", "Intern", f"https://example.com/{worker}/{i}")
+        tracker.mark_submitted(app_id)
+    tracker.close()
+
+
+@pytest.mark.parametrize("filename", ["applications.csv", "applications.db", "applications.jsonl"])
+def test_concurrent_processes_do_not_lose_rows(tmp_path, filename):
+    db_path = str(tmp_path / filename)
+    ctx = multiprocessing.get_context('spawn')
+    processes = [ctx.Process(target=_add_from_process, args=(db_path, worker, 15))
+                 for worker in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    tracker = ApplicationTracker(db_path=db_path)
+    assert len(tracker.df) == 45
+    assert tracker.get_statistics()['submitted'] == 45
+
+
+def test_refresh_picks_up_other_writers(tmp_path):
+    db_path = str(tmp_path / "applications.jsonl")
+    first = ApplicationTracker(db_path=db_path)
+    second = ApplicationTracker(db_path=db_path)
+    app_id = second.add_application("Acme", "Intern", "https://example.com/jobs/1",
+                                    status='in_progress')
+
+    assert first.find_existing_application("https://example.com/jobs/1") is None
+    assert first.refresh() == 1
+    assert first.find_existing_application("https://example.com/jobs/1") == app_id
+
+    # A compaction by one process forces the others to reload from the snapshot
+    second.mark_submitted(app_id)
+    second.compact()
+    first.refresh()
+    assert first.get_application(app_id)['status'] == 'submitted'
+
+
+def test_parquet_export_and_monthly_reports(tmp_path, tracker):
+    pytest.importorskip("pyarrow")
+    from src.tracker_reports import success_rate_by_domain, fill_rate_trend, failure_reasons
+
+    rows = [("2025-12-30T10:00:00", "https://boards.greenhouse.io/a/jobs/1", 'submitted', 8, 2, ''),
+            ("2026-01-02T10:00:00", "https://boards.greenhouse.io/b/jobs/2", 'failed', 3, 1, 'Timeout\nstack'),
+            ("2026-01-05T10:00:00", "https://jobs.lever.co/c/1", 'failed', 0, 0, 'Timeout'),
+            ("2026-01-09T10:00:00", "https://jobs.lever.co/d/2", 'submitted', 5, 5, '')]
+    for i, (submitted, url, status, filled, unfilled, errors) in enumerate(rows):
+        tracker.import_application({'application_id': f"app{i}", 'company': "Acme", 'url': url,
+                                    'status': status, 'submitted_date': submitted,
+                                    'filled_fields': filled, 'unfilled_fields': unfilled,
+                                    'errors': errors})
+
+    path = tracker.export_parquet(str(tmp_path / "parquet"))
+    assert sorted(p.name for p in (tmp_path / "parquet").iterdir()) == ["month=2025-12", "month=2026-01"]
+
+    rates = success_rate_by_domain(path)
+    assert rates.loc['greenhouse.io', 'success_rate'] == 0.5
+    assert rates.loc['lever.co', 'applications'] == 2
+    assert list(success_rate_by_domain(path, start_month="2026-01")['applications']) == [2, 1]
+
+    trend = fill_rate_trend(path)
+    assert trend.loc['2025-12', 'fill_rate'] == pytest.approx(0.8)
+    assert trend.loc['2026-01', 'fill_rate'] == pytest.approx(8 / 14)
+
+    reasons = failure_reasons(path, end_month="2026-01")
+    assert reasons.iloc[0].to_dict() == {'reason': 'Timeout', 'count': 2}
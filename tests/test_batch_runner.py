@@ -0,0 +1,24 @@
+from src.batch_runner import shard_jobs, shard_jobs_by_candidate
+
+
+def jobs_for(counts):
+    return [{'candidate_id': candidate, 'url': f"https://example.com/{candidate}/{i}"}
+            for i in range(max(counts.values())) for candidate, count in counts.items() if i < count]
+
+
+def test_each_candidates_jobs_land_on_one_worker():
+    jobs = jobs_for({'ada': 6, 'grace': 4, 'alan': 3, 'edsger': 2, 'barbara': 1})
+    shards = shard_jobs_by_candidate(jobs, 3)
+
+    owners = {}
+    for worker, shard in enumerate(shards):
+        for job in shard:
+            assert owners.setdefault(job['candidate_id'], worker) == worker
+    assert sorted(len(shard) for shard in shards) == [5, 5, 6]
+    # Round-robin sharding spreads every candidate over the workers
+    assert len({job['candidate_id'] for job in shard_jobs(jobs, 3)[0]}) > 1
+
+    # A candidate's jobs keep their order; fewer candidates than workers leave no empty shards
+    ada = [job for shard in shards for job in shard if job['candidate_id'] == 'ada']
+    assert ada == [job for job in jobs if job['candidate_id'] == 'ada']
+    assert len(shard_jobs_by_candidate(jobs_for({'ada': 3}), 4)) == 1
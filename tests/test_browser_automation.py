@@ -0,0 +1,74 @@
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from src import browser_automation
+from src.browser_automation import BrowserAutomation
+
+psutil = pytest.importorskip("psutil")
+
+
+class FakeBrowser:
+    def on(self, event, handler):
+        pass
+
+
+class FakePlaywright:
+    """Stands in for the driver: starting it spawns a child process."""
+    processes = []
+
+    async def start(self):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        self.processes.append(process)
+        await asyncio.sleep(0.05)  # let the other bot's start interleave
+        self.chromium = self
+        return self
+
+    async def launch(self, **options):
+        return FakeBrowser()
+
+
+@pytest.mark.asyncio
+async def test_rss_counts_only_the_browser_this_instance_started(monkeypatch):
+    async def open_context(self):
+        pass
+
+    monkeypatch.setattr(browser_automation, "async_playwright", FakePlaywright)
+    monkeypatch.setattr(BrowserAutomation, "_open_context", open_context)
+
+    bots = [BrowserAutomation(), BrowserAutomation()]
+    try:
+        assert bots[0].get_rss_bytes() is None
+        await asyncio.gather(*(bot.start() for bot in bots))
+
+        pids = [process.pid for process in FakePlaywright.processes]
+        assert [bot._process_pids for bot in bots] == [{pids[0]}, {pids[1]}]
+        for bot, pid in zip(bots, pids):
+            assert 0 < bot.get_rss_bytes() < 2 * psutil.Process(pid).memory_info().rss
+    finally:
+        for process in FakePlaywright.processes:
+            process.kill()
+            process.wait()
+
+
+@pytest.mark.asyncio
+async def test_bytes_transferred_counts_every_response_since_navigation():
+    class FakeCDP:
+        async def send(self, method):
+            return {'metrics': [{'name': 'Nodes', 'value': 120.0}]}
+
+    class FakePage:
+        async def goto(self, url, **options):
+            # A same-origin document and a cross-origin CDN script
+            browser._on_loading_finished({'requestId': '1', 'encodedDataLength': 5300})
+            browser._on_loading_finished({'requestId': '2', 'encodedDataLength': 48000})
+
+    browser = BrowserAutomation()
+    browser.page, browser._cdp = FakePage(), FakeCDP()
+    browser._on_loading_finished({'requestId': '0', 'encodedDataLength': 999})
+
+    await browser.navigate("https://boards.greenhouse.io/acme/jobs/1")
+    metrics = await browser.get_page_metrics()
+    assert metrics['bytes_transferred'] == 53300 and metrics['dom_nodes'] == 120
@@ -0,0 +1,86 @@
+import pytest
+from playwright.async_api import async_playwright
+
+from src import button_ranker
+from src.account_creator import AccountCreator
+from src.button_ranker import rank_buttons
+
+APPLICATION_PAGE = """
+<header><a href="/jobs/1/apply">Apply</a> <a href="/login">Sign in</a></header>
+<form id="newsletter"><input type="email" name="newsletter"><button>Subscribe</button></form>
+<form id="application">
+  <input name="first_name"><input name="last_name"><input type="email" name="email">
+  <button type="button">Upload resume</button>
+  <button type="submit">Submit Application</button>
+</form>
+"""
+
+SIGNUP_PAGE = """
+<header><a href="/login">Sign in</a> <a href="/careers">Join our team</a></header>
+<form>
+  <input type="email" name="email"><input type="password"><input type="password">
+  <button type="submit">Create Account</button>
+</form>
+<button>Sign up with Google</button>
+"""
+
+
+async def ranked_texts(html, intent):
+    playwright = await async_playwright().start()
+    try:
+        try:
+            browser = await playwright.chromium.launch()
+        except Exception as e:
+            pytest.skip(f"Chromium is not installed ({type(e).__name__})")
+        page = await browser.new_page()
+        await page.set_content(html)
+        return [candidate['text'] for candidate in await rank_buttons(page, intent)]
+    finally:
+        await playwright.stop()
+
+
+@pytest.mark.asyncio
+async def test_form_submit_ranks_above_header_links():
+    texts = await ranked_texts(APPLICATION_PAGE, 'submit')
+    # The header "Apply" link trails the form's button; "Sign in" is not a candidate
+    assert texts == ['submit application', 'apply']
+
+
+@pytest.mark.asyncio
+async def test_create_account_button_ranks_above_social_and_header_links():
+    texts = await ranked_texts(SIGNUP_PAGE, 'create_account')
+    assert texts == ['create account', 'sign up with google', 'join our team']
+
+
+class FakePage:
+    def on(self, event, handler):
+        pass
+
+
+class FakeButton:
+    def __init__(self, clickable):
+        self.clickable = clickable
+        self.clicked = False
+
+    async def click(self, timeout=None):
+        if not self.clickable:
+            raise Exception("Element is not attached to the DOM")
+        self.clicked = True
+
+
+@pytest.mark.asyncio
+async def test_create_account_click_falls_back_along_the_ranking(monkeypatch):
+    detached, covered, fallback = FakeButton(False), FakeButton(False), FakeButton(True)
+
+    async def rank(page, intent='submit', limit=10):
+        assert intent == 'create_account'
+        return [{'element': button, 'text': text, 'tag': 'button', 'score': score}
+                for button, text, score in [(detached, 'create account', 20),
+                                            (covered, 'register', 15),
+                                            (fallback, 'sign up', 12)]]
+
+    monkeypatch.setattr(button_ranker, "rank_buttons", rank)
+    creator = AccountCreator(FakePage(), profile={})
+    clicked = await creator.click_create_account_button()
+
+    assert clicked['text'] == 'sign up' and fallback.clicked
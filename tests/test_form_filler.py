@@ -0,0 +1,181 @@
+import pytest
+
+from src.form_filler import FormFiller
+
+PROFILE = {"personal_info": {"first_name": "Ada", "email": "ada@example.com"}}
+
+
+def field(purpose, name):
+    return {'purpose': purpose, 'name': name, 'label': name, 'placeholder': '', 'tag': 'input',
+            'type': 'text', 'required': False, 'selector': f'[name="{name}"]'}
+
+
+class FakePage:
+    async def wait_for_timeout(self, ms):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_fills_fields_that_appear_and_drops_questions_that_go_away(monkeypatch):
+    filler = FormFiller(FakePage(), PROFILE)
+    rounds = [
+        {'fields': {1: field('first_name', 'first'), 2: field('unknown', 'referrer_team')},
+         'removed': [], 'reset': True},
+        # Answering the first questions revealed an email field and hid the other question
+        {'fields': {3: field('email', 'email')}, 'removed': [2], 'reset': False},
+        {'fields': {}, 'removed': [], 'reset': False},
+    ]
+
+    async def changes():
+        return rounds.pop(0)
+
+    async def detect_inputs(elements):
+        return [dict(info, key=key) for key, info in elements.items()]
+
+    filled = []
+
+    async def fill_field(self, info, value):
+        filled.append((info['name'], value))
+
+    monkeypatch.setattr(filler.watcher, "changes", changes)
+    monkeypatch.setattr(filler.detector, "detect_inputs", detect_inputs)
+    monkeypatch.setattr(FormFiller, "_fill_field", fill_field)
+
+    results = await filler.auto_fill_form(interactive=False)
+
+    assert filled == [('first', 'Ada'), ('email', 'ada@example.com')]
+    assert results['filled_fields'] == ['first_name', 'email']
+    assert results['total_fields'] == 2 and results['unfilled_count'] == 0
+    assert rounds == []
+
+
+@pytest.mark.asyncio
+async def test_watcher_failing_after_first_fill_keeps_answers_without_asking_again(monkeypatch):
+    filler = FormFiller(FakePage(), PROFILE)
+    calls = []
+
+    async def changes():
+        calls.append('changes')
+        if len(calls) == 1:
+            return {'fields': {1: field('first_name', 'first'), 2: field('ask_yes_no', 'relocate')},
+                    'removed': [], 'reset': True}
+        raise Exception("Execution context was destroyed")
+
+    async def detect_inputs(elements):
+        return [dict(info, key=key) for key, info in elements.items()]
+
+    async def detect_all_inputs():
+        raise AssertionError("fell back to detecting the whole form again")
+
+    prompts = []
+
+    def prompt(self, message):
+        prompts.append(message)
+        return 'yes'
+
+    async def fill_field(self, info, value):
+        pass
+
+    monkeypatch.setattr(filler.watcher, "changes", changes)
+    monkeypatch.setattr(filler.detector, "detect_inputs", detect_inputs)
+    monkeypatch.setattr(filler.detector, "detect_all_inputs", detect_all_inputs)
+    monkeypatch.setattr(FormFiller, "_prompt", prompt)
+    monkeypatch.setattr(FormFiller, "_fill_field", fill_field)
+
+    results = await filler.auto_fill_form(interactive=True)
+
+    assert len(prompts) == 1
+    assert calls == ['changes', 'changes']
+    assert results['filled_fields'] == ['first_name']
+    assert results['total_fields'] == 2
+
+
+class FakeElement:
+    def __init__(self, attached=True):
+        self.attached = attached
+        self.value = None
+
+    async def fill(self, value, timeout=None):
+        if not self.attached:
+            raise Exception("Element is not attached to the DOM")
+        self.value = value
+
+
+@pytest.mark.asyncio
+async def test_fills_detected_element_and_requeries_only_when_detached():
+    class Page(FakePage):
+        queries = []
+
+        async def query_selector(self, selector):
+            self.queries.append(selector)
+            return rerendered
+
+    rerendered = FakeElement()
+    filler = FormFiller(Page(), PROFILE)
+
+    live = FakeElement()
+    await filler._fill_field(dict(field('first_name', 'first'), element=live, visible=True), "Ada")
+    assert live.value == "Ada" and Page.queries == []
+
+    stale = dict(field('first_name', 'first'), element=FakeElement(attached=False), visible=True)
+    await filler._fill_field(stale, "Ada")
+    assert rerendered.value == "Ada" and Page.queries == ['[name="first"]']
+    assert stale['element'] is rerendered
+
+    with pytest.raises(Exception, match="not visible"):
+        await filler._fill_field(dict(field('first_name', 'first'), element=live, visible=False), "Ada")
+
+
+@pytest.mark.asyncio
+async def test_bulk_fills_plain_text_fields_in_one_evaluate():
+    class Page(FakePage):
+        calls = []
+
+        async def evaluate(self, script, entries):
+            self.calls.append([value for _, value in entries])
+            # The phone field's input mask rewrites the value
+            return [value != "555-0100" for _, value in entries]
+
+    profile = {"personal_info": {"first_name": "Ada", "email": "ada@example.com", "phone": "555-0100"}}
+    filler = FormFiller(Page(), profile)
+    first = dict(field('first_name', 'first'), element=FakeElement(), visible=True)
+    email = dict(field('email', 'email'), element=FakeElement(), visible=True, custom_widget=True)
+    phone = dict(field('phone', 'phone'), element=FakeElement(), visible=True, type='tel')
+    for key, info in enumerate([first, email, phone]):
+        info['key'] = key
+
+    await filler._fill_fields([first, email, phone], interactive=False)
+
+    assert Page.calls == [["Ada", "555-0100"]]
+    # The custom widget and the rejected value were filled one by one
+    assert first['element'].value is None
+    assert email['element'].value == "ada@example.com" and phone['element'].value == "555-0100"
+    assert filler._results()['filled_fields'] == ['first_name', 'email', 'phone']
+
+
+@pytest.mark.asyncio
+async def test_eeoc_decline_checks_the_radio_handle_not_an_id_selector():
+    class Radio(FakeElement):
+        checked = False
+
+        async def check(self, timeout=None):
+            self.checked = True
+
+    class Handle:
+        def __init__(self, element):
+            self.element = element
+
+        def as_element(self):
+            return self.element
+
+    class Field(FakeElement):
+        async def evaluate_handle(self, script):
+            return Handle(decline)
+
+    # React/Radix ids like ':r1:' are not valid CSS selectors; FakePage has no check()
+    decline = Radio()
+    filler = FormFiller(FakePage(), PROFILE)
+    eeoc = dict(field('eeoc_decline', 'gender'), element=Field(), visible=True, id=':r1:')
+
+    outcome, entry = await filler._process_field(eeoc, interactive=False)
+    assert decline.checked and (outcome, entry) == ('skipped', 'gender (auto-declined)')
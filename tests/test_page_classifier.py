@@ -0,0 +1,67 @@
+import pytest
+
+from src.page_classifier import PageClassifier, TEXT_KEYWORDS, classify_features
+
+
+def features(matched=(), **counts):
+    return {
+        'matched': {signal: [kw for kw in keywords if kw in matched]
+                    for signal, keywords in TEXT_KEYWORDS.items()},
+        'password_fields': 0, 'email_fields': 0, 'username_fields': 0,
+        'file_inputs': 0, 'form_fields': 0, 'captcha': False,
+        **counts
+    }
+
+
+def test_classify_features():
+    def page_type(url, **kwargs):
+        return classify_features(url, features(**kwargs))['type']
+
+    assert page_type("https://x.com/careers/123", matched=['apply'], form_fields=2) == 'application_form'
+    assert page_type("https://x.com/jobs/1", file_inputs=1, form_fields=8, captcha=True) == 'application_form'
+    assert page_type("https://x.com/jobs/1", matched=['no longer accepting']) == 'closed'
+    assert page_type("https://x.com/jobs/1", captcha=True) == 'blocked'
+    assert page_type("https://x.com/account", matched=['sign up', 'sign in'],
+                     password_fields=1, email_fields=1, form_fields=2) == 'signup'
+    assert page_type("https://x.com/account", matched=['sign in'], password_fields=1, form_fields=2) == 'login'
+    assert page_type("https://x.com/signin") == 'login'
+
+    combined = classify_features("https://x.com/register", features(matched=['log in'], password_fields=1))
+    assert combined['is_signup'] and combined['is_login']
+
+
+class FakePage:
+    def __init__(self, url):
+        self.url = url
+        self.main_frame = object()
+        self.evaluations = 0
+        self.listeners = []
+
+    def on(self, event, callback):
+        assert event == 'framenavigated'
+        self.listeners.append(callback)
+
+    async def evaluate(self, script, keywords):
+        self.evaluations += 1
+        return features(password_fields=1, matched=['sign in'])
+
+    def navigate(self, url, frame=None):
+        self.url = url
+        for callback in self.listeners:
+            callback(frame or self.main_frame)
+
+
+@pytest.mark.asyncio
+async def test_classification_is_cached_until_navigation():
+    page = FakePage("https://x.com/account")
+    classifier = PageClassifier(page)
+
+    assert (await classifier.classify())['type'] == 'login'
+    await classifier.classify()
+    page.navigate(page.url, frame=object())  # an iframe navigating
+    await classifier.classify()
+    assert page.evaluations == 1
+
+    page.navigate("https://x.com/account#step2")
+    await classifier.classify()
+    assert page.evaluations == 2
@@ -0,0 +1,103 @@
+import json
+import os
+
+import pytest
+
+from src.profile_manager import ProfileManager
+
+
+@pytest.fixture
+def profile_path(tmp_path):
+    return tmp_path / "user_profile.json"
+
+
+def test_batch_coalesces_mutations_into_one_write(profile_path, monkeypatch):
+    profile = ProfileManager(str(profile_path))
+    writes = []
+    monkeypatch.setattr("src.profile_manager.atomic_write_text",
+                        lambda path, text: writes.append(text) or path.write_text(text))
+
+    with profile.batch():
+        profile.update_personal_info(first_name="Ada", last_name="Lovelace")
+        for i in range(20):
+            profile.add_experience(f"Company {i}", "Intern", "2024-01", "2024-06", "Work")
+        with profile.batch():
+            profile.add_project("Engine", "Analytical engine", ["Python"])
+
+    assert len(writes) == 1
+    saved = json.loads(profile_path.read_text())
+    assert len(saved['experience']) == 20 and saved['projects'][0]['name'] == "Engine"
+
+
+def test_batch_rolls_back_on_error(profile_path):
+    profile = ProfileManager(str(profile_path))
+    profile.update_personal_info(first_name="Ada")
+    snapshot = profile.profile
+
+    with pytest.raises(RuntimeError):
+        with profile.batch():
+            profile.add_education("MIT", "BS", "CS", 4.0, "2020", "2024")
+            raise RuntimeError("import failed")
+
+    assert profile.profile is snapshot and profile.profile['education'] == []
+    assert json.loads(profile_path.read_text())['education'] == []
+
+
+def test_unchanged_profile_is_not_rewritten(profile_path):
+    profile = ProfileManager(str(profile_path))
+    profile.update_personal_info(first_name="Ada")
+    mtime = os.stat(profile_path).st_mtime_ns
+
+    reloaded = ProfileManager(str(profile_path))
+    reloaded.update_personal_info(first_name="Ada")
+    reloaded.save_profile()
+
+    assert os.stat(profile_path).st_mtime_ns == mtime
+    assert not list(profile_path.parent.glob(".*.tmp"))
+
+
+def test_snapshot_is_versioned_by_content(profile_path):
+    profile = ProfileManager(str(profile_path))
+    profile.update_personal_info(first_name="Ada", last_name="Lovelace")
+    first = profile.snapshot()
+
+    assert profile.snapshot() is first
+    profile.update_personal_info(first_name="Ada")  # no change
+    profile.save_profile()
+    assert profile.snapshot() is first
+
+    profile.add_education("MIT", "BS", "CS", 4.0, "2020", "2024")
+    second = profile.snapshot()
+    assert second.version == first.version + 1
+    assert second.content_hash != first.content_hash
+    assert second.field_values['university'] == "MIT"
+    assert second.field_values['full_name'] == "Ada Lovelace"
+    assert "My full name is Ada Lovelace" in second.synthetic_facts
+    assert "education school: MIT" in second.facts
+    assert profile.get_profile_summary().startswith("Profile Summary:")
+
+
+def test_snapshot_is_immutable(profile_path):
+    snapshot = ProfileManager(str(profile_path)).snapshot()
+
+    with pytest.raises(TypeError):
+        snapshot.profile['personal_info']['first_name'] = "Mallory"
+    with pytest.raises(TypeError):
+        snapshot.field_values['email'] = "mallory@example.com"
+    with pytest.raises(AttributeError):
+        snapshot.version = 99
+
+
+def test_snapshot_sees_unsaved_in_place_edits(profile_path):
+    profile = ProfileManager(str(profile_path))
+    profile.update_personal_info(first_name="Ada")
+    first = profile.snapshot()
+
+    # AccountCreator stores new credentials straight into the profile dict
+    profile.profile['credentials']['boards.greenhouse.io'] = {'email': "ada@example.com"}
+    profile.profile['personal_info']['first_name'] = "Augusta"
+
+    second = profile.snapshot()
+    assert second.version == first.version + 1
+    assert second.profile['credentials']['boards.greenhouse.io']['email'] == "ada@example.com"
+    assert "Augusta" in profile.get_profile_summary()
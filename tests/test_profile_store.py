@@ -0,0 +1,55 @@
+import pytest
+
+from src.batch_runner import run_sharded
+from src.profile_store import ProfileStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProfileStore(str(tmp_path / "candidates"), capacity=2)
+    for name in ["ada", "grace", "linus"]:
+        store.create(name).update_personal_info(first_name=name.title())
+    store.close()
+    return ProfileStore(str(tmp_path / "candidates"), capacity=2)
+
+
+def test_profiles_load_lazily_and_evict_least_recently_used(store):
+    assert list(store.candidate_ids()) == ["ada", "grace", "linus"]
+    assert store.misses == 0
+
+    ada = store.snapshot("ada")
+    ada.cache['fact_embeddings'] = "expensive"
+    tracker = store.tracker("ada")
+    app_id = tracker.add_application("Acme", "Intern", "https://example.com/jobs/1")
+    assert store.snapshot("ada") is ada and store.hits == 2
+
+    store.get("grace")
+    store.get("linus")  # evicts ada, the least recently used
+
+    reloaded = store.snapshot("ada")
+    assert reloaded is not ada and 'fact_embeddings' not in reloaded.cache
+    assert reloaded.field_values['first_name'] == "Ada"
+    assert store.tracker("ada") is not tracker
+    assert store.tracker("ada").get_application(app_id)['company'] == "Acme"
+
+
+def test_invalid_and_unknown_candidates_are_rejected(store):
+    with pytest.raises(ValueError):
+        store.get("../etc")
+    with pytest.raises(ValueError):
+        store.get("nobody")
+
+
+def test_cohort_jobs_are_deduplicated_per_candidate(store):
+    url = "https://jobs.lever.co/acme/0b6a0f7e-1234-4abc-9def-0123456789ab"
+    app_id = store.tracker("ada").add_application("Acme", "Intern", url, status='submitted')
+    store.tracker("grace").add_application("Acme", "Intern", url, status='in_progress')
+    jobs = [{'candidate_id': "ada", 'company': "Acme", 'position': "Intern", 'url': url + "/apply"},
+            {'candidate_id': "grace", 'company': "Acme", 'position': "Intern", 'url': url}]
+
+    results = run_sharded(jobs, workers=2, profile_store=store)
+
+    assert [r['skipped'] for r in results] == [True, True]
+    assert results[0]['application_id'] == app_id
+    with pytest.raises(ValueError):
+        run_sharded([{**jobs[0], 'candidate_id': "nobody"}], profile_store=store)
@@ -0,0 +1,55 @@
+import json
+
+from src.resume_ingest import ingest_resumes, iter_resume_paths
+from scripts.pdf_fixtures import write_text_pdf, resume_pages
+from tests.test_resume_parser import RESUME_LINES, write_docx
+
+
+def read_records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_ingest_streams_records_and_skips_processed_files(tmp_path):
+    resumes = tmp_path / "resumes"
+    (resumes / "nested").mkdir(parents=True)
+    write_docx(resumes / "ada.docx")
+    write_text_pdf(resumes / "nested" / "grace.pdf", resume_pages(3, lines_per_page=5))
+    (resumes / "notes.txt").write_text("not a resume")
+    out = tmp_path / "resumes.jsonl"
+
+    summary = ingest_resumes(iter_resume_paths(resumes), out, cache_dir=str(tmp_path / "cache"))
+    assert (summary['files'], summary['skipped'], summary['errors'], summary['pages']) == (2, 0, 0, 4)
+    assert summary['files_per_sec'] > 0 and summary['pages_per_sec'] > 0
+
+    records = {record['path'].rsplit('/', 1)[-1]: record for record in read_records(out)}
+    assert records['ada.docx']['sections']['projects'] == "Bernoulli numbers program\n"
+    assert records['grace.pdf']['statistics']['page_count'] == 3
+
+    # A renamed copy has the same content hash and is not parsed again
+    (resumes / "ada.docx").rename(resumes / "ada_copy.docx")
+    write_docx(resumes / "alan.docx", RESUME_LINES + ["Turing machine"])
+    summary = ingest_resumes(iter_resume_paths(resumes), out, cache_dir=str(tmp_path / "cache"))
+    assert (summary['files'], summary['skipped']) == (1, 2)
+    assert len(read_records(out)) == 3
+
+
+def test_parallel_ingest_from_manifest_records_errors(tmp_path):
+    for i in range(4):
+        write_text_pdf(tmp_path / f"resume{i}.pdf", resume_pages(2, lines_per_page=5) + [[f"Candidate {i}"]])
+    (tmp_path / "broken.pdf").write_bytes(b"%PDF-1.4 truncated")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("# cohort\n" + "".join(f"resume{i}.pdf\n" for i in range(4))
+                        + "broken.pdf\nmissing.docx\n")
+    out = tmp_path / "out" / "resumes.jsonl"
+
+    summary = ingest_resumes(iter_resume_paths(manifest), out, workers=2, cache_dir=None)
+    records = read_records(out)
+
+    assert (summary['files'], summary['errors'], summary['pages']) == (6, 2, 12)
+    assert sorted(r['path'].rsplit('/', 1)[-1] for r in records if r['error']) == ["broken.pdf", "missing.docx"]
+    assert all(f"Candidate {r['path'][-5]}" in r['text'] for r in records if not r['error'])
+
+    # Failed files are retried on the next run
+    summary = ingest_resumes(iter_resume_paths(manifest), out, workers=2, cache_dir=None)
+    assert (summary['files'], summary['skipped'], summary['errors']) == (2, 4, 2)
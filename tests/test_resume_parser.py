@@ -0,0 +1,161 @@
+import os
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from src import resume_parser
+from src.resume_parser import (ResumeCache, ResumeParser, analyze_text, iter_pdf_pages,
+                               iter_pdf_pages_parallel)
+from scripts.pdf_fixtures import write_text_pdf, resume_pages
+
+RESUME_LINES = [
+    "Ada Lovelace",
+    "Education",
+    "University of London, BS Mathematics",
+    "Experience",
+    "Analyst, Babbage & Co",
+    "",
+    "Technical Skills",
+    "Python, Difference engines",
+    "Projects",
+    "Bernoulli numbers program",
+]
+
+
+def write_docx(path, lines=RESUME_LINES):
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResumeCache(str(tmp_path / "cache"))
+
+
+def test_cached_parse_matches_fresh_parse(tmp_path, cache, monkeypatch):
+    path = write_docx(tmp_path / "resume.docx")
+    fresh = ResumeParser(path, cache=False)
+    ResumeParser(path, cache=cache)
+
+    def fail(self):
+        raise AssertionError("extraction should be served from the cache")
+
+    monkeypatch.setattr(ResumeParser, "_extract_from_docx", fail)
+    cached = ResumeParser(path, cache=ResumeCache(str(tmp_path / "cache")))
+
+    assert cached.get_text() == fresh.get_text()
+    assert cached.extract_sections() == fresh.extract_sections()
+    assert cached.get_statistics() == fresh.get_statistics()
+
+
+def test_unchanged_files_are_not_rehashed(tmp_path, cache, monkeypatch):
+    path = write_docx(tmp_path / "resume.docx")
+    calls = []
+    original = resume_parser.file_sha256
+    monkeypatch.setattr(resume_parser, "file_sha256", lambda p: calls.append(p) or original(p))
+
+    first = cache.content_hash(path)
+    assert cache.content_hash(path) == first and len(calls) == 1
+
+    write_docx(tmp_path / "resume.docx", RESUME_LINES + ["Portfolio", "Notes on the engine"])
+    assert cache.content_hash(path) != first and len(calls) == 2
+
+
+def test_index_is_compacted_once_mostly_superseded(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResumeCache, "COMPACT_MIN_STALE", 5)
+    cache = ResumeCache(str(tmp_path / "cache"))
+    kept = write_docx(tmp_path / "resume.docx")
+    gone = write_docx(tmp_path / "old.docx")
+    cache.content_hash(gone)
+    # Every new mtime appends another line for the same path
+    for mtime in range(1, 9):
+        os.utime(kept, ns=(mtime * 10**9, mtime * 10**9))
+        digest = cache.content_hash(kept)
+    os.remove(gone)
+
+    reloaded = ResumeCache(str(tmp_path / "cache"))
+    assert reloaded.content_hash(kept) == digest
+    lines = reloaded.index_path.read_text().splitlines()
+    assert len(lines) == 1 and str(Path(kept).resolve()) in lines[0]
+
+
+def test_prefetch_warms_only_missing_files(tmp_path, cache):
+    paths = [write_docx(tmp_path / f"resume{i}.docx", RESUME_LINES + [f"Candidate {i}"])
+             for i in range(3)]
+
+    assert ResumeParser.prefetch(paths[:2], cache=cache) == 2
+    assert ResumeParser.prefetch(paths, cache=cache) == 1
+    assert cache.get(paths[2])['spans']['projects']
+    assert ResumeParser(paths[2], cache=cache).extract_sections()['projects'].startswith("Bernoulli")
+
+
+def test_pdf_pages_stream_in_order_serially_and_in_parallel(tmp_path):
+    path = write_text_pdf(tmp_path / "transcript.pdf", resume_pages(10, lines_per_page=5))
+
+    pages = iter_pdf_pages(path)
+    first = next(pages)
+    assert first.startswith("Education\nPage 1 item 0")
+    serial = [first] + list(pages)
+
+    assert len(serial) == 10
+    assert list(iter_pdf_pages_parallel(path, workers=2, chunk_pages=3)) == serial
+
+
+def test_lazy_parser_extracts_on_first_access(tmp_path, cache, monkeypatch):
+    path = write_text_pdf(tmp_path / "resume.pdf", resume_pages(3, lines_per_page=5))
+    calls = []
+    original = ResumeParser._extract_text
+    monkeypatch.setattr(ResumeParser, "_extract_text", lambda self: calls.append(1) or original(self))
+
+    parser = ResumeParser(path, cache=cache, lazy=True, workers=2)
+    assert calls == []
+    assert parser.get_text().count("Page 3 item") == 4
+    assert parser.get_statistics()['page_count'] == 3
+    assert calls == [1]
+
+
+def reference_sections(text):
+    """The original line-by-line section splitter."""
+    sections = {"education": "", "experience": "", "skills": "", "projects": ""}
+    current_section = None
+    for line in text.split('\n'):
+        line_lower = line.lower().strip()
+        if any(keyword in line_lower for keyword in ['education', 'academic']):
+            current_section = 'education'
+        elif any(keyword in line_lower for keyword in ['experience', 'employment', 'work history']):
+            current_section = 'experience'
+        elif any(keyword in line_lower for keyword in ['skills', 'technical skills', 'competencies']):
+            current_section = 'skills'
+        elif any(keyword in line_lower for keyword in ['projects', 'portfolio']):
+            current_section = 'projects'
+        elif current_section and line.strip():
+            sections[current_section] += line + '\n'
+    return sections
+
+
+@pytest.mark.parametrize("text", [
+    "\n".join(RESUME_LINES),
+    "Intro line\n\nEDUCATION & Work History\n  BS Math  \n\n\nTeam projects lead\nPortfolio site\n",
+    "Skills\n\t\nPython\r\nSQL\nAcademic Projects\nThesis\n",
+    "  \nİSTANBUL\nExperience\nİzmir office\nſkills\nGo\n",
+    "",
+    "\n\n",
+])
+def test_single_pass_layout_matches_original_splitter(text):
+    layout = analyze_text(text)
+
+    assert layout.sections() == reference_sections(text)
+    assert layout.statistics == {
+        "character_count": len(text),
+        "word_count": len(text.split()),
+        "line_count": len(text.split('\n')),
+    }
+    assert [text[start:] for start in layout.line_starts()] == \
+        ['\n'.join(text.split('\n')[i:]) for i in range(len(text.split('\n')))]
+    for spans in layout.spans.values():
+        for start, end in spans:
+            assert text[start:end].strip()